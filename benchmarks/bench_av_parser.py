@@ -0,0 +1,111 @@
+"""
+Alpha Vantage parser benchmark.
+
+Builds synthetic `outputsize=full` payloads (20 years of daily bars and a
+full month of 1-minute extended-hours bars), then times decoding and
+parsing a one-month window with the previous dict-of-dicts DataFrame path
+and with the typed parser, for JSON and CSV. Exits 1 when the outputs differ.
+
+    python benchmarks/bench_av_parser.py [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable
+import numpy as np
+import pandas as pd
+from stonkzilla.data_sources import av_parser
+
+
+def payload(index: pd.DatetimeIndex, fmt: str, seed: int = 0) -> dict[str, dict[str, str]]:
+    """Time series mapping as Alpha Vantage sends it, newest bar first."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, len(index)))
+    volume = rng.integers(1_000, 1_000_000, len(index))
+    series = {}
+    for stamp, c, v in zip(index[::-1].strftime(fmt), close[::-1], volume[::-1]):
+        series[stamp] = {
+            "1. open": f"{c - 0.1:.4f}",
+            "2. high": f"{c + 0.5:.4f}",
+            "3. low": f"{c - 0.5:.4f}",
+            "4. close": f"{c:.4f}",
+            "5. volume": str(v),
+        }
+    return series
+
+
+def to_csv(series: dict[str, dict[str, str]]) -> str:
+    lines = ["timestamp,open,high,low,close,volume"]
+    lines += [",".join([stamp, *bar.values()]) for stamp, bar in series.items()]
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse(text: str, key: str, start: str, end: str) -> pd.DataFrame:
+    """The parsing previously done in AlphavantageSource.fetch_data."""
+    df = pd.DataFrame.from_dict(json.loads(text)[key], orient="index")
+    df.columns = [col.split(". ")[1] if ". " in col else col for col in df.columns]
+    df.rename(columns=str.capitalize, inplace=True)
+    for col in ["Open", "High", "Low", "Close", "Volume"]:
+        df[col] = pd.to_numeric(df[col])
+    df.index = pd.to_datetime(df.index)
+    df.sort_index(inplace=True)
+    df = df[df.index >= pd.to_datetime(start)]
+    return df[df.index <= pd.to_datetime(end)]
+
+
+def best_of(func: Callable[[], pd.DataFrame], repeat: int) -> tuple[pd.DataFrame, float]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    opts = parser.parse_args()
+    print(f"orjson: {'yes' if av_parser.orjson is not None else 'no (json module)'}")
+
+    daily = pd.bdate_range("2005-01-03", "2024-12-31")
+    minutes = pd.date_range("2024-11-01 04:00", "2024-11-30 19:59", freq="min")
+    minutes = minutes[(minutes.dayofweek < 5) & (minutes.hour >= 4) & (minutes.hour < 20)]
+    cases = [
+        ("20y daily", daily, "%Y-%m-%d", "Time Series (Daily)", "2024-06-01", "2024-06-30"),
+        ("1min full month", minutes, "%Y-%m-%d %H:%M:%S", "Time Series (1min)", "2024-11-18", "2024-11-22"),
+    ]
+
+    failed = False
+    for label, index, fmt, key, start, end in cases:
+        series = payload(index, fmt)
+        text = json.dumps({"Meta Data": {}, key: series})
+        csv = to_csv(series)
+        print(f"\n{label}: {len(series):,} bars, json {len(text) / 2**20:.1f} MiB, "
+              f"csv {len(csv) / 2**20:.1f} MiB, window {start}..{end}")
+
+        expected, legacy = best_of(lambda: legacy_parse(text, key, start, end), opts.repeat)
+        runs = {
+            "typed json": lambda: av_parser.parse_json_series(
+                av_parser.loads(text)[key], start, end
+            ),
+            "typed csv": lambda: av_parser.parse_csv(csv, start, end),
+        }
+        print(f"  {'dict-of-dicts (before)':24s}{legacy * 1000:9.1f} ms")
+        for name, run in runs.items():
+            result, elapsed = best_of(run, opts.repeat)
+            try:
+                pd.testing.assert_frame_equal(
+                    result, expected, check_freq=False, check_names=False
+                )
+            except AssertionError as e:
+                failed = True
+                print(f"FAIL: {name} differs from the previous parser: {e}")
+            print(f"  {name:24s}{elapsed * 1000:9.1f} ms  {legacy / elapsed:5.1f}x")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Cold-start import benchmark for the stonkzilla CLI.
+
+Runs `python -X importtime -m stonkzilla.main --help` in fresh interpreters,
+reports the slowest imports and fails (exit code 1) when the cumulative
+import time of stonkzilla.main exceeds the budget, or when a heavy module
+that --help must not need gets imported.
+
+    python benchmarks/bench_import_time.py [--budget-ms 250] [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that must stay out of the --help path.
+FORBIDDEN = (
+    "matplotlib",
+    "matplotlib.pyplot",
+    "pandas",
+    "numpy",
+    "yfinance",
+    "requests",
+    "pydantic",
+    "yaml",
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Map module name to cumulative import time in microseconds."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def measure(args: list[str]) -> dict[str, int]:
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    opts = parser.parse_args()
+
+    runs = [measure(["-m", "stonkzilla.main", "--help"]) for _ in range(opts.runs)]
+    # Sum of top-level imports, interpreter startup (site, encodings) included.
+    totals = [sum(t for m, t in run.items() if "." not in m) for run in runs]
+    median_ms = statistics.median(totals) / 1000
+
+    last = runs[-1]
+    print(f"stonkzilla --help import time: {median_ms:.1f} ms (median of {opts.runs})")
+    print("slowest imports (cumulative):")
+    for name, us in sorted(last.items(), key=lambda kv: kv[1], reverse=True)[: opts.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    loaded = [m for m in FORBIDDEN if m in last]
+    if loaded:
+        print(f"FAIL: --help imports heavy modules: {', '.join(loaded)}")
+        failed = True
+    if median_ms > opts.budget_ms:
+        print(f"FAIL: import time {median_ms:.1f} ms exceeds budget {opts.budget_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
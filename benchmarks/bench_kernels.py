@@ -0,0 +1,131 @@
+"""
+Kernel benchmark for the recursive indicator backends.
+
+Times EMA, Wilder smoothing, true range, directional movement and OBV on a
+long synthetic series for every available backend, then the full ADX and
+MACD through the engine. Parity with pandas is checked by tests/test_kernels.py.
+
+    python benchmarks/bench_kernels.py [--bars 1000000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stonkzilla.cli.services import build_indicators
+from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+from stonkzilla.indicators import kernels
+from stonkzilla.indicators.engine import IndicatorEngine
+
+def random_walk(bars: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.05, bars))
+    spread = rng.random(bars) * 0.1
+    return pd.DataFrame(
+        {
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100, 10_000, bars).astype(np.float64),
+        },
+        index=pd.date_range("2000-01-03", periods=bars, freq="min"),
+    )
+
+
+def timed(func: Callable[[], object], repeat: int) -> tuple[object, float]:
+    """Return the result and the best wall time of repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def pandas_reference(data: pd.DataFrame) -> dict[str, Callable[[], np.ndarray]]:
+    high, low, close, volume = (data[c] for c in ("High", "Low", "Close", "Volume"))
+
+    def true_range():
+        prev_close = close.shift(1)
+        tr = np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+        tr.iloc[0] = high.iloc[0] - low.iloc[0]
+        return tr.to_numpy()
+
+    def plus_dm():
+        up, down = high.diff(), low.diff()
+        return np.where((up > down) & (up > 0), up, 0.0)
+
+    def obv():
+        return (np.sign(close.diff()).fillna(0) * volume).cumsum().to_numpy()
+
+    return {
+        "ema(26)": lambda: close.ewm(span=26, adjust=False).mean().to_numpy(),
+        "wilder(14)": lambda: close.ewm(alpha=1 / 14, adjust=False).mean().to_numpy(),
+        "true_range": true_range,
+        "plus_dm": plus_dm,
+        "obv": obv,
+    }
+
+
+def kernel_calls(data: pd.DataFrame, backend: str) -> dict[str, Callable[[], np.ndarray]]:
+    high, low, close, volume = (
+        data[c].to_numpy(dtype=np.float64) for c in ("High", "Low", "Close", "Volume")
+    )
+    return {
+        "ema(26)": lambda: kernels.ewm_mean(backend, close, 2 / 27),
+        "wilder(14)": lambda: kernels.ewm_mean(backend, close, 1 / 14),
+        "true_range": lambda: kernels.run_kernel(backend, "true_range", high, low, close),
+        "plus_dm": lambda: kernels.run_kernel(backend, "plus_dm", high, low),
+        "obv": lambda: kernels.run_kernel(backend, "obv", close, volume),
+    }
+
+
+def engine_call(data: pd.DataFrame, backend: str, spec: tuple) -> Callable[[], np.ndarray]:
+    frame = OHLCVFrame.from_pandas(data)
+    (_, _, indicator), = build_indicators([spec], "Close")
+    return lambda: np.asarray(IndicatorEngine(frame, backend).run([indicator])[0], float)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    opts = parser.parse_args()
+
+    data = random_walk(opts.bars)
+    backends = ["numpy"] + (["numba"] if kernels.numba is not None else [])
+    print(f"{opts.bars:,} bars; backends: pandas, {', '.join(backends)}")
+    if kernels.numba is None:
+        print("(numba not installed, skipping the numba backend)")
+
+    cases: dict[str, dict[str, Callable[[], np.ndarray]]] = {"pandas": pandas_reference(data)}
+    for backend in backends:
+        cases[backend] = kernel_calls(data, backend)
+        if backend == "numba":
+            for call in cases[backend].values():
+                call()  # compile before timing
+    for spec in (("ADX", [14]), ("MACD", [12, 26, 9])):
+        label = f"engine {spec[0]}"
+        for backend in cases:
+            cases[backend][label] = engine_call(data, backend, spec)
+
+    print(f"{'':16s}" + "".join(f"{b:>12s}" for b in cases))
+    for name, reference in cases["pandas"].items():
+        _, base = timed(reference, opts.repeat)
+        row = f"{name:16s}{base * 1000:10.1f}ms"
+        for backend in backends:
+            _, elapsed = timed(cases[backend][name], opts.repeat)
+            row += f"{elapsed * 1000:10.1f}ms"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
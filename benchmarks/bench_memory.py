@@ -0,0 +1,103 @@
+"""
+Memory benchmark: indicators over a multi-year 1-minute dataset.
+
+Compares peak allocations (tracemalloc, which also tracks numpy buffers)
+of calculating every indicator on the DataFrame one by one, as before,
+against the fused engine over an OHLCVFrame of zero-copy column views.
+
+    python benchmarks/bench_memory.py [--years 5]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable
+import numpy as np
+import pandas as pd
+from stonkzilla.cli.services import build_indicators
+from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+from stonkzilla.indicators.engine import IndicatorEngine
+
+INDICATORS = [
+    ("EMA", [12]),
+    ("EMA", [26]),
+    ("SMA", [20]),
+    ("RSI", [14]),
+    ("MACD", [12, 26, 9]),
+    ("BBANDS", [20, 2]),
+    ("OBV", []),
+    ("ADX", [14]),
+]
+# Regular US session: 390 one-minute bars per trading day.
+BARS_PER_DAY = 390
+TRADING_DAYS = 252
+
+
+def minute_bars(years: float, seed: int = 0) -> pd.DataFrame:
+    """Synthetic random-walk OHLCV data on a 1-minute session calendar."""
+    days = pd.bdate_range("2015-01-02", periods=int(years * TRADING_DAYS))
+    minutes = pd.timedelta_range("09:30:00", periods=BARS_PER_DAY, freq="min")
+    index = (days.values[:, None] + minutes.values[None, :]).ravel()
+    n = len(index)
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.05, n))
+    spread = rng.random(n) * 0.1
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.02, n),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100, 10_000, n),
+        },
+        index=pd.DatetimeIndex(index, name="Datetime"),
+    )
+
+
+def measure(func: Callable[[], object]) -> tuple[float, float]:
+    """Return (peak MiB allocated while running func, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 2**20, elapsed
+
+
+def run_dataframe(data: pd.DataFrame) -> list:
+    return [ind.calculate(data) for _, _, ind in build_indicators(INDICATORS, "Close")]
+
+
+def run_frame(data: pd.DataFrame) -> list:
+    frame = OHLCVFrame.from_pandas(data)
+    instances = [ind for _, _, ind in build_indicators(INDICATORS, "Close")]
+    return IndicatorEngine(frame).run(instances)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=float, default=5.0)
+    opts = parser.parse_args()
+
+    data = minute_bars(opts.years)
+    frame = OHLCVFrame.from_pandas(data)
+    print(f"{len(data):,} one-minute bars over {opts.years:g} years")
+    print(f"  DataFrame:  {data.memory_usage(deep=True).sum() / 2**20:8.1f} MiB")
+    print(f"  OHLCVFrame: {frame.nbytes / 2**20:8.1f} MiB")
+
+    for label, func in (
+        ("DataFrame, per-indicator calculate()", run_dataframe),
+        ("OHLCVFrame, fused engine", run_frame),
+    ):
+        peak, elapsed = measure(lambda: func(data))
+        print(f"{label:40s} peak {peak:8.1f} MiB  {elapsed:6.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""
+Benchmark suite for the hot paths: indicators, Alpha Vantage parsing,
+multi-ticker alignment and figure rendering.
+
+Every case runs on synthetic bars at each of the selected sizes (1k, 100k,
+5m) and reports the best and median of --repeat runs. Alpha Vantage
+payloads are recorded to benchmarks/fixtures on first use and read back
+on later runs, so every commit parses the same bytes; any other *.json
+or *.csv response saved there is parsed too. Results are written to
+benchmarks/results/<commit>.json, and --compare prints the ratios against
+an earlier results file, exiting 1 when a case got slower than --threshold.
+
+    python benchmarks/suite.py [--sizes 1k,100k,5m] [--filter render]
+        [--repeat 3] [--compare benchmarks/results/<commit>.json]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import synthetic
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR = os.path.join(ROOT, "fixtures")
+RESULTS_DIR = os.path.join(ROOT, "results")
+
+# (name, params) of every indicator class, as the CLI builds them.
+INDICATORS = [
+    ("SMA", [20]),
+    ("EMA", [20]),
+    ("RSI", [14]),
+    ("MACD", [12, 26, 9]),
+    ("BBANDS", [20, 2]),
+    ("OBV", []),
+    ("ADX", [14]),
+    ("FIBO", [0.236, 0.382, 0.5, 0.618]),
+]
+
+
+@dataclass
+class Case:
+    """A benchmark: setup(bars) prepares the input and returns the timed call."""
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    max_bars: Optional[int] = None
+    # Fixed-size input (a recorded response): run once, not per size.
+    fixed: bool = False
+
+
+def indicator_case(name: str, params: list) -> Callable[[int], Callable[[], object]]:
+    def setup(bars: int) -> Callable[[], object]:
+        from stonkzilla.cli.services import build_indicator
+
+        data = synthetic.ohlcv(bars)
+        indicator = build_indicator(name, params, "Close")
+        return lambda: indicator.calculate(data)
+
+    return setup
+
+
+def engine_case(backend: str) -> Callable[[int], Callable[[], object]]:
+    def setup(bars: int) -> Callable[[], object]:
+        from stonkzilla.cli.services import build_indicators
+        from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+        from stonkzilla.indicators.engine import IndicatorEngine
+
+        frame = OHLCVFrame.from_pandas(synthetic.ohlcv(bars))
+        built = [ind for _, _, ind in build_indicators(INDICATORS, "Close")]
+        return lambda: IndicatorEngine(frame, backend).run(built)
+
+    return setup
+
+
+def _fixture(bars: int, ext: str) -> str:
+    """Recorded synthetic response of the given size, created on first use."""
+    label = next((k for k, v in synthetic.SIZES.items() if v == bars), str(bars))
+    path = os.path.join(FIXTURES_DIR, f"synthetic_av_{label}.{ext}")
+    if not os.path.exists(path):
+        os.makedirs(FIXTURES_DIR, exist_ok=True)
+        data = synthetic.ohlcv(bars)
+        if ext == "json":
+            body = json.dumps(synthetic.av_response(data))
+        else:
+            body = synthetic.av_csv(data)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+    return path
+
+
+def av_case(ext: str, path: Optional[str] = None) -> Callable[[int], Callable[[], object]]:
+    """Decode and parse an Alpha Vantage response, as AlphavantageSource does."""
+
+    def setup(bars: int) -> Callable[[], object]:
+        from stonkzilla.data_sources.alphavantage import AlphavantageSource
+        from stonkzilla.data_sources.av_parser import loads
+
+        source = AlphavantageSource("benchmark")
+        with open(path or _fixture(bars, ext), "rb") as f:
+            content = f.read()
+        if ext == "csv":
+            text = content.decode()
+            return lambda: source._parse(text, "", None, None)
+
+        def parse():
+            data = loads(content)
+            key = next(k for k in data if k.startswith("Time Series"))
+            return source._parse(data, key, None, None)
+
+        return parse
+
+    return setup
+
+
+def align_case(bars: int) -> Callable[[], object]:
+    from stonkzilla.plots.multi_plotter import MultiTickerPlotter
+
+    frames = synthetic.multi_ticker(bars)
+    return lambda: MultiTickerPlotter.align_dataframes(frames, "Close")
+
+
+def decimate_case(bars: int) -> Callable[[], object]:
+    """Min/max decimation of a full OHLCV frame to a 12 in, 300 dpi figure."""
+    from stonkzilla.plots.decimate import decimate
+
+    data = synthetic.ohlcv(bars)
+    return lambda: decimate(data, 7200)
+
+
+def render_case(style: str, decimate: bool = True) -> Callable[[int], Callable[[], object]]:
+    """Build, lay out and savefig a chart with an overlay and an RSI panel."""
+
+    def setup(bars: int) -> Callable[[], object]:
+        from stonkzilla.cli.services import run_indicators
+        from stonkzilla.plots.candlestick_plotter import CandlestickPlotter
+        from stonkzilla.plots.plotter import Plotter
+
+        data = synthetic.ohlcv(bars)
+        indicators = run_indicators(data, [("SMA", [20]), ("RSI", [14])], "Close")
+        if style == "candlestick":
+            plotter = CandlestickPlotter(title="benchmark")
+        else:
+            plotter = Plotter(title="benchmark", decimate=decimate)
+        out_dir = tempfile.mkdtemp(prefix="stonkzilla-bench-")
+
+        def render():
+            # save_plot reports every file it writes; keep the table readable.
+            with contextlib.redirect_stdout(io.StringIO()):
+                render_plot()
+
+        def render_plot():
+            plotter.plot(
+                data,
+                indicators,
+                "Close",
+                "SYN",
+                save=True,
+                save_dir=out_dir,
+                save_dpi=100,
+                interval="1m",
+                start_date="2000-01-03",
+                end_date="2000-01-04",
+            )
+
+        return render
+
+    return setup
+
+
+def cases() -> list[Case]:
+    found = [
+        Case(f"indicator/{name}", indicator_case(name, params))
+        for name, params in INDICATORS
+    ]
+    found += [Case(f"engine/{backend}", engine_case(backend)) for backend in ("pandas", "numpy")]
+    # Building multi-GB payloads for 5m bars says little about parsing speed.
+    found += [
+        Case(f"av_parse/{ext}", av_case(ext), max_bars=100_000) for ext in ("json", "csv")
+    ]
+    if os.path.isdir(FIXTURES_DIR):
+        for filename in sorted(os.listdir(FIXTURES_DIR)):
+            stem, ext = os.path.splitext(filename)
+            if stem.startswith("synthetic_") or ext not in (".json", ".csv"):
+                continue
+            path = os.path.join(FIXTURES_DIR, filename)
+            found.append(Case(f"av_parse/{stem}", av_case(ext[1:], path), fixed=True))
+    found.append(Case("align_dataframes", align_case))
+    found.append(Case("decimate", decimate_case))
+    found.append(Case("render/line", render_case("line")))
+    # Drawing every point of millions of bars takes minutes.
+    found.append(
+        Case("render/line_full", render_case("line", decimate=False), max_bars=100_000)
+    )
+    found.append(Case("render/candlestick", render_case("candlestick"), max_bars=100_000))
+    return found
+
+
+def measure(func: Callable[[], object], repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def compare(results: dict, baseline_path: str, threshold: float) -> bool:
+    """Print ratios against a baseline; True when a case regressed past threshold."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nvs {baseline['commit']} ({baseline_path}):")
+    regressed = False
+    for key, result in results["cases"].items():
+        before = baseline["cases"].get(key)
+        if before is None:
+            continue
+        ratio = result["best"] / before["best"]
+        flag = ""
+        if ratio > threshold:
+            regressed, flag = True, "  SLOWER"
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"  {key:40s}{before['best'] * 1000:11.2f}{result['best'] * 1000:11.2f} ms"
+              f"{ratio:7.2f}x{flag}")
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=",".join(synthetic.SIZES),
+                        help="Comma-separated sizes from " + ", ".join(synthetic.SIZES))
+    parser.add_argument("--filter", default=None, help="Only run cases matching this regex")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Slowdown ratio counted as a regression (default: 1.2)")
+    opts = parser.parse_args()
+
+    unknown = [s for s in opts.sizes.split(",") if s not in synthetic.SIZES]
+    if unknown:
+        parser.error(f"unknown sizes {unknown}, choose from {list(synthetic.SIZES)}")
+    if opts.compare and not os.path.exists(opts.compare):
+        parser.error(f"no results file at {opts.compare}")
+    sizes = [(label, synthetic.SIZES[label]) for label in opts.sizes.split(",")]
+    selected = [c for c in cases() if not opts.filter or re.search(opts.filter, c.name)]
+
+    results = {
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "repeat": opts.repeat,
+        "cases": {},
+    }
+    print(f"{'case':40s}{'best ms':>11s}{'median ms':>11s}{'ns/bar':>9s}")
+    for case in selected:
+        runs = [("recorded", 0)] if case.fixed else sizes
+        for label, bars in runs:
+            if case.max_bars is not None and bars > case.max_bars:
+                continue
+            func = case.setup(bars)
+            times = measure(func, opts.repeat)
+            best, median = min(times), statistics.median(times)
+            key = f"{case.name}[{label}]"
+            results["cases"][key] = {
+                "bars": bars,
+                "best": best,
+                "median": median,
+                "times": times,
+            }
+            per_bar = f"{best / bars * 1e9:9.1f}" if bars else f"{'-':>9s}"
+            print(f"{key:40s}{best * 1000:11.2f}{median * 1000:11.2f}{per_bar}")
+            del func
+
+    output = opts.output or os.path.join(RESULTS_DIR, f"{results['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if opts.compare and compare(results, opts.compare, opts.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
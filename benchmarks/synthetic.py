@@ -0,0 +1,88 @@
+"""
+Synthetic market data for the benchmarks.
+
+Prices are a seeded random walk, so every run and every commit times the
+same input. Sizes are given as bar counts; the suite uses SIZES.
+"""
+
+import numpy as np
+import pandas as pd
+
+SIZES = {"1k": 1_000, "100k": 100_000, "5m": 5_000_000}
+
+TIME_SERIES_KEY = "Time Series (1min)"
+
+
+def ohlcv(bars: int, seed: int = 0, freq: str = "min") -> pd.DataFrame:
+    """OHLCV frame of `bars` consecutive bars, oldest first."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.05, bars))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = rng.random(bars) * 0.2
+    index = pd.date_range("2000-01-03", periods=bars, freq=freq, name="Datetime")
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + spread,
+            "Low": np.minimum(open_, close) - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, bars).astype(np.float64),
+        },
+        index=index,
+    )
+
+
+def multi_ticker(bars: int, tickers: int = 10, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """
+    Frames for several tickers whose date ranges overlap only partly and
+    which each miss a few random bars, as the multi-ticker plot sees them.
+    """
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for i in range(tickers):
+        data = ohlcv(bars, seed=seed + i).iloc[i * max(bars // 100, 1) :]
+        keep = rng.random(len(data)) > 0.01
+        frames[f"T{i:02d}"] = data[keep]
+    return frames
+
+
+def av_payload(data: pd.DataFrame) -> dict[str, dict[str, str]]:
+    """The frame as an Alpha Vantage time series mapping, newest bar first."""
+    stamps = data.index[::-1].strftime("%Y-%m-%d %H:%M:%S")
+    columns = [
+        data[name].to_numpy()[::-1] for name in ("Open", "High", "Low", "Close")
+    ]
+    volume = data["Volume"].to_numpy()[::-1].astype(np.int64)
+    series = {}
+    for stamp, o, h, low, c, v in zip(stamps, *columns, volume):
+        series[stamp] = {
+            "1. open": f"{o:.4f}",
+            "2. high": f"{h:.4f}",
+            "3. low": f"{low:.4f}",
+            "4. close": f"{c:.4f}",
+            "5. volume": str(v),
+        }
+    return series
+
+
+def av_response(data: pd.DataFrame) -> dict[str, dict]:
+    """A full TIME_SERIES_INTRADAY response body for the frame."""
+    return {
+        "Meta Data": {
+            "1. Information": "Intraday (1min) open, high, low, close prices and volume",
+            "2. Symbol": "SYN",
+            "3. Last Refreshed": str(data.index[-1]),
+            "4. Interval": "1min",
+            "5. Output Size": "Full size",
+            "6. Time Zone": "US/Eastern",
+        },
+        TIME_SERIES_KEY: av_payload(data),
+    }
+
+
+def av_csv(data: pd.DataFrame) -> str:
+    """The same bars as a datatype=csv response."""
+    series = av_payload(data)
+    lines = ["timestamp,open,high,low,close,volume"]
+    lines += [",".join([stamp, *bar.values()]) for stamp, bar in series.items()]
+    return "\n".join(lines) + "\n"
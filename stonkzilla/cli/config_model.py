@@ -1,17 +1,23 @@
 "Config model and validation module."
 
-import time
 from datetime import date, datetime
-from typing import List, Tuple, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
-import yfinance as yf
+from typing import List, Literal, Tuple, Optional, Dict, Any, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from stonkzilla.data_sources.symbol_registry import SymbolRegistry
 
 
 PROMPT_MESSAGES = {
     "tickers": "Enter tickers (comma-separated, e.g., AAPL, MSFT, TSLA):\n",
     "start_date": "Enter start date (YYYY-MM-DD):\n",
     "end_date": "Enter end date (YYYY-MM-DD):\n",
-    "interval": "Enter a valid interval (e.g., 1d, 5m, 1h, 1wk, 1mo):\n",
+    "interval": "Enter a valid interval, or several comma-separated (e.g., 1d, 5m, 1h, 1wk, 1mo):\n",
     "indicators": "Enter indicators (e.g., EMA:14, SMA:50, RSI:14):\n",
     "data_source": "Enter data source (yfinance/alphavantage):\n",
     "api_key": "Enter API key (if using alphavantage):\n",
@@ -47,6 +53,7 @@ valid_intervals = {
     "3mo",
 }
 intraday_intervals = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+valid_engines = ("pandas", "numpy", "numba")
 
 
 def _is_positive_float(s: str) -> bool:
@@ -74,34 +81,30 @@ supported_indicators = {
 }
 
 
-def validate_tickers(tickers_str: str) -> list[str]:
-    """Validate tickers by pinging yfinance for ticker info."""
+def parse_tickers(tickers_str: str) -> list[str]:
+    """Split a comma-separated ticker string into upper-case symbols."""
     if not tickers_str:
         raise ValueError("No tickers provided.")
 
     tickers = [t.strip().upper() for t in tickers_str.split(",") if t.strip()]
     if not tickers:
         raise ValueError("No tickers provided.")
-    invalid = []
-    for ticker in tickers:
-        try:
-            info = yf.Ticker(ticker).info
-            time.sleep(0.1)
-            if "regularMarketPrice" not in info or info["regularMarketPrice"] is None:
-                invalid.append(ticker)
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "404" in error_msg or "not found" in error_msg:
-                invalid.append(ticker)
-                print(f"Ticker: {ticker} does not exist.")
-            elif "Rate" in error_msg or "limited" in error_msg:
-                print(
-                    error_msg
-                    + "\nTry updating the yfinance package, it could be a bug that happens when the package is out of date."
-                )
-            else:
-                print(f"[DEBUG] Unexpected error for '{ticker}: {e}")
-                invalid.append(ticker)
+    return tickers
+
+
+def validate_tickers(tickers_str: str) -> list[str]:
+    """
+    Validate tickers against the local symbol registry, pinging yfinance
+    only for unknown or stale entries.
+    """
+    tickers = parse_tickers(tickers_str)
+    verdicts = SymbolRegistry().validate(tickers)
+    invalid = [ticker for ticker in tickers if verdicts.get(ticker) is False]
+    unverified = [ticker for ticker in tickers if verdicts.get(ticker) is None]
+    if unverified:
+        print(
+            f"Could not validate {', '.join(unverified)} (network unavailable or rate limited), continuing."
+        )
     if invalid:
         raise ValueError(f"Invalid or inactive tickers: {', '.join(invalid)}")
 
@@ -189,11 +192,16 @@ class Indicator(BaseModel):
 
 
 class ConfigModel(BaseModel):
+    # Declared before tickers so the tickers validator can read it.
+    skip_validation: bool = Field(
+        False, description="Trust the configured tickers without validating them"
+    )
     tickers: List[str] = Field(..., description="List of stock tickers to fetch")
     start_date: date = Field(..., description="Start date in YYYY-MM-DD format")
     end_date: date = Field(..., description="End date in YYYY-MM-DD format")
-    interval: str = Field(
-        "1d", description="Data interval, e.g., 1d, 5m, 1h, 1wk, etc."
+    interval: Union[str, List[str]] = Field(
+        "1d",
+        description="Data interval, e.g., 1d, 5m, 1h, 1wk, etc., or a list of them",
     )
     indicators: List[Indicator] = Field(
         default_factory=list,
@@ -203,7 +211,20 @@ class ConfigModel(BaseModel):
     api_key: Optional[str] = Field(
         None, description="API key for the data source (Alphavantage) if chosen."
     )
+    av_datatype: Literal["json", "csv"] = Field(
+        "json", description="Response format requested from Alphavantage"
+    )
     column: str = Field("Close", description="Data column to calculate indicators on")
+    max_workers: int = Field(
+        4, ge=1, description="Maximum number of tickers fetched concurrently"
+    )
+    cache: bool = Field(True, description="Use the on-disk OHLCV cache")
+    cache_dir: Optional[str] = Field(
+        None, description="Directory of the OHLCV cache (default: user cache dir)"
+    )
+    resample: bool = Field(
+        True, description="Derive intervals from finer cached data instead of fetching"
+    )
     plot_style: str = Field(
         "line", description="Plot style, e.g. 'line' or 'candlestick'"
     )
@@ -222,17 +243,60 @@ class ConfigModel(BaseModel):
     log_scale: bool = Field(
         False, description="Use logarithmic scale in multi-plot mode"
     )
+    decimate: bool = Field(
+        True, description="Thin long line series to the figure's resolution"
+    )
+    max_points: Optional[int] = Field(
+        None, ge=2, description="Points per plotted line (default: from figure width)"
+    )
     save: bool = Field(False, description="Save plots to files instead of showing")
     save_dir: Optional[str] = Field(None, description="Directory to save plot files")
     save_format: str = Field(
         "png", description="Format of saved plot files, e.g. 'png'"
     )
     save_dpi: Optional[int] = Field(None, description="DPI for saved raster plots")
+    export: Optional[Literal["parquet", "arrow", "csv", "feather"]] = Field(
+        None, description="Export data and indicators in this file format"
+    )
+    export_dir: Optional[str] = Field(None, description="Directory for exported files")
+    export_layout: Literal["per-ticker", "dataset"] = Field(
+        "per-ticker", description="One file per ticker or a partitioned dataset"
+    )
+    plot: bool = Field(True, description="Render plots; disable to only export")
+    render_workers: int = Field(
+        1, ge=1, description="Worker processes rendering saved single-ticker plots"
+    )
+    engine: str = Field(
+        "pandas", description="Indicator backend: pandas, numpy or numba"
+    )
+    shared_rate_limit: bool = Field(
+        False, description="Coordinate rate limits across processes via SQLite"
+    )
+    indicator_cache_mb: int = Field(
+        64, ge=0, description="Memory cap of the indicator result cache in MiB"
+    )
+    indicator_cache_disk: bool = Field(
+        False, description="Keep indicator results on disk between runs"
+    )
+    profile: bool = Field(False, description="Print a timing report after the run")
+    profile_json: Optional[str] = Field(
+        None, description="Write timing spans and stats to this JSON file"
+    )
+    profile_trace: Optional[str] = Field(
+        None, description="Write timing spans as a Chrome trace to this file"
+    )
+    cprofile: Optional[str] = Field(
+        None, description="Run under cProfile and dump the stats to this file"
+    )
 
     @field_validator("tickers", mode="before")
-    def validate_tickers_input(cls, v: str | List[str]) -> List[str]:
+    def validate_tickers_input(
+        cls, v: str | List[str], info: ValidationInfo
+    ) -> List[str]:
         if isinstance(v, list):
             v = ",".join(v)
+        if info.data.get("skip_validation"):
+            return parse_tickers(v)
         return validate_tickers(v)
 
     @model_validator(mode="before")
@@ -262,8 +326,22 @@ class ConfigModel(BaseModel):
 
     @field_validator("interval")
     def validate_intervals(cls, v, info):
-        if v not in valid_intervals:
-            raise ValueError(f"Invalid interval: {v}. Must be one of {valid_intervals}")
+        values = v.split(",") if isinstance(v, str) else v
+        values = list(dict.fromkeys(i.strip() for i in values if i.strip()))
+        if not values:
+            raise ValueError("At least one interval is required")
+        for interval in values:
+            if interval not in valid_intervals:
+                raise ValueError(
+                    f"Invalid interval: {interval}. Must be one of {valid_intervals}"
+                )
+        # A single interval stays a plain string, as everything downstream expects.
+        return values[0] if len(values) == 1 else values
+
+    @field_validator("engine")
+    def validate_engine(cls, v: str) -> str:
+        if v not in valid_engines:
+            raise ValueError(f"Invalid engine: {v}. Must be one of {valid_engines}")
         return v
 
     @field_validator("indicators", mode="after")
@@ -13,6 +13,10 @@ class DataSourceError(MarketIndicatorError):
     """Raised for data source errors."""
 
 
+class NoDataError(DataSourceError):
+    """Raised when a source answers but has no bars in the requested range."""
+
+
 class IndicatorError(MarketIndicatorError):
     """Raised for indicator calculation errors."""
 
@@ -21,6 +25,10 @@ class PlotError(MarketIndicatorError):
     """Raised for plotting errors."""
 
 
+class ExportError(MarketIndicatorError):
+    """Raised for data export errors."""
+
+
 class ValidationError(MarketIndicatorError):
     """Raised for validation errors."""
 
@@ -0,0 +1,189 @@
+"""
+Export of price data and computed indicators to columnar files.
+
+Each ticker's OHLCV frame is joined with its indicator results, one column
+per indicator output, and written in chunks of CHUNK_ROWS rows so only one
+chunk is ever converted at a time. Files are either one per ticker or laid
+out as a dataset partitioned by interval and ticker.
+"""
+
+import importlib.util
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, Iterator
+import pandas as pd
+from stonkzilla.cli.exceptions import ExportError
+from stonkzilla.cli.profiling import profiler
+
+logger = logging.getLogger("market-indicator-cli")
+
+EXPORT_FORMATS = ("parquet", "arrow", "csv", "feather")
+EXPORT_LAYOUTS = ("per-ticker", "dataset")
+# Rows converted and written per chunk / parquet row group.
+CHUNK_ROWS = 100_000
+
+
+def indicator_columns(
+    indicators: dict[str, tuple[pd.DataFrame | pd.Series, Any]],
+) -> dict[str, pd.Series]:
+    """Flatten indicator results into named columns, '<key>_<field>' for multi-output ones."""
+    columns = {}
+    for key, (result, _) in indicators.items():
+        if isinstance(result, pd.DataFrame):
+            for field in result.columns:
+                columns[f"{key}_{field}"] = result[field]
+        else:
+            columns[key] = result
+    return columns
+
+
+def export_frame(
+    data: pd.DataFrame, indicators: dict[str, tuple[pd.DataFrame | pd.Series, Any]]
+) -> pd.DataFrame:
+    """OHLCV data with every indicator output as an extra column."""
+    columns = {name: values for name, values in data.items()}
+    columns.update(indicator_columns(indicators))
+    frame = pd.DataFrame(columns, index=data.index)
+    frame.index.name = data.index.name or "Datetime"
+    return frame
+
+
+def _chunks(frame: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield frame.iloc[start : start + chunk_rows].reset_index()
+
+
+def _write_csv(frame: pd.DataFrame, path: str, chunk_rows: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for i, chunk in enumerate(_chunks(frame, chunk_rows)):
+            chunk.to_csv(f, header=i == 0, index=False)
+
+
+def _write_arrow(frame: pd.DataFrame, path: str, fmt: str, chunk_rows: int) -> None:
+    import pyarrow as pa
+
+    writer = schema = None
+    try:
+        for chunk in _chunks(frame, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False, schema=schema)
+            if writer is None:
+                schema = table.schema
+                if fmt == "parquet":
+                    import pyarrow.parquet as pq
+
+                    writer = pq.ParquetWriter(path, schema)
+                else:
+                    # Feather v2 is the Arrow IPC file format.
+                    writer = pa.ipc.new_file(path, schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+class Exporter:
+    """Writes one ticker at a time in the configured format and layout."""
+
+    def __init__(
+        self,
+        fmt: str,
+        export_dir: str,
+        layout: str = "per-ticker",
+        chunk_rows: int = CHUNK_ROWS,
+    ) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ExportError(f"Unsupported export format: {fmt}")
+        if layout not in EXPORT_LAYOUTS:
+            raise ExportError(f"Unsupported export layout: {layout}")
+        if fmt != "csv" and importlib.util.find_spec("pyarrow") is None:
+            raise ExportError(f"Exporting {fmt} requires pyarrow (pip install pyarrow)")
+        self.fmt = fmt
+        self.export_dir = export_dir
+        self.layout = layout
+        self.chunk_rows = chunk_rows
+
+    def path(
+        self,
+        ticker: str,
+        interval: str,
+        start_date: str | date = "",
+        end_date: str | date = "",
+    ) -> str:
+        safe_ticker = ticker.replace(os.sep, "_").replace("/", "_")
+        if self.layout == "dataset":
+            directory = os.path.join(
+                self.export_dir, f"interval={interval}", f"ticker={safe_ticker}"
+            )
+            return os.path.join(directory, f"part-0.{self.fmt}")
+
+        def _fmt(d):
+            if isinstance(d, (date, datetime)):
+                return d.strftime("%Y%m%d")
+            return str(d).replace("-", "")
+
+        parts = [safe_ticker, interval, _fmt(start_date), _fmt(end_date)]
+        filename = "_".join(p for p in parts if p) + f".{self.fmt}"
+        return os.path.join(self.export_dir, filename)
+
+    def write(
+        self,
+        ticker: str,
+        data: pd.DataFrame,
+        indicators: dict[str, tuple[pd.DataFrame | pd.Series, Any]],
+        interval: str,
+        start_date: str | date = "",
+        end_date: str | date = "",
+    ) -> str:
+        """Write a ticker's data and indicators; returns the file path."""
+        path = self.path(ticker, interval, start_date, end_date)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with profiler.span("export", ticker=ticker):
+            frame = export_frame(data, indicators)
+            try:
+                if self.fmt == "csv":
+                    _write_csv(frame, tmp_path, self.chunk_rows)
+                else:
+                    _write_arrow(frame, tmp_path, self.fmt, self.chunk_rows)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise ExportError(f"Could not export {ticker} to {path}: {e}") from e
+        print(f"Exported {ticker} to: {os.path.abspath(path)}")
+        return path
+
+
+def export_all(
+    all_data: dict[str, pd.DataFrame], config: dict[str, Any], result_cache=None
+) -> dict[str, str]:
+    """Calculate indicators per ticker and export them; returns {ticker: path}."""
+    from stonkzilla.cli.services import run_indicators
+
+    exporter = Exporter(
+        config["export"],
+        config.get("export_dir") or "exports",
+        config.get("export_layout") or "per-ticker",
+    )
+    paths = {}
+    for ticker, data in all_data.items():
+        if data.empty:
+            continue
+        indicators = run_indicators(
+            data,
+            config["indicators"],
+            config["column"],
+            engine=config.get("engine", "pandas"),
+            result_cache=result_cache,
+            scope=(ticker, config["data_source"], config["interval"]),
+        )
+        paths[ticker] = exporter.write(
+            ticker,
+            data,
+            indicators,
+            config["interval"],
+            config["start_date"],
+            config["end_date"],
+        )
+    return paths
@@ -16,6 +16,14 @@ def tickers_option(f: Callable[P, R]) -> Callable[P, R]:
     )(f)
 
 
+def skip_validation_option(f: Callable[P, R]) -> Callable[P, R]:
+    return click.option(
+        "--skip-validation",
+        is_flag=True,
+        help="Trust the tickers as given, without checking them against yfinance.",
+    )(f)
+
+
 def date_range_options(f: Callable[P, R]) -> Callable[P, R]:
     """Date range options."""
     f = click.option(
@@ -31,7 +39,7 @@ def interval_option(f: Callable[P, R]) -> Callable[P, R]:
     return click.option(
         "--interval",
         default=None,
-        help="""Interval in which data is downloaded. 
+        help="""Interval in which data is downloaded, or several comma-separated ones (e.g. 1h,1d,1wk) to produce each in one run. 
 Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo Intraday data cannot extend last 60 days.""",
     )(f)
 
@@ -55,9 +63,67 @@ def data_source_option(f: Callable[P, R]) -> Callable[P, R]:
 
 
 def api_key_option(f: Callable[P, R]) -> Callable[P, R]:
-    return click.option(
+    f = click.option(
         "--api-key", default=None, help="API key for AlphaVantage data source"
     )(f)
+    f = click.option(
+        "--av-datatype",
+        default="json",
+        type=click.Choice(["json", "csv"]),
+        help="Response format requested from AlphaVantage (default: json)",
+    )(f)
+    return f
+
+
+def max_workers_option(f: Callable[P, R]) -> Callable[P, R]:
+    return click.option(
+        "--max-workers",
+        default=4,
+        type=click.IntRange(min=1),
+        help="Maximum number of tickers fetched concurrently (default: 4)",
+    )(f)
+
+
+def cache_options(f: Callable[P, R]) -> Callable[P, R]:
+    """On-disk OHLCV cache options."""
+    f = click.option(
+        "--cache/--no-cache",
+        default=True,
+        help="Reuse previously downloaded data and fetch only missing ranges (default: on)",
+    )(f)
+    f = click.option(
+        "--cache-dir", default=None, help="Directory for the OHLCV cache"
+    )(f)
+    f = click.option(
+        "--resample/--no-resample",
+        default=True,
+        help="Build bars from a finer interval already in the cache instead of fetching (default: on)",
+    )(f)
+    return f
+
+
+def shared_rate_limit_option(f: Callable[P, R]) -> Callable[P, R]:
+    return click.option(
+        "--shared-rate-limit",
+        is_flag=True,
+        help="Share data source rate limits with other stonkzilla processes on this host.",
+    )(f)
+
+
+def indicator_cache_options(f: Callable[P, R]) -> Callable[P, R]:
+    """Indicator result cache options."""
+    f = click.option(
+        "--indicator-cache-mb",
+        default=64,
+        type=click.IntRange(min=0),
+        help="Memory for reusing indicator results within a run, 0 disables (default: 64)",
+    )(f)
+    f = click.option(
+        "--indicator-cache-disk",
+        is_flag=True,
+        help="Also keep indicator results in the cache directory between runs.",
+    )(f)
+    return f
 
 
 def column_option(f: Callable[P, R]) -> Callable[P, R]:
@@ -140,16 +206,113 @@ def save_options(f: Callable[P, R]) -> Callable[P, R]:
     return f
 
 
+def decimate_options(f: Callable[P, R]) -> Callable[P, R]:
+    """Thinning of long line series to what the figure can show."""
+    f = click.option(
+        "--decimate/--no-decimate",
+        default=True,
+        help="Keep only each pixel column's min and max of long line series (default: on)",
+    )(f)
+    f = click.option(
+        "--max-points",
+        default=None,
+        type=click.IntRange(min=2),
+        help="Points per plotted line (default: twice the figure width in pixels)",
+    )(f)
+    return f
+
+
+def export_options(f: Callable[P, R]) -> Callable[P, R]:
+    """Export of data and indicators to files, and skipping the plots."""
+    f = click.option(
+        "--export",
+        default=None,
+        type=click.Choice(["parquet", "arrow", "csv", "feather"]),
+        help="Write OHLCV data and computed indicators to files in this format",
+    )(f)
+    f = click.option(
+        "--export-dir", default=None, help="Directory for exported files (default: ./exports)"
+    )(f)
+    f = click.option(
+        "--export-layout",
+        default="per-ticker",
+        type=click.Choice(["per-ticker", "dataset"]),
+        help="One file per ticker, or a dataset partitioned by interval and ticker",
+    )(f)
+    f = click.option(
+        "--plot/--no-plot",
+        default=True,
+        help="Render plots (default: on); use --no-plot with --export",
+    )(f)
+    return f
+
+
+def render_workers_option(f: Callable[P, R]) -> Callable[P, R]:
+    return click.option(
+        "--render-workers",
+        default=1,
+        type=click.IntRange(min=1),
+        help="Render saved single-ticker plots on N worker processes (default: 1)",
+    )(f)
+
+
+def engine_option(f: Callable[P, R]) -> Callable[P, R]:
+    return click.option(
+        "--engine",
+        default="pandas",
+        type=click.Choice(["pandas", "numpy", "numba"]),
+        help="Backend for recursive indicators like EMA and ADX (default: pandas)",
+    )(f)
+
+
+def profile_options(f: Callable[P, R]) -> Callable[P, R]:
+    """Timing report, trace and cProfile output of a run."""
+    f = click.option(
+        "--profile",
+        is_flag=True,
+        help="Print per-phase and per-ticker timings after the run",
+    )(f)
+    f = click.option(
+        "--profile-json",
+        default=None,
+        type=click.Path(dir_okay=False),
+        help="Write timing spans and stats to this JSON file",
+    )(f)
+    f = click.option(
+        "--profile-trace",
+        default=None,
+        type=click.Path(dir_okay=False),
+        help="Write a Chrome trace (chrome://tracing, Perfetto) to this file",
+    )(f)
+    f = click.option(
+        "--cprofile",
+        default=None,
+        type=click.Path(dir_okay=False),
+        help="Run under cProfile and dump the stats to this file",
+    )(f)
+    return f
+
+
 def common_options(f):
     """Options wrapper"""
     f = tickers_option(f)
+    f = skip_validation_option(f)
     f = date_range_options(f)
     f = interval_option(f)
     f = indicator_option(f)
     f = data_source_option(f)
     f = api_key_option(f)
+    f = max_workers_option(f)
+    f = shared_rate_limit_option(f)
+    f = cache_options(f)
+    f = indicator_cache_options(f)
     f = column_option(f)
     f = plot_options(f)
     f = multi_plot_options(f)
     f = save_options(f)
+    f = decimate_options(f)
+    f = export_options(f)
+    f = render_workers_option(f)
+    f = engine_option(f)
+    f = profile_options(f)
     return f
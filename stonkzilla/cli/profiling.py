@@ -0,0 +1,175 @@
+"""
+Lightweight timing spans for profiling a run.
+
+Code marks phases with `profiler.span(name, **tags)`; while profiling is
+off that returns a shared no-op context, so the instrumentation stays in
+place at no cost. Spans inherit the tags of the spans they are nested in
+(so an indicator span inside a ticker's span is attributed to the ticker)
+and are collected from all threads. The collected spans can be printed as
+a table, written as JSON or as a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, ContextManager, Iterator
+
+# Top-level phases shown per ticker in the report.
+PHASES = ("fetch", "indicators", "export", "plot")
+
+_NULL = nullcontext()
+_tags: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar(
+    "profiling_tags", default={}
+)
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    duration: float
+    thread: int
+    tags: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """Collects spans while enabled; thread-safe."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        """Start collecting, discarding earlier spans."""
+        with self._lock:
+            self.spans = []
+            self._origin = time.perf_counter()
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def span(self, name: str, **tags: Any) -> ContextManager[None]:
+        """Time the enclosed block as a span named name."""
+        if not self.enabled:
+            return _NULL
+        return self._span(name, tags)
+
+    @contextmanager
+    def _span(self, name: str, tags: dict[str, Any]) -> Iterator[None]:
+        merged = {**_tags.get(), **tags}
+        token = _tags.set(merged)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _tags.reset(token)
+            span = Span(
+                name, start - self._origin, end - start, threading.get_ident(), merged
+            )
+            with self._lock:
+                self.spans.append(span)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Count, total, mean and max seconds per span name."""
+        grouped: dict[str, list[float]] = defaultdict(list)
+        for span in self.spans:
+            grouped[span.name].append(span.duration)
+        return {
+            name: {
+                "count": len(durations),
+                "total": sum(durations),
+                "mean": sum(durations) / len(durations),
+                "max": max(durations),
+            }
+            for name, durations in grouped.items()
+        }
+
+    def per_ticker(self) -> dict[str, dict[str, float]]:
+        """
+        Seconds spent per ticker in each top-level phase. Spans covering a
+        batch ("AAPL,MSFT") are split evenly between its tickers.
+        """
+        totals: dict[str, dict[str, float]] = defaultdict(lambda: dict.fromkeys(PHASES, 0.0))
+        for span in self.spans:
+            ticker = span.tags.get("ticker")
+            if ticker and span.name in PHASES:
+                tickers = ticker.split(",")
+                for name in tickers:
+                    totals[name][span.name] += span.duration / len(tickers)
+        return dict(totals)
+
+    def wall_time(self) -> float:
+        if not self.spans:
+            return 0.0
+        return max(s.start + s.duration for s in self.spans) - min(
+            s.start for s in self.spans
+        )
+
+    def report(self) -> str:
+        """Aggregate and per-ticker tables as text."""
+        wall = self.wall_time()
+        lines = [
+            f"Profile ({wall:.2f} s wall)",
+            f"{'span':24s}{'count':>7s}{'total s':>10s}{'mean ms':>10s}{'max ms':>10s}{'share':>8s}",
+        ]
+        stats = sorted(self.stats().items(), key=lambda kv: kv[1]["total"], reverse=True)
+        for name, s in stats:
+            share = 100 * s["total"] / wall if wall else 0.0
+            lines.append(
+                f"{name:24s}{s['count']:7d}{s['total']:10.3f}"
+                f"{s['mean'] * 1000:10.1f}{s['max'] * 1000:10.1f}{share:7.0f}%"
+            )
+        tickers = self.per_ticker()
+        if tickers:
+            lines.append("")
+            lines.append(f"{'ticker':24s}" + "".join(f"{p:>12s}" for p in PHASES))
+            for ticker, phases in sorted(tickers.items()):
+                lines.append(
+                    f"{ticker[:24]:24s}" + "".join(f"{phases[p]:12.3f}" for p in PHASES)
+                )
+        return "\n".join(lines)
+
+    def write_json(self, path: str) -> None:
+        """Write spans plus aggregate and per-ticker stats as JSON."""
+        payload = {
+            "wall_time": self.wall_time(),
+            "stats": self.stats(),
+            "per_ticker": self.per_ticker(),
+            "spans": [asdict(span) for span in self.spans],
+        }
+        _write(path, payload)
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write spans in the Chrome trace event format."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread,
+                "args": {k: str(v) for k, v in span.tags.items()},
+            }
+            for span in self.spans
+        ]
+        _write(path, {"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def _write(path: str, payload: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, default=str)
+
+
+profiler = Profiler()
@@ -0,0 +1,218 @@
+"""
+Parallel headless rendering of single-ticker plots.
+
+Each ticker's price columns are sent to a worker process as plain numpy
+arrays; the worker calculates the indicators, builds the figure on the Agg
+backend and saves it. Progress and errors are reported back to the parent.
+"""
+
+import contextlib
+import importlib
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Optional
+import pandas as pd
+from stonkzilla.cli.exceptions import PlotError
+
+logger = logging.getLogger("market-indicator-cli")
+
+# Columns any indicator or plot style may read.
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def pack_frame(data: pd.DataFrame, column: str) -> dict[str, Any]:
+    """Reduce a price frame to its index and the needed columns as numpy arrays."""
+    needed = [c for c in dict.fromkeys((*PRICE_COLUMNS, column)) if c in data.columns]
+    return {
+        "index": data.index.to_numpy(),
+        "index_name": data.index.name,
+        "columns": {c: data[c].to_numpy() for c in needed},
+    }
+
+
+def unpack_frame(payload: dict[str, Any]) -> pd.DataFrame:
+    index = pd.Index(payload["index"], name=payload["index_name"])
+    return pd.DataFrame(payload["columns"], index=index)
+
+
+def _init_worker() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_one(
+    ticker: str, payload: dict[str, Any], config: dict[str, Any]
+) -> Optional[str]:
+    """Worker entry point; returns None on success or an error message."""
+    from stonkzilla.cli.services import create_result_cache, plot_data, run_indicators
+
+    try:
+        data = unpack_frame(payload)
+        # Workers only share results through the disk tier of the cache.
+        result_cache = None
+        if config.get("indicator_cache_disk") and config.get("indicator_cache_mb"):
+            result_cache = create_result_cache(
+                config["indicator_cache_mb"], True, config.get("cache_dir")
+            )
+        indicators = run_indicators(
+            data,
+            config["indicators"],
+            config["column"],
+            engine=config.get("engine") or "pandas",
+            result_cache=result_cache,
+            scope=(ticker, config["data_source"], config["interval"]),
+        )
+        plot_data(
+            data,
+            indicators,
+            config["column"],
+            ticker,
+            plot_style=config.get("plot_style"),
+            color_scheme=config.get("color_scheme"),
+            up_color=config.get("up_color"),
+            down_color=config.get("down_color"),
+            save=True,
+            save_dir=config.get("save_dir"),
+            save_format=config.get("save_format", "png"),
+            save_dpi=config.get("save_dpi"),
+            interval=config["interval"],
+            start_date=config["start_date"],
+            end_date=config["end_date"],
+            decimate=config.get("decimate", True),
+            max_points=config.get("max_points"),
+        )
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def warm_up() -> None:
+    """Import the plotting stack ahead of the first job."""
+    for module in ("stonkzilla.plots.plotter", "stonkzilla.plots.candlestick_plotter"):
+        importlib.import_module(module)
+
+
+def render_image(
+    ticker: str,
+    payload: dict[str, Any],
+    indicators: dict[str, tuple[pd.DataFrame | pd.Series, Any]],
+    config: dict[str, Any],
+) -> bytes:
+    """
+    Worker entry point for one chart with precomputed indicators; returns
+    the encoded image in config["save_format"].
+    """
+    from stonkzilla.cli.services import plot_data
+
+    data = unpack_frame(payload)
+    with tempfile.TemporaryDirectory(prefix="stonkzilla-") as tmp:
+        # save_plot reports the temporary file, which is of no use here.
+        with contextlib.redirect_stdout(io.StringIO()):
+            plot_data(
+                data,
+                indicators,
+                config["column"],
+                ticker,
+                plot_style=config.get("plot_style"),
+                color_scheme=config.get("color_scheme"),
+                up_color=config.get("up_color"),
+                down_color=config.get("down_color"),
+                save=True,
+                save_dir=tmp,
+                save_format=config.get("save_format", "png"),
+                save_dpi=config.get("save_dpi") or 100,
+                interval=config["interval"],
+                start_date=config["start_date"],
+                end_date=config["end_date"],
+                decimate=config.get("decimate", True),
+                max_points=config.get("max_points"),
+            )
+        (filename,) = os.listdir(tmp)
+        with open(os.path.join(tmp, filename), "rb") as f:
+            return f.read()
+
+
+def new_render_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool of headless render workers."""
+    # spawn: workers must not inherit the parent's fetch threads or GUI backend.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def render_parallel(
+    all_data: dict[str, pd.DataFrame],
+    config: dict[str, Any],
+    workers: int,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> dict[str, str]:
+    """
+    Render and save one plot per ticker on a pool of worker processes,
+    a new one unless an open pool is passed in. Returns {ticker: error} for
+    the plots that failed; raises PlotError if none could be rendered.
+    """
+    jobs = {ticker: data for ticker, data in all_data.items() if not data.empty}
+    for ticker in all_data.keys() - jobs.keys():
+        print(f"No data found for {ticker}. Skipping...")
+    if not jobs:
+        return {}
+
+    # Only the settings the worker needs cross the process boundary.
+    worker_config = {
+        key: config.get(key)
+        for key in (
+            "indicators",
+            "column",
+            "plot_style",
+            "color_scheme",
+            "up_color",
+            "down_color",
+            "save_dir",
+            "save_format",
+            "save_dpi",
+            "decimate",
+            "max_points",
+            "interval",
+            "start_date",
+            "end_date",
+            "engine",
+            "data_source",
+            "cache_dir",
+            "indicator_cache_mb",
+            "indicator_cache_disk",
+        )
+    }
+    errors = {}
+    if pool is None:
+        pool_context = new_render_pool(min(workers, len(jobs)))
+    else:
+        # The caller's pool stays open for its next batch.
+        pool_context = contextlib.nullcontext(pool)
+    with pool_context as pool:
+        futures = {
+            pool.submit(
+                _render_one, ticker, pack_frame(data, config["column"]), worker_config
+            ): ticker
+            for ticker, data in jobs.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            ticker = futures[future]
+            try:
+                error = future.result()
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            if error:
+                errors[ticker] = error
+                logger.warning("Rendering %s failed: %s", ticker, error)
+            print(f"[{done}/{len(jobs)}] {'Failed' if error else 'Rendered'} {ticker}")
+
+    if len(errors) == len(jobs):
+        raise PlotError(f"Rendering failed for all {len(jobs)} tickers")
+    return errors
@@ -2,22 +2,13 @@ import os
 import sys
 import logging
 from typing import Optional, Any, Dict
-import importlib.resources
 from pathlib import Path
-import yaml
 import click
-from stonkzilla.cli.config_model import ConfigModel, build_config_interactive
 from stonkzilla.cli.options import common_options
-from stonkzilla.cli.services import (
-    fetch_all_data,
-    run_indicators,
-    run_multi_ticker_indicators,
-    plot_data,
-    plot_multi,
-)
 from stonkzilla.cli.exceptions import (
     ConfigError,
     DataSourceError,
+    ExportError,
     IndicatorError,
     PlotError,
     ValidationError,
@@ -39,6 +30,9 @@ def resolve_path(path: str, base_dir: str = None) -> str:
 
 
 def load_config(config_file_path: Optional[str]) -> dict[str, Any]:
+    import importlib.resources
+    import yaml
+
     if config_file_path:
         abs_path = os.path.abspath(config_file_path)
         if os.path.exists(abs_path):
@@ -69,10 +63,19 @@ def load_config(config_file_path: Optional[str]) -> dict[str, Any]:
     base_dir = chosen.parent
     if "save_dir" in data:
         data["save_dir"] = resolve_path(data["save_dir"], str(base_dir))
+    if "export_dir" in data:
+        data["export_dir"] = resolve_path(data["export_dir"], str(base_dir))
+    if "cache_dir" in data:
+        data["cache_dir"] = resolve_path(data["cache_dir"], str(base_dir))
+    for key in ("profile_json", "profile_trace", "cprofile"):
+        if key in data:
+            data[key] = resolve_path(data[key], str(base_dir))
     return data
 
 
 def _build_config(config_file: str, **cli_overrides) -> Dict[str, Any]:
+    from stonkzilla.cli.config_model import ConfigModel
+
     try:
         raw = load_config(config_file)
         filtered_overrides = {k: v for k, v in cli_overrides.items() if v is not None}
@@ -85,61 +88,155 @@ def _build_config(config_file: str, **cli_overrides) -> Dict[str, Any]:
         raise ConfigError("Failed to build configuration") from e
 
 
+def _plot_all(
+    all_data: dict[str, Any],
+    config: dict[str, Any],
+    result_cache: Any = None,
+    render_pool: Any = None,
+) -> None:
+    """Calculate indicators and render the plots for the fetched data."""
+    from stonkzilla.cli.services import (
+        run_indicators,
+        run_multi_ticker_indicators,
+        plot_data,
+        plot_multi,
+    )
+
+    if config["multi_plot"]:
+        indicators = run_multi_ticker_indicators(
+            ticker_data=all_data,
+            indicators=config["indicators"],
+            column=config["column"],
+            normalize=config.get("normalize", False),
+            engine=config.get("engine", "pandas"),
+            result_cache=result_cache,
+            scope=(config["data_source"], config["interval"]),
+        )
+        plot_multi(
+            data=all_data,
+            indicators=indicators,
+            column=config["column"],
+            save=config.get("save", False),
+            save_dir=config.get("save_dir"),
+            save_format=config.get("save_format", "png"),
+            save_dpi=config.get("save_dpi", False),
+            normalize=config.get("normalize", False),
+            log_scale=config.get("log_scale", False),
+            interval=config["interval"],
+            decimate=config.get("decimate", True),
+            max_points=config.get("max_points"),
+        )
+    elif config.get("save") and config.get("render_workers", 1) > 1:
+        from stonkzilla.cli.profiling import profiler
+        from stonkzilla.cli.render_pool import render_parallel
+
+        # Worker processes are not profiled span by span, only as a whole.
+        with profiler.span("render_pool"):
+            render_parallel(all_data, config, config["render_workers"], render_pool)
+    else:
+        for ticker, data in all_data.items():
+            print(config["plot_style"])
+            print(config["color_scheme"])
+            if data.empty:
+                print(f"No data found for {ticker}. Skipping...")
+                continue
+            indicators = run_indicators(
+                data,
+                config["indicators"],
+                config["column"],
+                engine=config.get("engine", "pandas"),
+                result_cache=result_cache,
+                scope=(ticker, config["data_source"], config["interval"]),
+            )
+            plot_data(
+                data,
+                indicators,
+                config["column"],
+                ticker,
+                plot_style=config.get("plot_style"),
+                color_scheme=config.get("color_scheme"),
+                up_color=config.get("up_color"),
+                down_color=config.get("down_color"),
+                save=config.get("save", False),
+                save_dir=config.get("save_dir"),
+                save_dpi=config.get("save_dpi"),
+                interval=config["interval"],
+                start_date=config["start_date"],
+                end_date=config["end_date"],
+                decimate=config.get("decimate", True),
+                max_points=config.get("max_points"),
+            )
+
+
+def _shared_render_pool(config: dict[str, Any], intervals: list[str]) -> Any:
+    """
+    A render pool kept open across the intervals of a multi-interval run,
+    so workers start once; a no-op context when plots are not rendered in
+    parallel or there is a single interval.
+    """
+    from contextlib import nullcontext
+
+    parallel = (
+        config.get("plot", True)
+        and config.get("save")
+        and not config["multi_plot"]
+        and config.get("render_workers", 1) > 1
+    )
+    if not parallel or len(intervals) < 2:
+        return nullcontext()
+    from stonkzilla.cli.render_pool import new_render_pool
+
+    return new_render_pool(min(config["render_workers"], len(config["tickers"])))
+
+
 def _run_pipeline(config: dict[str, Any]) -> None:
+    # Imported here so --help and config errors never load pandas or matplotlib.
+    from stonkzilla.cli.services import (
+        configure_rate_limits,
+        create_result_cache,
+        fetch_intervals,
+    )
+
+    configure_rate_limits(
+        config.get("shared_rate_limit", False), config.get("cache_dir")
+    )
+    result_cache = create_result_cache(
+        config.get("indicator_cache_mb", 64),
+        config.get("indicator_cache_disk", False),
+        config.get("cache_dir"),
+    )
+    intervals = config["interval"]
+    if isinstance(intervals, str):
+        intervals = [intervals]
     try:
-        all_data = fetch_all_data(
+        data_by_interval = fetch_intervals(
             tickers=config["tickers"],
             start_date=config["start_date"],
             end_date=config["end_date"],
-            interval=config["interval"],
+            intervals=intervals,
             source=config["data_source"],
+            max_workers=config.get("max_workers", 4),
             api_key=config.get("api_key"),
+            cache=config.get("cache", True),
+            cache_dir=config.get("cache_dir"),
+            av_datatype=config.get("av_datatype", "json"),
+            resample=config.get("resample", True),
         )
-        if config["multi_plot"]:
-            indicators = run_multi_ticker_indicators(
-                ticker_data=all_data,
-                indicators=config["indicators"],
-                column=config["column"],
-            )
-            plot_multi(
-                data=all_data,
-                indicators=indicators,
-                column=config["column"],
-                save=config.get("save", False),
-                save_dir=config.get("save_dir"),
-                save_format=config.get("save_format", "png"),
-                save_dpi=config.get("save_dpi", False),
-                normalize=config.get("normalize", False),
-                log_scale=config.get("log_scale", False),
-            )
-        else:
-            for ticker, data in all_data.items():
-                print(config["plot_style"])
-                print(config["color_scheme"])
-                if data.empty:
-                    print(f"No data found for {ticker}. Skipping...")
-                    continue
-                indicators = run_indicators(
-                    data, config["indicators"], config["column"]
-                )
-                plot_data(
-                    data,
-                    indicators,
-                    config["column"],
-                    ticker,
-                    plot_style=config.get("plot_style"),
-                    color_scheme=config.get("color_scheme"),
-                    up_color=config.get("up_color"),
-                    down_color=config.get("down_color"),
-                    save=config.get("save", False),
-                    save_dir=config.get("save_dir"),
-                    save_dpi=config.get("save_dpi"),
-                    interval=config["interval"],
-                    start_date=config["start_date"],
-                    end_date=config["end_date"],
-                )
+        with _shared_render_pool(config, intervals) as render_pool:
+            for interval, all_data in data_by_interval.items():
+                interval_config = {**config, "interval": interval}
+                if config.get("export"):
+                    from stonkzilla.cli.export import export_all
+
+                    # Plotting afterwards reuses the exported results from the cache.
+                    export_all(all_data, interval_config, result_cache)
+                if config.get("plot", True):
+                    _plot_all(all_data, interval_config, result_cache, render_pool)
+        if result_cache is not None:
+            print(result_cache.summary())
     except (
         DataSourceError,
+        ExportError,
         IndicatorError,
         PlotError,
         ValidationError,
@@ -154,7 +251,63 @@ def _run_pipeline(config: dict[str, Any]) -> None:
         sys.exit(2)
 
 
-@click.command()
+def _run_profiled(config: dict[str, Any]) -> None:
+    """
+    Run the pipeline, timing its phases when a profile option is set and
+    under cProfile when cprofile names an output file.
+    """
+    from stonkzilla.cli.profiling import profiler
+
+    timed = any(config.get(key) for key in ("profile", "profile_json", "profile_trace"))
+    if not timed and not config.get("cprofile"):
+        _run_pipeline(config)
+        return
+
+    def run() -> None:
+        with profiler.span("run"):
+            _run_pipeline(config)
+
+    if timed:
+        profiler.enable()
+    try:
+        if config.get("cprofile"):
+            import cProfile
+
+            cprof = cProfile.Profile()
+            try:
+                cprof.runcall(run)
+            finally:
+                cprof.dump_stats(config["cprofile"])
+                print(f"cProfile stats written to: {os.path.abspath(config['cprofile'])}")
+        else:
+            run()
+    finally:
+        profiler.disable()
+        if config.get("profile"):
+            print(profiler.report())
+        if config.get("profile_json"):
+            profiler.write_json(config["profile_json"])
+            print(f"Profile written to: {os.path.abspath(config['profile_json'])}")
+        if config.get("profile_trace"):
+            profiler.write_chrome_trace(config["profile_trace"])
+            print(f"Trace written to: {os.path.abspath(config['profile_trace'])}")
+
+
+def _config_from_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Build the pipeline config from a config file, or interactively from CLI options."""
+    from stonkzilla.cli.config_model import build_config_interactive
+
+    config_file = kwargs.get("config_file")
+    if config_file:
+        config_model = _build_config(config_file)
+    else:
+        config_model = build_config_interactive(kwargs)
+    config = config_model.model_dump()
+    config["indicators"] = config_model.tuples()
+    return config
+
+
+@click.group(invoke_without_command=True)
 @common_options
 @click.option(
     "--config-file",
@@ -162,22 +315,17 @@ def _run_pipeline(config: dict[str, Any]) -> None:
     type=click.Path(dir_okay=False, file_okay=True),
     help="Path to YAML configuration file",
 )
-def run_command(**kwargs):
+@click.pass_context
+def run_command(ctx: click.Context, **kwargs):
     """
     Main entrypoint.
     """
+    if ctx.invoked_subcommand is not None:
+        # Subcommands build the config themselves from the group's options.
+        ctx.obj = kwargs
+        return
     try:
-        config_file = kwargs.get("config_file")
-        if config_file:
-            config_model = _build_config(config_file)
-            config = config_model.model_dump()
-            config["indicators"] = config_model.tuples()
-            _run_pipeline(config)
-        else:
-            config_model = build_config_interactive(kwargs)
-            config = config_model.model_dump()
-            config["indicators"] = config_model.tuples()
-            _run_pipeline(config)
+        _run_profiled(_config_from_kwargs(kwargs))
     except (ConfigError, ValidationError) as e:
         logger.error("Configuration error: %s", e, exc_info=True)
         click.echo(f"Configuration error: {e}", err=True)
@@ -186,3 +334,67 @@ def run_command(**kwargs):
         logger.critical("Fatal error: %s", e, exc_info=True)
         click.echo("Fatal error: %s", e, err=True)
         sys.exit(2)
+
+
+@run_command.command("watch")
+@click.option(
+    "--poll-interval",
+    default=None,
+    type=click.FloatRange(min=1),
+    help="Seconds between polls (default: derived from the bar interval)",
+)
+@click.option(
+    "--max-polls",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Stop after this many polls (default: run until interrupted)",
+)
+@click.pass_obj
+def watch_command(obj: dict[str, Any], poll_interval: float, max_polls: int):
+    """
+    Keep running, fetch new bars as they arrive and re-save plots
+    of the tickers that changed.
+    """
+    from stonkzilla.cli.watch import Watcher
+
+    try:
+        config = _config_from_kwargs(obj)
+        if not isinstance(config["interval"], str):
+            raise ConfigError("watch takes a single interval")
+        Watcher(config, poll_interval).run(max_polls)
+    except KeyboardInterrupt:
+        click.echo("Stopped watching.", err=True)
+    except (ConfigError, ValidationError, DataSourceError) as e:
+        logger.error("Watch error: %s", e, exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+@run_command.command("serve")
+@click.option("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+@click.option(
+    "--port", default=8050, type=click.IntRange(0, 65535), help="Port (default: 8050)"
+)
+@click.pass_obj
+def serve_command(obj: dict[str, Any], host: str, port: int):
+    """
+    Serve indicators (/indicators) and charts (/chart) over HTTP, keeping
+    data, indicator results and render workers warm between requests.
+    Requests set tickers, dates and indicators as query parameters; the
+    other settings come from the config file or the options.
+    """
+    from stonkzilla.cli.server import serve
+
+    config_file = obj.get("config_file")
+    if config_file:
+        base_config = load_config(config_file)
+    else:
+        base_config = {k: v for k, v in obj.items() if v is not None}
+    try:
+        serve(base_config, host, port, base_config.get("render_workers") or 1)
+    except KeyboardInterrupt:
+        click.echo("Stopped serving.", err=True)
+    except OSError as e:
+        logger.error("Server error: %s", e, exc_info=True)
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,391 @@
+"""
+Local HTTP service for indicators and charts.
+
+`stonkzilla serve` keeps fetched data, indicator results and a pool of
+Agg render workers warm between requests, so a dashboard pays the startup
+and fetch cost once instead of on every call. Request parameters are
+validated with ConfigModel on top of the server's configuration, and
+identical requests arriving while one is in progress share its result.
+
+    GET /indicators?tickers=AAPL,MSFT&start_date=2024-01-01&end_date=2024-06-01
+        &indicators=EMA:20,RSI:14[&format=json|arrow]
+    GET /chart?tickers=AAPL&start_date=...&end_date=...[&format=png|svg]
+    GET /health
+"""
+
+import importlib.util
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Hashable, Optional
+from urllib.parse import parse_qs, urlsplit
+import pandas as pd
+from pydantic import ValidationError as PydanticValidationError
+from stonkzilla.cli.config_model import ConfigModel
+from stonkzilla.cli.exceptions import DataSourceError, PlotError, ValidationError
+from stonkzilla.cli.export import export_frame
+from stonkzilla.cli.render_pool import (
+    new_render_pool,
+    pack_frame,
+    render_image,
+    warm_up,
+)
+from stonkzilla.cli.services import (
+    configure_rate_limits,
+    create_result_cache,
+    iter_fetch_data,
+    run_indicators,
+)
+from stonkzilla.data_sources.cache import stale_after
+
+logger = logging.getLogger("market-indicator-cli")
+
+# Settings a request may override; the rest come from the server's config.
+REQUEST_FIELDS = (
+    "tickers",
+    "start_date",
+    "end_date",
+    "interval",
+    "indicators",
+    "data_source",
+    "av_datatype",
+    "column",
+    "engine",
+    "plot_style",
+    "color_scheme",
+    "up_color",
+    "down_color",
+    "save_dpi",
+    "decimate",
+    "max_points",
+)
+INDICATOR_FORMATS = {
+    "json": "application/json",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+CHART_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+# Fetched frames kept in memory, least recently used dropped first.
+MAX_FRAMES = 256
+RENDER_TIMEOUT = 120
+
+
+class SingleFlight:
+    """Runs one computation per key at a time; concurrent callers share its result."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self.coalesced = 0
+
+    def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if owner:
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+        return future.result()
+
+
+class FrameCache:
+    """Fetched frames by (source, interval, start, end, ticker), with expiry."""
+
+    def __init__(self, max_entries: int = MAX_FRAMES) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._frames: OrderedDict[tuple, tuple[pd.DataFrame, float]] = OrderedDict()
+
+    def get(self, key: tuple) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                return None
+            frame, expires = entry
+            if time.monotonic() >= expires:
+                del self._frames[key]
+                return None
+            self._frames.move_to_end(key)
+            return frame
+
+    def put(self, key: tuple, frame: pd.DataFrame, ttl: Optional[float]) -> None:
+        expires = float("inf") if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._frames[key] = (frame, expires)
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+def _frame_ttl(config: dict[str, Any]) -> Optional[float]:
+    """Seconds fetched data stays fresh; ranges ending in the past never change."""
+    if config["end_date"] < date.today():
+        return None
+    return stale_after(config["interval"]).total_seconds()
+
+
+class ChartService:
+    """Validates requests and computes responses with warm caches."""
+
+    def __init__(self, base_config: dict[str, Any], render_workers: int = 1) -> None:
+        self.base_config = {k: v for k, v in base_config.items() if v is not None}
+        self.result_cache = create_result_cache(
+            self.base_config.get("indicator_cache_mb", 64),
+            self.base_config.get("indicator_cache_disk", False),
+            self.base_config.get("cache_dir"),
+        )
+        self.frames = FrameCache()
+        self.flights = SingleFlight()
+        self.pool = new_render_pool(render_workers)
+        # Start the workers now so the first chart does not pay for it.
+        for _ in range(render_workers):
+            self.pool.submit(warm_up)
+        configure_rate_limits(
+            self.base_config.get("shared_rate_limit", False),
+            self.base_config.get("cache_dir"),
+        )
+
+    def close(self) -> None:
+        self.pool.shutdown(cancel_futures=True)
+
+    def config(self, params: dict[str, str]) -> dict[str, Any]:
+        """The server config with the request's parameters, validated."""
+        unknown = sorted(params.keys() - set(REQUEST_FIELDS))
+        if unknown:
+            raise ValidationError(f"Unknown parameters: {', '.join(unknown)}")
+        try:
+            model = ConfigModel.model_validate({**self.base_config, **params})
+        except PydanticValidationError as e:
+            details = "; ".join(
+                f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()
+            )
+            raise ValidationError(f"Invalid request: {details}") from e
+        if not isinstance(model.interval, str):
+            raise ValidationError("Invalid request: interval: one interval per request")
+        config = model.model_dump()
+        config["indicators"] = model.tuples()
+        return config
+
+    def fetch(self, config: dict[str, Any]) -> dict[str, pd.DataFrame]:
+        """Data for the requested tickers, fetching only those not in memory."""
+        scope = (
+            config["data_source"],
+            config["interval"],
+            config["start_date"],
+            config["end_date"],
+        )
+        frames, missing = {}, []
+        for ticker in config["tickers"]:
+            frame = self.frames.get((*scope, ticker))
+            if frame is None:
+                missing.append(ticker)
+            else:
+                frames[ticker] = frame
+        if missing:
+            frames.update(
+                self.flights.run(
+                    ("fetch", *scope, tuple(missing)),
+                    lambda: self._fetch(config, missing, scope),
+                )
+            )
+        return {ticker: frames[ticker] for ticker in config["tickers"]}
+
+    def _fetch(
+        self, config: dict[str, Any], tickers: list[str], scope: tuple
+    ) -> dict[str, pd.DataFrame]:
+        ttl = _frame_ttl(config)
+        fetched = {}
+        for ticker, data in iter_fetch_data(
+            tickers,
+            config["start_date"],
+            config["end_date"],
+            config["interval"],
+            config["data_source"],
+            config.get("max_workers", 4),
+            config.get("api_key"),
+            config.get("cache", True),
+            config.get("cache_dir"),
+            config.get("av_datatype", "json"),
+            config.get("resample", True),
+        ):
+            if not data.empty:
+                self.frames.put((*scope, ticker), data, ttl)
+            fetched[ticker] = data
+        return fetched
+
+    def _indicators(self, ticker: str, data: pd.DataFrame, config: dict[str, Any]):
+        return run_indicators(
+            data,
+            config["indicators"],
+            config["column"],
+            engine=config.get("engine", "pandas"),
+            result_cache=self.result_cache,
+            scope=(ticker, config["data_source"], config["interval"]),
+        )
+
+    def indicators(self, config: dict[str, Any], fmt: str) -> bytes:
+        """Price data and indicator columns per ticker, as JSON or Arrow."""
+        if fmt == "arrow" and importlib.util.find_spec("pyarrow") is None:
+            raise ValidationError("format=arrow requires pyarrow (pip install pyarrow)")
+        frames = {
+            ticker: export_frame(data, self._indicators(ticker, data, config))
+            for ticker, data in self.fetch(config).items()
+            if not data.empty
+        }
+        if not frames:
+            raise DataSourceError(f"No data for {', '.join(config['tickers'])}")
+        if fmt == "arrow":
+            return _arrow_stream(frames)
+        # {"AAPL": {"columns": [...], "index": [...], "data": [[...], ...]}, ...}
+        parts = [
+            f"{json.dumps(ticker)}:{frame.to_json(orient='split', date_format='iso')}"
+            for ticker, frame in frames.items()
+        ]
+        return ("{" + ",".join(parts) + "}").encode()
+
+    def chart(self, config: dict[str, Any], fmt: str) -> bytes:
+        """One ticker's chart, rendered on the worker pool."""
+        if len(config["tickers"]) != 1:
+            raise ValidationError("/chart renders one ticker at a time")
+        ticker = config["tickers"][0]
+        data = self.fetch(config)[ticker]
+        if data.empty:
+            raise DataSourceError(f"No data for {ticker}")
+        indicators = self._indicators(ticker, data, config)
+        worker_config = {
+            key: config.get(key)
+            for key in (
+                "column",
+                "plot_style",
+                "color_scheme",
+                "up_color",
+                "down_color",
+                "save_dpi",
+                "decimate",
+                "max_points",
+                "interval",
+                "start_date",
+                "end_date",
+            )
+        }
+        worker_config["save_format"] = fmt
+        future = self.pool.submit(
+            render_image, ticker, pack_frame(data, config["column"]), indicators, worker_config
+        )
+        try:
+            return future.result(timeout=RENDER_TIMEOUT)
+        except Exception as e:
+            raise PlotError(f"Rendering {ticker} failed: {type(e).__name__}: {e}") from e
+
+    def respond(
+        self, route: str, params: dict[str, str], formats: dict[str, str]
+    ) -> tuple[bytes, str]:
+        """Validate, then compute the response once for identical concurrent requests."""
+        fmt = params.pop("format", next(iter(formats)))
+        if fmt not in formats:
+            raise ValidationError(f"format must be one of {', '.join(formats)}")
+        config = self.config(params)
+        handler = self.chart if route == "/chart" else self.indicators
+        key = (route, fmt, json.dumps(config, sort_keys=True, default=str))
+        return self.flights.run(key, lambda: handler(config, fmt)), formats[fmt]
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "frames": len(self.frames),
+            "coalesced": self.flights.coalesced,
+            "indicator_cache": self.result_cache.summary() if self.result_cache else None,
+        }
+
+
+def _arrow_stream(frames: dict[str, pd.DataFrame]) -> bytes:
+    """All tickers in one Arrow IPC stream, with a leading Ticker column."""
+    import pyarrow as pa
+
+    combined = pd.concat(
+        [frame.reset_index().assign(Ticker=ticker) for ticker, frame in frames.items()],
+        ignore_index=True,
+    )
+    combined = combined[["Ticker", *combined.columns[:-1]]]
+    table = pa.Table.from_pandas(combined, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "stonkzilla"
+    routes = {"/indicators": INDICATOR_FORMATS, "/chart": CHART_FORMATS}
+
+    def do_GET(self) -> None:
+        service: ChartService = self.server.service
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            self._send(HTTPStatus.OK, json.dumps(service.health()).encode(), "application/json")
+            return
+        formats = self.routes.get(url.path)
+        if formats is None:
+            self._error(HTTPStatus.NOT_FOUND, f"No such endpoint: {url.path}")
+            return
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            body, content_type = service.respond(url.path, params, formats)
+        except ValidationError as e:
+            self._error(HTTPStatus.BAD_REQUEST, str(e))
+        except DataSourceError as e:
+            self._error(HTTPStatus.NOT_FOUND, str(e))
+        except Exception as e:
+            logger.error("Request %s failed: %s", self.path, e, exc_info=True)
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+        else:
+            self._send(HTTPStatus.OK, body, content_type)
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, json.dumps({"error": message}).encode(), "application/json")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.info("%s %s", self.address_string(), format % args)
+
+
+def serve(
+    base_config: dict[str, Any],
+    host: str = "127.0.0.1",
+    port: int = 8050,
+    render_workers: int = 1,
+) -> None:
+    """Serve until interrupted."""
+    service = ChartService(base_config, render_workers)
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.service = service
+    print(f"Serving on http://{host}:{server.server_port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        service.close()
@@ -1,54 +1,270 @@
-from typing import Optional
-import time
+import importlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, Optional
 import pandas as pd
-from stonkzilla.data_sources.yfinance import YfinanceSource
-from stonkzilla.data_sources.alphavantage import AlphavantageSource
-from stonkzilla.indicators.ema import EMA
-from stonkzilla.indicators.sma import SMA
-from stonkzilla.indicators.rsi import RSI
-from stonkzilla.indicators.bbands import BBANDS
-from stonkzilla.indicators.macd import MACD
-from stonkzilla.indicators.obv import OBV
-from stonkzilla.indicators.adx import ADX
-from stonkzilla.indicators.fibonacci_retracement import FibonacciRetracement as FIBO
-from stonkzilla.plots.plotter import Plotter
-from stonkzilla.plots.candlestick_plotter import CandlestickPlotter
-from stonkzilla.plots.multi_plotter import MultiTickerPlotter
+from stonkzilla.cli.exceptions import DataSourceError
+from stonkzilla.cli.profiling import profiler
+from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators.engine import IndicatorEngine
 
+if TYPE_CHECKING:
+    from stonkzilla.data_sources.base_source import BaseSource
+    from stonkzilla.indicators.result_cache import ResultCache
+
+# Indicator classes by name, as "module:Class"; imported on first use.
 INDICATOR_CLASSES = {
-    "EMA": EMA,
-    "SMA": SMA,
-    "RSI": RSI,
-    "MACD": MACD,
-    "BBANDS": BBANDS,
-    "OBV": OBV,
-    "ADX": ADX,
-    "FIBO": FIBO,
+    "EMA": "stonkzilla.indicators.ema:EMA",
+    "SMA": "stonkzilla.indicators.sma:SMA",
+    "RSI": "stonkzilla.indicators.rsi:RSI",
+    "MACD": "stonkzilla.indicators.macd:MACD",
+    "BBANDS": "stonkzilla.indicators.bbands:BBANDS",
+    "OBV": "stonkzilla.indicators.obv:OBV",
+    "ADX": "stonkzilla.indicators.adx:ADX",
+    "FIBO": "stonkzilla.indicators.fibonacci_retracement:FibonacciRetracement",
 }
 
 
+@lru_cache(maxsize=None)
+def get_indicator_class(name: str) -> Optional[type[BaseIndicator]]:
+    """Import and return the indicator class registered under name."""
+    path = INDICATOR_CLASSES.get(name)
+    if path is None:
+        return None
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+# Indicators computed column-wise over all tickers at once in multi mode.
+# Only those MultiTickerPlotter draws; the others would be thrown away.
+BATCHED_INDICATORS = ("SMA", "EMA")
+
+logger = logging.getLogger("market-indicator-cli")
+
+
+def get_source(
+    source: str,
+    api_key: str = None,
+    cache: bool = True,
+    cache_dir: str = None,
+    av_datatype: str = "json",
+    resample: bool = True,
+) -> "BaseSource":
+    """
+    Instantiate the configured data source, wrapped in the OHLCV cache if
+    enabled. With resample, intervals are derived from finer cached ones
+    before they are fetched.
+    """
+    if source == "yfinance":
+        from stonkzilla.data_sources.yfinance import YfinanceSource
+
+        src = YfinanceSource()
+    elif source == "alphavantage":
+        from stonkzilla.data_sources.alphavantage import AlphavantageSource
+
+        src = AlphavantageSource(api_key=api_key, datatype=av_datatype)
+    else:
+        raise NotImplementedError("Only yfinance and alphavantage are supported")
+    if cache:
+        from stonkzilla.data_sources.cache import CachedSource, OHLCVCache
+
+        src = CachedSource(src, OHLCVCache(cache_dir))
+        if resample:
+            from stonkzilla.data_sources.resample import ResamplingSource
+
+            src = ResamplingSource(src)
+    return src
+
+
+def configure_rate_limits(shared: bool = False, cache_dir: str = None) -> None:
+    """
+    Keep the data source rate limits in a SQLite file in the cache
+    directory when shared, so concurrent processes split one quota.
+    """
+    from stonkzilla.data_sources.rate_limiter import use_shared_state
+
+    path = None
+    if shared:
+        from stonkzilla.data_sources.cache import default_cache_dir
+
+        path = os.path.join(cache_dir or default_cache_dir(), "ratelimit.sqlite3")
+    use_shared_state(path)
+
+
+def create_result_cache(
+    max_mb: int = 64, disk: bool = False, cache_dir: str = None
+) -> Optional["ResultCache"]:
+    """
+    Build the indicator result cache, or None when max_mb is 0. The disk
+    tier lives in an 'indicators' folder of the OHLCV cache directory.
+    """
+    if not max_mb:
+        return None
+    from stonkzilla.data_sources.cache import default_cache_dir
+    from stonkzilla.indicators.result_cache import ResultCache
+
+    disk_dir = None
+    if disk:
+        disk_dir = os.path.join(cache_dir or default_cache_dir(), "indicators")
+    return ResultCache(max_bytes=max_mb * 2**20, cache_dir=disk_dir)
+
+
+def _fetch_batch(
+    src: "BaseSource", batch: list[str], start_date: str, end_date: str, interval: str
+) -> dict[str, pd.DataFrame]:
+    with profiler.span("fetch", ticker=",".join(batch)):
+        return src.fetch_many(batch, start_date, end_date, interval)
+
+
+def iter_fetch_data(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    interval: str,
+    source: str,
+    max_workers: int = 4,
+    api_key: str = None,
+    cache: bool = True,
+    cache_dir: str = None,
+    av_datatype: str = "json",
+    resample: bool = True,
+) -> Iterator[tuple[str, pd.DataFrame]]:
+    """
+    Fetch tickers in batches of the source's BATCH_SIZE on a bounded thread pool
+    and yield (ticker, data) as each batch finishes. Requests are spaced by the
+    source's shared rate limiter instead of a fixed sleep.
+    A failing batch is logged and yields empty DataFrames for its tickers
+    without cancelling the rest, whatever the error (network, cache write,
+    unsupported interval).
+    """
+    src = get_source(source, api_key, cache, cache_dir, av_datatype, resample)
+    batches = [
+        tickers[i : i + src.BATCH_SIZE] for i in range(0, len(tickers), src.BATCH_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            pool.submit(_fetch_batch, src, batch, start_date, end_date, interval): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                results = future.result()
+            except DataSourceError as e:
+                logger.warning("Fetching %s failed: %s", ", ".join(batch), e)
+                results = {}
+            except Exception as e:
+                logger.error(
+                    "Fetching %s failed unexpectedly: %s",
+                    ", ".join(batch),
+                    e,
+                    exc_info=True,
+                )
+                results = {}
+            for ticker in batch:
+                yield ticker, results.get(ticker, pd.DataFrame())
+
+
 def fetch_all_data(
     tickers: list[str],
     start_date: str,
     end_date: str,
     interval: str,
     source: str,
-    delay=1,
+    max_workers: int = 4,
     api_key: str = None,
+    cache: bool = True,
+    cache_dir: str = None,
+    av_datatype: str = "json",
+    resample: bool = True,
 ) -> dict[str, pd.DataFrame]:
-    if source == "yfinance":
-        src = YfinanceSource()
-    elif source == "alphavantage":
-        src = AlphavantageSource(api_key=api_key)
-    else:
-        raise NotImplementedError("Only yfinance and alphavantage are supported")
-    data_dict = {}
-    for ticker in tickers:
-        print(f"Fetching data for {ticker}...")
-        data = src.fetch_data(ticker, start_date, end_date, interval)
-        time.sleep(delay)
-        data_dict[ticker] = data
-    return data_dict
+    results = {}
+    for ticker, data in iter_fetch_data(
+        tickers,
+        start_date,
+        end_date,
+        interval,
+        source,
+        max_workers,
+        api_key,
+        cache,
+        cache_dir,
+        av_datatype,
+        resample,
+    ):
+        print(f"Fetched data for {ticker} ({len(data)} rows)")
+        results[ticker] = data
+    if tickers and all(results[ticker].empty for ticker in tickers):
+        raise DataSourceError("No data could be fetched for any ticker")
+    return {ticker: results[ticker] for ticker in tickers}
+
+
+def fetch_intervals(
+    tickers: list[str],
+    start_date: str,
+    end_date: str,
+    intervals: list[str],
+    source: str,
+    max_workers: int = 4,
+    api_key: str = None,
+    cache: bool = True,
+    cache_dir: str = None,
+    av_datatype: str = "json",
+    resample: bool = True,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Fetch data for several intervals, as {interval: {ticker: data}}. With
+    resample on, an interval that can be aggregated from a finer one in the
+    list is built from that one's data, so each ticker is fetched once per
+    base interval instead of once per interval.
+    """
+    from stonkzilla.data_sources.resample import base_interval, resample_ohlcv
+
+    bases = {
+        interval: base_interval(interval, intervals, start_date) if resample else interval
+        for interval in intervals
+    }
+    fetched = {}
+    for base in dict.fromkeys(bases.values()):
+        fetched[base] = fetch_all_data(
+            tickers,
+            start_date,
+            end_date,
+            base,
+            source,
+            max_workers,
+            api_key,
+            cache,
+            cache_dir,
+            av_datatype,
+            resample,
+        )
+    results = {}
+    for interval, base in bases.items():
+        if base == interval:
+            results[interval] = fetched[base]
+            continue
+        print(f"Resampling {interval} data from {base}")
+        results[interval] = {
+            ticker: resample_ohlcv(data, interval)
+            for ticker, data in fetched[base].items()
+        }
+    return results
+
+
+def _group_by_index(series: dict[str, pd.Series]) -> list[dict[str, pd.Series]]:
+    """Group ticker series that share exactly the same index."""
+    groups: list[dict[str, pd.Series]] = []
+    for ticker, values in series.items():
+        for group in groups:
+            if next(iter(group.values())).index.equals(values.index):
+                group[ticker] = values
+                break
+        else:
+            groups.append({ticker: values})
+    return groups
 
 
 def run_multi_ticker_indicators(
@@ -56,85 +272,171 @@ def run_multi_ticker_indicators(
     indicators: list[tuple[str, list[int | float]]],
     column: str = "Close",
     normalize: bool = False,
+    engine: str = "pandas",
+    result_cache: Optional["ResultCache"] = None,
+    scope: tuple[str, str] = ("", ""),
 ) -> dict[str, tuple[pd.DataFrame | pd.Series, Optional[list[int]]]]:
     """
     Calculate indicators for multi-ticker plotting.
-    FIBO is only calculated and included if normalize=True.
+    Moving averages are computed in one vectorized pass over a dates x
+    tickers frame per group of tickers sharing the same dates, with one
+    column per ticker. FIBO is only calculated and included if
+    normalize=True. Indicators the multi-ticker plot does not draw are
+    skipped.
+    engine selects the IndicatorEngine backend. With a result_cache, each
+    group's results are looked up by the group's tickers and data hash;
+    scope is the (source, interval) the data was fetched with.
     """
-    calculated = {}
     filtered_indicators = []
     for name, params in indicators:
         if name == "FIBO" and not normalize:
             continue
-        filtered_indicators.append((name, params))
-    for name, params in indicators:
-        indicator_class = INDICATOR_CLASSES.get(name)
-        if not indicator_class:
+        if name not in BATCHED_INDICATORS and name != "FIBO":
+            logger.debug("Skipping %s: not drawn on multi-ticker plots", name)
             continue
-        if name in ("SMA", "EMA"):
-            result_df = pd.DataFrame()
-            for ticker, data in ticker_data.items():
-                indicator = indicator_class(*params, column=column)
-                series = indicator.calculate(data)
-                if isinstance(series, pd.Series):
-                    result_df[ticker] = series
-                elif isinstance(series, pd.DataFrame):
-                    series = series.add_prefix(f"{ticker}_")
-                    result_df = pd.concat([result_df, series], axis=1)
-                else:
-                    raise TypeError(
-                        f"Unexpected output type from {name}: {type(series)}"
-                    )
-            calculated[f"{name}_{"_".join(map(str, params))}"] = (result_df, params)
-        elif name == "FIBO":
-            fibo_dfs = []
-            for ticker, data in ticker_data.items():
-                indicator = indicator_class(*params)
-                fibo_df = indicator.calculate(data)
-                # fibo_df: index = dates, columns = fib levels
-                # Take the first row (or last, or mean) for each ticker
-                # Here, take the first row (earliest date)
-                fibo_levels = fibo_df.iloc[0]
-                fibo_levels.name = ticker
-                fibo_dfs.append(fibo_levels)
-            if fibo_dfs:
-                all_levels = pd.concat(fibo_dfs, axis=1)
-                calculated[f"{name}_{'_'.join(map(str, params))}"] = (
-                    all_levels,
-                    params,
-                )
-    return calculated
+        filtered_indicators.append((name, params))
 
+    batched = [
+        (name, params)
+        for name, params in filtered_indicators
+        if name in BATCHED_INDICATORS
+    ]
+    groups = _group_by_index(
+        {
+            ticker: data[column]
+            for ticker, data in ticker_data.items()
+            if not data.empty and column in data.columns
+        }
+    )
+    group_results = []
+    for group in groups:
+        group_data = {column: pd.DataFrame(group)}
+        group_results.append(
+            _run_cached(
+                group_data,
+                build_indicators(batched, column),
+                engine,
+                result_cache,
+                (",".join(group), *scope),
+                column,
+            )
+        )
 
-def run_indicators(
-    data: pd.DataFrame, indicators: list[tuple[str, list[int | float]]], column: str
-) -> dict[str, tuple[pd.DataFrame | pd.Series, Optional[list[int]]]]:
     calculated = {}
-    for name, params in indicators:
-        indicator_class = INDICATOR_CLASSES.get(name)
-        if not indicator_class:
+    for i, (name, params) in enumerate(batched):
+        parts = [results[i] for results in group_results]
+        result_df = pd.concat(parts, axis=1) if parts else pd.DataFrame()
+        calculated[f"{name}_{'_'.join(map(str, params))}"] = (result_df, params)
+
+    for name, params in filtered_indicators:
+        if name != "FIBO":
             continue
-        if name == "OBV":
-            indicator = indicator_class(name)
-            calculated_series = indicator.calculate(data)
-            calculated[name] = (calculated_series, params)
-        elif name in ("ADX", "FIBO"):
-            indicator = indicator_class(*params)
-            calculated_series = indicator.calculate(data)
+        fibo_dfs = []
+        for ticker, data in ticker_data.items():
+            if data.empty:
+                continue
+            indicator = build_indicator(name, params, column)
+            fibo_df = indicator.calculate(data)
+            # fibo_df: index = dates, columns = fib levels
+            # Take the first row (earliest date) for each ticker
+            fibo_levels = fibo_df.iloc[0]
+            fibo_levels.name = ticker
+            fibo_dfs.append(fibo_levels)
+        if fibo_dfs:
+            all_levels = pd.concat(fibo_dfs, axis=1)
             calculated[f"{name}_{'_'.join(map(str, params))}"] = (
-                calculated_series,
-                params,
-            )
-        else:
-            indicator = indicator_class(*params, column=column)
-            calculated_series = indicator.calculate(data)
-            calculated[f"{name}_{'_'.join(map(str, params))}"] = (
-                calculated_series,
+                all_levels,
                 params,
             )
     return calculated
 
 
+def build_indicator(
+    name: str, params: list[int | float], column: str
+) -> Optional[BaseIndicator]:
+    """Instantiate a registered indicator, or None for unknown names."""
+    indicator_class = get_indicator_class(name)
+    if not indicator_class:
+        return None
+    if name == "OBV":
+        return indicator_class()
+    if name in ("ADX", "FIBO"):
+        return indicator_class(*params)
+    return indicator_class(*params, column=column)
+
+
+def build_indicators(
+    indicators: list[tuple[str, list[int | float]]], column: str
+) -> list[tuple[str, list[int | float], BaseIndicator]]:
+    """Instantiate indicators as (result key, params, instance), skipping unknown names."""
+    built = []
+    for name, params in indicators:
+        indicator = build_indicator(name, params, column)
+        if indicator is None:
+            continue
+        key = name if name == "OBV" else f"{name}_{'_'.join(map(str, params))}"
+        built.append((key, params, indicator))
+    return built
+
+
+def _run_cached(
+    data: pd.DataFrame | dict[str, pd.DataFrame],
+    built: list[tuple[str, list[int | float], BaseIndicator]],
+    engine: str,
+    result_cache: Optional["ResultCache"],
+    scope: tuple[str, str, str],
+    column: str,
+) -> list[pd.Series | pd.DataFrame]:
+    """
+    Evaluate built indicators on the engine, reusing cached results. scope
+    is (ticker, source, interval); only the cache misses are computed.
+    """
+    with profiler.span("indicators", ticker=scope[0]):
+        frame = OHLCVFrame.from_pandas(data) if isinstance(data, pd.DataFrame) else data
+        if result_cache is None:
+            return IndicatorEngine(frame, engine).run([ind for _, _, ind in built])
+
+        from stonkzilla.indicators.result_cache import fingerprint, result_key
+
+        data_hash = fingerprint(data)
+        keys = [
+            result_key(*scope, data_hash, name, params, column)
+            for name, params, _ in built
+        ]
+        results = [result_cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = IndicatorEngine(frame, engine).run([built[i][2] for i in missing])
+            for i, result in zip(missing, computed):
+                result_cache.put(keys[i], result)
+                results[i] = result
+        return results
+
+
+def run_indicators(
+    data: pd.DataFrame,
+    indicators: list[tuple[str, list[int | float]]],
+    column: str,
+    engine: str = "pandas",
+    result_cache: Optional["ResultCache"] = None,
+    scope: tuple[str, str, str] = ("", "", ""),
+) -> dict[str, tuple[pd.DataFrame | pd.Series, Optional[list[int]]]]:
+    """
+    Calculate indicators for a single ticker through the fused engine,
+    so primitives shared between indicators are evaluated once. Indicators
+    read zero-copy column views of an OHLCVFrame instead of the DataFrame.
+    engine selects the backend for recursive primitives. With a
+    result_cache, results are reused for the same (ticker, source,
+    interval) scope and data, and only new indicators are computed.
+    """
+    built = build_indicators(indicators, column)
+    results = _run_cached(data, built, engine, result_cache, scope, column)
+    return {
+        key: (result, params)
+        for (key, params, _), result in zip(built, results)
+    }
+
+
 def plot_data(
     data: dict[str, pd.DataFrame],
     indicators: dict[str, tuple[pd.DataFrame | pd.Series, list[int]]],
@@ -151,9 +453,13 @@ def plot_data(
     interval: str = None,
     start_date: str = None,
     end_date: str = None,
+    decimate: bool = True,
+    max_points: Optional[int] = None,
 ):
     title = f"Stock analysis for {ticker}"
     if plot_style == "candlestick":
+        from stonkzilla.plots.candlestick_plotter import CandlestickPlotter
+
         plotter = CandlestickPlotter(
             title=title,
             color_scheme=color_scheme,
@@ -161,25 +467,30 @@ def plot_data(
             down_color=down_color,
         )
     else:
+        from stonkzilla.plots.plotter import Plotter
+
         plotter = Plotter(
             title=title,
             color_scheme=color_scheme,
             up_color=up_color,
             down_color=down_color,
+            decimate=decimate,
+            max_points=max_points,
+        )
+    with profiler.span("plot", ticker=ticker):
+        plotter.plot(
+            data,
+            indicators,
+            column,
+            ticker,
+            save=save,
+            save_dir=save_dir,
+            save_format=save_format,
+            save_dpi=save_dpi,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date,
         )
-    plotter.plot(
-        data,
-        indicators,
-        column,
-        ticker,
-        save=save,
-        save_dir=save_dir,
-        save_format=save_format,
-        save_dpi=save_dpi,
-        interval=interval,
-        start_date=start_date,
-        end_date=end_date,
-    )
 
 
 def plot_multi(
@@ -192,17 +503,26 @@ def plot_multi(
     save_dpi: int,
     normalize: bool,
     log_scale: bool,
+    interval: str = "",
+    decimate: bool = True,
+    max_points: Optional[int] = None,
 ) -> None:
+    from stonkzilla.plots.multi_plotter import MultiTickerPlotter
+
     plotter = MultiTickerPlotter(
         normalize=normalize,
         log_scale=log_scale,
+        decimate=decimate,
+        max_points=max_points,
     )
-    plotter.plot(
-        data,
-        indicators,
-        column,
-        save,
-        save_dir,
-        save_format,
-        save_dpi,
-    )
+    with profiler.span("plot", ticker=",".join(data)):
+        plotter.plot(
+            data,
+            indicators,
+            column,
+            save,
+            save_dir,
+            save_format,
+            save_dpi,
+            interval=interval,
+        )
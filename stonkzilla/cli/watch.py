@@ -0,0 +1,273 @@
+"""
+Long-running watch mode.
+
+Keeps fetched data and indicator state in memory, polls the source for new
+bars on an interval-aware schedule, advances indicators incrementally and
+re-saves plots only for tickers whose data changed.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Optional
+import matplotlib
+import pandas as pd
+from stonkzilla.cli.exceptions import DataSourceError
+from stonkzilla.cli.services import (
+    configure_rate_limits,
+    build_indicators,
+    fetch_all_data,
+    iter_fetch_data,
+    plot_data,
+    plot_multi,
+    run_multi_ticker_indicators,
+)
+from stonkzilla.data_sources.cache import stale_after
+from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators.engine import IndicatorEngine
+
+logger = logging.getLogger("market-indicator-cli")
+
+# Never poll more often than this, whatever the bar interval.
+MIN_POLL_SECONDS = 30.0
+
+
+def poll_seconds(interval: str) -> float:
+    """
+    Default time between polls: one bar for intraday intervals, and the
+    provisional-bar refresh period for daily and longer ones.
+    """
+    return max(stale_after(interval).total_seconds(), MIN_POLL_SECONDS)
+
+
+@dataclass
+class TrackedIndicator:
+    """An indicator's plotted result plus the live instance that extends it."""
+
+    key: str
+    params: list[int | float]
+    result: pd.Series | pd.DataFrame
+    instance: BaseIndicator
+    incremental: bool
+    # State before the last applied bar, so a revised last bar can be replayed.
+    checkpoint: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class TickerState:
+    data: pd.DataFrame
+    indicators: list[TrackedIndicator] = field(default_factory=list)
+
+
+def _supports_update(indicator: BaseIndicator) -> bool:
+    try:
+        indicator.get_state()
+    except NotImplementedError:
+        return False
+    return True
+
+
+def _append(
+    result: pd.Series | pd.DataFrame, index: pd.Index, values: list
+) -> pd.Series | pd.DataFrame:
+    """Append incremental values, replacing a row that was recomputed."""
+    if isinstance(result, pd.DataFrame):
+        part = pd.DataFrame(values, index=index)[list(result.columns)]
+    else:
+        part = pd.Series(values, index=index, name=result.name, dtype=float)
+    combined = pd.concat([result, part])
+    return combined[~combined.index.duplicated(keep="last")]
+
+
+class Watcher:
+    """Polls for new bars and refreshes the saved plots of changed tickers."""
+
+    def __init__(self, config: dict[str, Any], poll_interval: Optional[float] = None):
+        self.config = config
+        self.poll_interval = poll_interval or poll_seconds(config["interval"])
+        self.tickers: dict[str, TickerState] = {}
+
+    def _track(self, data: pd.DataFrame) -> TickerState:
+        """Compute full indicator results and warm up their incremental state."""
+        built = build_indicators(self.config["indicators"], self.config["column"])
+        results = IndicatorEngine(
+            OHLCVFrame.from_pandas(data), self.config.get("engine", "pandas")
+        ).run([indicator for _, _, indicator in built])
+        state = TickerState(data=data)
+        for (key, params, instance), result in zip(built, results):
+            incremental = _supports_update(instance)
+            tracked = TrackedIndicator(key, params, result, instance, incremental)
+            if incremental and len(data) > 0:
+                instance.warm_up(data.iloc[:-1])
+                tracked.checkpoint = instance.get_state()
+                instance.update(data.iloc[-1].to_dict())
+            state.indicators.append(tracked)
+        return state
+
+    def _apply(self, state: TickerState, bars: pd.DataFrame) -> None:
+        """Feed new (or revised last) bars to every indicator."""
+        revised = len(state.data) > 0 and bars.index[0] == state.data.index[-1]
+        state.data = pd.concat([state.data, bars])
+        state.data = state.data[~state.data.index.duplicated(keep="last")]
+        records = bars.to_dict("records")
+        for tracked in state.indicators:
+            if not tracked.incremental:
+                tracked.result = tracked.instance.calculate(state.data)
+                continue
+            if revised:
+                tracked.instance.set_state(tracked.checkpoint)
+            values = []
+            for i, bar in enumerate(records):
+                if i == len(records) - 1:
+                    tracked.checkpoint = tracked.instance.get_state()
+                values.append(tracked.instance.update(bar))
+            tracked.result = _append(tracked.result, bars.index, values)
+
+    def _changed_bars(
+        self, current: pd.DataFrame, fetched: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Rows of fetched that are new or revise the last known bar."""
+        if fetched.empty:
+            return fetched
+        fetched = fetched[list(current.columns)] if len(current) else fetched
+        if current.empty:
+            return fetched
+        last = current.index[-1]
+        changed = fetched[fetched.index > last]
+        if last in fetched.index:
+            revised = fetched.loc[[last]]
+            if not revised.iloc[0].equals(current.iloc[-1]):
+                changed = pd.concat([revised, changed])
+        return changed
+
+    def _fetch_window(self) -> tuple[str, str]:
+        start = min(
+            (s.data.index[-1] for s in self.tickers.values() if len(s.data)),
+            default=pd.Timestamp(self.config["start_date"]),
+        )
+        end = date.today() + timedelta(days=1)
+        return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+    def load(self) -> None:
+        """Initial fetch over the configured range up to today."""
+        config = self.config
+        all_data = fetch_all_data(
+            tickers=config["tickers"],
+            start_date=str(config["start_date"]),
+            end_date=self._fetch_window()[1],
+            interval=config["interval"],
+            source=config["data_source"],
+            max_workers=config.get("max_workers", 4),
+            api_key=config.get("api_key"),
+            cache=config.get("cache", True),
+            cache_dir=config.get("cache_dir"),
+            av_datatype=config.get("av_datatype", "json"),
+            resample=config.get("resample", True),
+        )
+        for ticker, data in all_data.items():
+            self.tickers[ticker] = self._track(data)
+
+    def poll(self) -> list[str]:
+        """Fetch the trailing bars and return the tickers whose data changed."""
+        config = self.config
+        start_date, end_date = self._fetch_window()
+        changed = []
+        # Polls fetch only a few bars, so bypass the disk cache.
+        for ticker, fetched in iter_fetch_data(
+            list(self.tickers),
+            start_date,
+            end_date,
+            config["interval"],
+            config["data_source"],
+            config.get("max_workers", 4),
+            config.get("api_key"),
+            cache=False,
+            av_datatype=config.get("av_datatype", "json"),
+        ):
+            state = self.tickers[ticker]
+            bars = self._changed_bars(state.data, fetched)
+            if bars.empty:
+                continue
+            if state.data.empty:
+                self.tickers[ticker] = self._track(bars)
+            else:
+                self._apply(state, bars)
+            changed.append(ticker)
+        return changed
+
+    def render(self, tickers: list[str]) -> None:
+        """Re-save plots for the given tickers."""
+        config = self.config
+        if config["multi_plot"]:
+            all_data = {t: s.data for t, s in self.tickers.items()}
+            plot_multi(
+                data=all_data,
+                indicators=run_multi_ticker_indicators(
+                    all_data,
+                    config["indicators"],
+                    config["column"],
+                    config.get("normalize", False),
+                    engine=config.get("engine", "pandas"),
+                ),
+                column=config["column"],
+                save=True,
+                save_dir=config.get("save_dir"),
+                save_format=config.get("save_format", "png"),
+                save_dpi=config.get("save_dpi"),
+                normalize=config.get("normalize", False),
+                log_scale=config.get("log_scale", False),
+                interval=config["interval"],
+                decimate=config.get("decimate", True),
+                max_points=config.get("max_points"),
+            )
+            return
+
+        for ticker in tickers:
+            state = self.tickers[ticker]
+            if state.data.empty:
+                continue
+            plot_data(
+                state.data,
+                {t.key: (t.result, t.params) for t in state.indicators},
+                config["column"],
+                ticker,
+                plot_style=config.get("plot_style"),
+                color_scheme=config.get("color_scheme"),
+                up_color=config.get("up_color"),
+                down_color=config.get("down_color"),
+                save=True,
+                save_dir=config.get("save_dir"),
+                save_format=config.get("save_format", "png"),
+                save_dpi=config.get("save_dpi"),
+                interval=config["interval"],
+                start_date=config["start_date"],
+                end_date=config["end_date"],
+                decimate=config.get("decimate", True),
+                max_points=config.get("max_points"),
+            )
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """Load, render everything once, then poll until interrupted."""
+        # Watch mode always saves; never open interactive windows.
+        matplotlib.use("Agg")
+        configure_rate_limits(
+            self.config.get("shared_rate_limit", False), self.config.get("cache_dir")
+        )
+        self.load()
+        self.render(list(self.tickers))
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            time.sleep(self.poll_interval)
+            polls += 1
+            try:
+                changed = self.poll()
+            except DataSourceError as e:
+                logger.warning("Poll failed: %s", e)
+                continue
+            if changed:
+                logger.info("New data for %s", ", ".join(changed))
+                self.render(changed)
+            else:
+                logger.info("No new bars")
@@ -1,14 +1,37 @@
+import asyncio
 import time
 import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 import pandas as pd
+from stonkzilla.data_sources.av_parser import loads, parse_csv, parse_json_series
 from stonkzilla.data_sources.base_source import BaseSource
+from stonkzilla.data_sources.rate_limiter import backoff_delay, key_id
 from stonkzilla.cli.exceptions import DataSourceError
+from stonkzilla.cli.profiling import profiler
 
 logger = logging.getLogger("market-indicator-cli")
 
 
+def new_session(pool_size: int) -> requests.Session:
+    """
+    Session with a keep-alive connection pool for a single host and
+    compressed responses. Retries are handled by the caller.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+    )
+    return session
+
+
 class AlphavantageSource(BaseSource):
     """
     Data source implementation using alpha vantage API
@@ -16,17 +39,56 @@ class AlphavantageSource(BaseSource):
 
     BASE_URL = "https://www.alphavantage.co/query"
     MAX_RETRIES = 3
-    BACKOFF_FACTOR = 2
+    # Base of the jittered exponential backoff between retries, in seconds.
+    BACKOFF_BASE = 1.0
+    # Free tier allows 5 requests per minute.
+    RATE_LIMIT_CALLS = 5
+    RATE_LIMIT_PERIOD = 60.0
+    END_INCLUSIVE = True
+    # Tickers fetched together by fetch_many, with at most MAX_IN_FLIGHT
+    # requests open at once; the rate limiter still spaces them out.
+    BATCH_SIZE = 25
+    MAX_IN_FLIGHT = 5
+    POOL_SIZE = 8
+    TIMEOUT = (5, 20)
+    # Responses kept for conditional requests, least recently used evicted.
+    MAX_VALIDATORS = 32
 
-    def __init__(self, api_key: str = None) -> None:
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: Optional[str] = None,
+        datatype: str = "json",
+    ) -> None:
         """
         Initialize AlphaVantage source with API key.
+        datatype selects the response format, "json" or "csv".
         """
         self.api_key = api_key
         if not self.api_key:
             raise ValueError(
                 "AlphaVantage API key is required. Set it via constructor or environment variable."
             )
+        if datatype not in ("json", "csv"):
+            raise ValueError(f"Unsupported datatype: {datatype}. Use json or csv.")
+        self.base_url = base_url or self.BASE_URL
+        self.datatype = datatype
+        self.session = new_session(self.POOL_SIZE)
+        # Validators (ETag/Last-Modified) and body of the last response per
+        # request, for conditional requests; an LRU of MAX_VALIDATORS entries.
+        self._validators: OrderedDict[tuple, tuple[dict[str, str], dict | str]] = (
+            OrderedDict()
+        )
+        self._validators_lock = threading.Lock()
+
+    @property
+    def rate_limit_key(self) -> str:
+        """Quotas are per API key."""
+        return f"{self.name}:{key_id(self.api_key)}"
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
 
     def _map_interval(self, interval: str):
         interval_map = {
@@ -45,45 +107,140 @@ class AlphavantageSource(BaseSource):
             )
         return interval_map[interval]
 
-    def _request(self, params: dict) -> dict:
+    @staticmethod
+    def _cache_key(params: dict) -> tuple:
+        return tuple(sorted((k, v) for k, v in params.items() if k != "apikey"))
+
+    def _get(self, params: dict) -> dict | str:
+        """
+        One GET over the pooled session. Sends the validators of the previous
+        response for the same query and reuses its body on 304 Not Modified.
+        CSV payloads are returned as text; errors arrive as JSON either way.
+        """
+        key = self._cache_key(params)
+        with self._validators_lock:
+            previous = self._validators.get(key)
+            if previous is not None:
+                self._validators.move_to_end(key)
+        headers = {}
+        if previous is not None:
+            validators = previous[0]
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        with profiler.span("http", symbol=params.get("symbol")):
+            response = self.session.get(
+                self.base_url, params=params, headers=headers, timeout=self.TIMEOUT
+            )
+        if response.status_code == 304 and previous is not None:
+            logger.info("Not modified: %s", params.get("symbol"))
+            return previous[1]
+        response.raise_for_status()
+        content = response.content
+        if params.get("datatype") == "csv" and not content.lstrip().startswith(b"{"):
+            data = response.text
+        else:
+            data = loads(content)
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        usable = isinstance(data, str) or (
+            isinstance(data, dict) and not data.keys() & {"Error Message", "Note"}
+        )
+        if validators and usable:
+            with self._validators_lock:
+                self._validators[key] = (validators, data)
+                self._validators.move_to_end(key)
+                while len(self._validators) > self.MAX_VALIDATORS:
+                    self._validators.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _check(data: dict | str) -> Optional[str]:
+        """
+        Raise on API errors; return the rate limit note when the request
+        should be retried, None when the payload is usable.
+        """
+        if isinstance(data, str):
+            return None
+        if "Error Message" in data:
+            raise DataSourceError(
+                f"Alpha Vantage API error: {data["Error Message"]}"
+            )
+        return data.get("Note")
+
+    def _throttled(self) -> None:
+        """
+        The API answered with a rate limit note: hold back every caller of
+        this key for one period, plus jitter, before the next slot.
+        """
+        self.rate_limiter.penalize(
+            self.RATE_LIMIT_PERIOD + backoff_delay(1, self.BACKOFF_BASE)
+        )
+
+    def _request(self, params: dict) -> dict | str:
         """Internal: perform HTTP request with retries and backoff."""
         for attempt in range(1, self.MAX_RETRIES + 1):
+            self.throttle()
             try:
-                response = requests.get(self.BASE_URL, params=params, timeout=(5, 20))
-                response.raise_for_status()
-                data = response.json()
+                data = self._get(params)
             except RequestException as e:
                 logger.warning("HTTP error on attempt %d: %s", attempt, e)
                 if attempt == self.MAX_RETRIES:
                     raise DataSourceError(
                         "Network error contacting Alpha Vantage"
                     ) from e
-                time.sleep(self.BACKOFF_FACTOR ** (attempt - 1))
+                time.sleep(backoff_delay(attempt, self.BACKOFF_BASE))
+                continue
             except ValueError as e:
                 raise DataSourceError("Invalid JSON in Alpha Vantage response") from e
 
-            if "Error Message" in data:
-                raise DataSourceError(
-                    f"Alpha Vantage API error: {data["Error Message"]}"
-                )
-            if "Note" in data:
-                logger.info("Rate limit reached: %s", data["Note"])
+            note = self._check(data)
+            if note:
+                logger.info("Rate limit reached: %s", note)
                 if attempt == self.MAX_RETRIES:
-                    raise DataSourceError(f"Rate limit exceeded: {data["Note"]}")
-                time.sleep(self.BACKOFF_FACTOR ** (attempt - 1))
+                    raise DataSourceError(f"Rate limit exceeded: {note}")
+                self._throttled()
                 continue
-            print(data)
             return data
         raise DataSourceError("Exceeded retries without success")
 
-    def fetch_data(
-        self, ticker: str, start_date: str, end_date: str, interval: str
-    ) -> pd.DataFrame:
-        """Fetch data using alphavantage."""
-        print(
-            f"Fetching data for {ticker} from {start_date} to {end_date} using AlphaVantage"
-        )
+    async def _request_async(self, params: dict) -> dict | str:
+        """
+        Async counterpart of _request: waits for rate limit slots and backoff
+        without blocking the loop, running the pooled request in a thread.
+        """
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            await self.throttle_async()
+            try:
+                data = await asyncio.to_thread(self._get, params)
+            except RequestException as e:
+                logger.warning("HTTP error on attempt %d: %s", attempt, e)
+                if attempt == self.MAX_RETRIES:
+                    raise DataSourceError(
+                        "Network error contacting Alpha Vantage"
+                    ) from e
+                await asyncio.sleep(backoff_delay(attempt, self.BACKOFF_BASE))
+                continue
+            except ValueError as e:
+                raise DataSourceError("Invalid JSON in Alpha Vantage response") from e
+
+            note = self._check(data)
+            if note:
+                logger.info("Rate limit reached: %s", note)
+                if attempt == self.MAX_RETRIES:
+                    raise DataSourceError(f"Rate limit exceeded: {note}")
+                self._throttled()
+                continue
+            return data
+        raise DataSourceError("Exceeded retries without success")
 
+    def _query(self, ticker: str, interval: str) -> tuple[dict[str, Any], str]:
+        """Request params and the time series key of the response."""
         av_interval = self._map_interval(interval)
 
         if av_interval in ["1min", "5min", "15min", "30min", "60min"]:
@@ -93,6 +250,7 @@ class AlphavantageSource(BaseSource):
                 "symbol": ticker,
                 "interval": av_interval,
                 "outputsize": "full",
+                "datatype": self.datatype,
                 "apikey": self.api_key,
             }
             time_series_key = f"Time Series ({av_interval})"
@@ -107,53 +265,84 @@ class AlphavantageSource(BaseSource):
                 "function": function,
                 "symbol": ticker,
                 "outputsize": "full",
+                "datatype": self.datatype,
                 "apikey": self.api_key,
             }
             time_series_key = f"Time Series ({function.split('_')[-1].capitalize()})"
+        return params, time_series_key
 
-        try:
-            data = self._request(params)
-        except DataSourceError:
-            raise
-        except Exception as e:
-            raise DataSourceError("Unexpected error in AlphaVantage")
-
+    def _parse(
+        self, data: dict | str, time_series_key: str, start_date: str, end_date: str
+    ) -> pd.DataFrame:
+        if isinstance(data, str):
+            with profiler.span("parse"):
+                return parse_csv(data, start_date, end_date)
         if time_series_key not in data:
             available_keys = list(data.keys())
             raise DataSourceError(
                 f"Expected key '{time_series_key}' not found in response. Available keys: {available_keys}"
             )
+        with profiler.span("parse"):
+            return parse_json_series(data[time_series_key], start_date, end_date)
 
-        time_series = data[time_series_key]
-        df = pd.DataFrame.from_dict(time_series, orient="index")
-
-        df.columns = [col.split(". ")[1] if ". " in col else col for col in df.columns]
-        df.rename(
-            columns={
-                "open": "Open",
-                "high": "High",
-                "low": "Low",
-                "close": "Close",
-                "volume": "Volume",
-            },
-            inplace=True,
+    def fetch_data(
+        self, ticker: str, start_date: str, end_date: str, interval: str
+    ) -> pd.DataFrame:
+        """Fetch data using alphavantage."""
+        print(
+            f"Fetching data for {ticker} from {start_date} to {end_date} using AlphaVantage"
         )
+        params, time_series_key = self._query(ticker, interval)
+        try:
+            data = self._request(params)
+        except DataSourceError:
+            raise
+        except Exception as e:
+            raise DataSourceError("Unexpected error in AlphaVantage") from e
+        return self._parse(data, time_series_key, start_date, end_date)
 
-        for col in ["Open", "High", "Low", "Close"]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col])
+    async def fetch_data_async(
+        self, ticker: str, start_date: str, end_date: str, interval: str
+    ) -> pd.DataFrame:
+        """Async variant of fetch_data."""
+        print(
+            f"Fetching data for {ticker} from {start_date} to {end_date} using AlphaVantage"
+        )
+        params, time_series_key = self._query(ticker, interval)
+        try:
+            data = await self._request_async(params)
+        except DataSourceError:
+            raise
+        except Exception as e:
+            raise DataSourceError("Unexpected error in AlphaVantage") from e
+        return self._parse(data, time_series_key, start_date, end_date)
 
-        if "Volume" in df.columns:
-            df["Volume"] = pd.to_numeric(df["Volume"])
+    async def fetch_many_async(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch several tickers concurrently, at most MAX_IN_FLIGHT at a time.
+        Tickers that could not be fetched map to an empty DataFrame.
+        """
+        in_flight = asyncio.Semaphore(self.MAX_IN_FLIGHT)
 
-        df.index = pd.to_datetime(df.index)
-        df.sort_index(inplace=True)
+        async def fetch(ticker: str) -> pd.DataFrame:
+            async with in_flight:
+                try:
+                    return await self.fetch_data_async(
+                        ticker, start_date, end_date, interval
+                    )
+                except DataSourceError as e:
+                    logger.warning("Fetching %s failed: %s", ticker, e)
+                    return pd.DataFrame()
 
-        if start_date:
-            start_date = pd.to_datetime(start_date)
-            df = df[df.index >= start_date]
-        if end_date:
-            end_date = pd.to_datetime(end_date)
-            df = df[df.index <= end_date]
+        frames = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+        return dict(zip(tickers, frames))
 
-        return df
+    def fetch_many(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """Fetch a batch of tickers with fetch_many_async on a private event loop."""
+        return asyncio.run(
+            self.fetch_many_async(tickers, start_date, end_date, interval)
+        )
@@ -0,0 +1,130 @@
+"""
+Fast parsing of Alpha Vantage time series payloads.
+
+Bars are filtered to the requested range on their ISO timestamp strings
+before anything is converted, then the kept rows go straight into typed
+NumPy arrays. JSON is decoded with orjson when it is installed.
+"""
+
+import io
+import json
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PRICE_FIELDS = ("open", "high", "low", "close")
+FIELDS = (*PRICE_FIELDS, "volume")
+
+
+def loads(content: bytes | str) -> Any:
+    """Decode a JSON payload, with orjson if available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _bound(value: Optional[str], width: int) -> Optional[str]:
+    """Format a date bound like the payload's timestamps, for string comparison."""
+    if not value:
+        return None
+    fmt = "%Y-%m-%d" if width == 10 else "%Y-%m-%d %H:%M:%S"
+    return pd.Timestamp(value).strftime(fmt)
+
+
+def _in_range(
+    stamps: list[str], start_date: Optional[str], end_date: Optional[str]
+) -> list[int]:
+    """Positions of the timestamps inside [start_date, end_date]."""
+    if not stamps:
+        return []
+    width = len(stamps[0])
+    start, end = _bound(start_date, width), _bound(end_date, width)
+    return [
+        i
+        for i, stamp in enumerate(stamps)
+        if (start is None or stamp >= start) and (end is None or stamp <= end)
+    ]
+
+
+def _empty() -> pd.DataFrame:
+    return pd.DataFrame(
+        columns=[field.capitalize() for field in FIELDS], index=pd.DatetimeIndex([])
+    )
+
+
+def _frame(stamps: list[str], columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    """Build the result sorted by time, oldest first."""
+    index = pd.DatetimeIndex(np.array(stamps, dtype="datetime64[ns]"))
+    df = pd.DataFrame(columns, index=index)
+    if not index.is_monotonic_increasing:
+        df = df.iloc[np.argsort(index.asi8, kind="stable")]
+    return df
+
+
+def _columns(fields: dict[str, list[str]]) -> dict[str, np.ndarray]:
+    columns = {}
+    for field in FIELDS:
+        if field in fields:
+            dtype = np.int64 if field == "volume" else np.float64
+            try:
+                columns[field.capitalize()] = np.array(fields[field], dtype=dtype)
+            except ValueError:
+                columns[field.capitalize()] = np.array(fields[field], dtype=np.float64)
+    return columns
+
+
+def parse_json_series(
+    series: dict[str, dict[str, str]],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Convert a "Time Series (...)" mapping of timestamp -> {"1. open": ...}
+    into an OHLCV frame restricted to [start_date, end_date].
+    """
+    stamps = list(series)
+    keep = _in_range(stamps, start_date, end_date)
+    if not keep:
+        return _empty()
+    kept = [stamps[i] for i in keep]
+    first = series[kept[0]]
+    # "1. open" -> "open"
+    names = {key: key.split(". ", 1)[-1] for key in first}
+    fields = {
+        name: [series[stamp][key] for stamp in kept] for key, name in names.items()
+    }
+    return _frame(kept, _columns(fields))
+
+
+def parse_csv(
+    text: str, start_date: Optional[str] = None, end_date: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Convert a datatype=csv payload (timestamp,open,high,low,close,volume)
+    into an OHLCV frame restricted to [start_date, end_date].
+    """
+    header, _, body = text.partition("\n")
+    names = [name.strip() for name in header.split(",")]
+    rows = [row for row in body.splitlines() if row]
+    stamps = [row[: row.find(",")] for row in rows]
+    keep = _in_range(stamps, start_date, end_date)
+    if not keep:
+        return _empty()
+    table = pd.read_csv(
+        io.StringIO("\n".join(rows[i] for i in keep)),
+        header=None,
+        names=names,
+        index_col=0,
+        dtype={name: np.float64 for name in PRICE_FIELDS if name in names},
+    )
+    columns = {
+        field.capitalize(): table[field].to_numpy()
+        for field in FIELDS
+        if field in table.columns
+    }
+    return _frame([stamps[i] for i in keep], columns)
@@ -1,5 +1,12 @@
+import logging
 from abc import ABC, abstractmethod
 import pandas as pd
+from stonkzilla.data_sources.rate_limiter import RateLimiter, get_rate_limiter
+from stonkzilla.cli.exceptions import DataSourceError, NoDataError
+
+logger = logging.getLogger("market-indicator-cli")
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
 
 
 class BaseSource(ABC):
@@ -8,6 +15,43 @@ class BaseSource(ABC):
     All data sources must implement the fetch_data method.
     """
 
+    # Calls allowed per RATE_LIMIT_PERIOD seconds, shared by all instances.
+    RATE_LIMIT_CALLS: int = 1
+    RATE_LIMIT_PERIOD: float = 1.0
+    # Calls that may go out back to back before the rate applies.
+    RATE_LIMIT_BURST: int = 1
+    # Whether end_date is included in the returned rows.
+    END_INCLUSIVE: bool = False
+    # Number of tickers worth grouping into a single fetch_many call.
+    BATCH_SIZE: int = 1
+
+    @property
+    def name(self) -> str:
+        """Name used for rate limiting and cache keys."""
+        return type(self).__name__
+
+    @property
+    def rate_limit_key(self) -> str:
+        """Name of the quota this source draws from."""
+        return self.name
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return get_rate_limiter(
+            self.rate_limit_key,
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD,
+            self.RATE_LIMIT_BURST,
+        )
+
+    def throttle(self) -> None:
+        """Block until the source's rate limit allows another request."""
+        self.rate_limiter.acquire()
+
+    async def throttle_async(self) -> None:
+        """Await the source's rate limit, sharing slots with throttle()."""
+        await self.rate_limiter.acquire_async()
+
     @abstractmethod
     def fetch_data(
         self, ticker: str, start_date: str, end_date: str, interval: str
@@ -20,3 +64,29 @@ class BaseSource(ABC):
         Returns:
             Data frame with stock data
         """
+
+    def fetch_many(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch data for several tickers over the same date range.
+        The default implementation calls fetch_data per ticker; sources with a
+        batch endpoint override it. Tickers that could not be fetched map to an
+        empty DataFrame; tickers without bars in the range map to an empty
+        frame that keeps the OHLCV columns.
+        """
+        results = {}
+        for ticker in tickers:
+            try:
+                results[ticker] = self.fetch_data(
+                    ticker, start_date, end_date, interval
+                )
+            except NoDataError as e:
+                logger.info("No data for %s: %s", ticker, e)
+                results[ticker] = pd.DataFrame(
+                    columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([])
+                )
+            except DataSourceError as e:
+                logger.warning("Fetching %s failed: %s", ticker, e)
+                results[ticker] = pd.DataFrame()
+        return results
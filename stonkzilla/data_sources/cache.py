@@ -0,0 +1,320 @@
+"""Persistent on-disk OHLCV cache with incremental range fill."""
+
+import importlib.util
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Optional
+import pandas as pd
+from stonkzilla.data_sources.base_source import BaseSource
+from stonkzilla.cli.exceptions import DataSourceError, NoDataError
+
+logger = logging.getLogger("market-indicator-cli")
+
+# Parquet needs pyarrow; fall back to pickle files when it is not installed.
+CACHE_FORMAT = "parquet" if importlib.util.find_spec("pyarrow") else "pkl"
+
+BAR_DURATIONS = {
+    "1m": timedelta(minutes=1),
+    "2m": timedelta(minutes=2),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "30m": timedelta(minutes=30),
+    "60m": timedelta(hours=1),
+    "90m": timedelta(minutes=90),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+    "5d": timedelta(days=5),
+    "1wk": timedelta(weeks=1),
+    "1mo": timedelta(days=31),
+    "3mo": timedelta(days=92),
+}
+# How long a provisional (possibly still forming) last bar may be served
+# from the cache before it is fetched again.
+DAILY_STALE_AFTER = timedelta(hours=1)
+
+
+def default_cache_dir() -> str:
+    """Return the per-user cache directory for stonkzilla."""
+    from platformdirs import user_cache_dir
+
+    return user_cache_dir("stonkzilla")
+
+
+def stale_after(interval: str) -> timedelta:
+    """Time after which a provisional last bar must be refreshed."""
+    duration = BAR_DURATIONS.get(interval, timedelta(days=1))
+    return min(duration, DAILY_STALE_AFTER)
+
+
+class OHLCVCache:
+    """
+    Stores OHLCV frames per source/interval/ticker together with the
+    date range they cover, so only missing ranges need to be fetched.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir or default_cache_dir()
+
+    def _base_path(self, source: str, ticker: str, interval: str) -> str:
+        safe_ticker = ticker.replace(os.sep, "_").replace("/", "_")
+        return os.path.join(self.cache_dir, source, interval, safe_ticker)
+
+    def load_meta(
+        self, source: str, ticker: str, interval: str
+    ) -> Optional[dict[str, Any]]:
+        """Load only the metadata (covered range, fetch time) of a cached entry."""
+        base = self._base_path(source, ticker, interval)
+        try:
+            with open(base + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["start"] = pd.Timestamp(meta["start"])
+            meta["end"] = pd.Timestamp(meta["end"])
+            meta["fetched_at"] = datetime.fromisoformat(meta["fetched_at"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", base, e)
+            return None
+        return meta
+
+    def load(
+        self, source: str, ticker: str, interval: str
+    ) -> tuple[Optional[pd.DataFrame], Optional[dict[str, Any]]]:
+        """Load cached data and its metadata, or (None, None) when absent."""
+        meta = self.load_meta(source, ticker, interval)
+        if meta is None:
+            return None, None
+        base = self._base_path(source, ticker, interval)
+        try:
+            if meta.get("format") == "parquet":
+                data = pd.read_parquet(base + ".parquet")
+            else:
+                data = pd.read_pickle(base + ".pkl")
+        except FileNotFoundError:
+            return None, None
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", base, e)
+            return None, None
+        return data, meta
+
+    def store(
+        self,
+        source: str,
+        ticker: str,
+        interval: str,
+        data: pd.DataFrame,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        fetched_at: datetime,
+    ) -> None:
+        """Write data and the covered range, replacing files atomically."""
+        base = self._base_path(source, ticker, interval)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        data_path = f"{base}.{CACHE_FORMAT}"
+        tmp_path = f"{data_path}.{os.getpid()}.tmp"
+        if CACHE_FORMAT == "parquet":
+            data.to_parquet(tmp_path)
+        else:
+            data.to_pickle(tmp_path)
+        os.replace(tmp_path, data_path)
+
+        meta = {
+            "format": "parquet" if CACHE_FORMAT == "parquet" else "pickle",
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "fetched_at": fetched_at.isoformat(),
+        }
+        tmp_meta = f"{base}.json.{os.getpid()}.tmp"
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, base + ".json")
+
+
+class CachedSource(BaseSource):
+    """
+    Wraps a data source with an OHLCVCache.
+    Cached ranges are served locally; only the missing leading or trailing
+    ranges, and a stale provisional last bar, are fetched and merged in.
+    """
+
+    def __init__(self, source: BaseSource, cache: OHLCVCache) -> None:
+        self.source = source
+        self.cache = cache
+        self.END_INCLUSIVE = source.END_INCLUSIVE
+        self.BATCH_SIZE = source.BATCH_SIZE
+
+    @property
+    def name(self) -> str:
+        return self.source.name
+
+    def _slice(
+        self, data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp
+    ) -> pd.DataFrame:
+        if self.END_INCLUSIVE:
+            return data[(data.index >= start) & (data.index <= end)]
+        return data[(data.index >= start) & (data.index < end)]
+
+    def _fetch_range(
+        self, ticker: str, start: pd.Timestamp, end: pd.Timestamp, interval: str
+    ) -> pd.DataFrame:
+        return self.source.fetch_data(
+            ticker, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"), interval
+        )
+
+    def _plan(
+        self, ticker: str, start: pd.Timestamp, end: pd.Timestamp, interval: str
+    ) -> tuple[Optional[pd.DataFrame], Optional[dict[str, Any]], list[tuple]]:
+        """Load the cached entry and work out which ranges must be fetched."""
+        cached, meta = self.cache.load(self.name, ticker, interval)
+        if cached is None:
+            return None, None, [(start, end)]
+        return cached, meta, self._gaps(meta, start, end, interval)
+
+    @staticmethod
+    def _gaps(
+        meta: dict[str, Any], start: pd.Timestamp, end: pd.Timestamp, interval: str
+    ) -> list[tuple]:
+        """Ranges of [start, end] the cached entry does not cover, or covers stale."""
+        cov_start, cov_end = meta["start"], meta["end"]
+        gaps = []
+        if start < cov_start:
+            gaps.append((start, cov_start))
+
+        # Bars from one duration before the last fetch may still have been forming.
+        fetched_at = meta["fetched_at"]
+        provisional_from = pd.Timestamp(
+            fetched_at - BAR_DURATIONS.get(interval, timedelta(days=1))
+        ).normalize()
+        is_stale = datetime.now() - fetched_at > stale_after(interval)
+        if is_stale and provisional_from < cov_end and end > provisional_from:
+            cov_end = max(provisional_from, cov_start)
+        if end > cov_end:
+            gaps.append((cov_end, end))
+        return gaps
+
+    def _merge(
+        self,
+        ticker: str,
+        interval: str,
+        start: pd.Timestamp,
+        end: pd.Timestamp,
+        cached: Optional[pd.DataFrame],
+        meta: Optional[dict[str, Any]],
+        fills: list[tuple[pd.Timestamp, pd.Timestamp, pd.DataFrame]],
+    ) -> pd.DataFrame:
+        """Merge fetched ranges into the cached entry, store it and slice the request."""
+        now = datetime.now()
+        if cached is None:
+            if not fills:
+                raise DataSourceError(f"No data returned for ticker {ticker}")
+            gap_start, gap_end, data = fills[0]
+            if data.empty:
+                # Nothing to cache yet; a first entry must hold some bars.
+                raise DataSourceError(f"No data returned for ticker {ticker}")
+            self.cache.store(
+                self.name, ticker, interval, data, gap_start, gap_end, now
+            )
+            return data
+
+        merged = cached
+        if fills:
+            new_start, new_end = meta["start"], meta["end"]
+            fetched_at = meta["fetched_at"]
+            # Fills without rows still widen the coverage: the source had
+            # no bars there (before the first trade, holidays), so the gap
+            # is known to be empty and is not fetched again.
+            for gap_start, gap_end, _ in fills:
+                if gap_end >= meta["end"]:
+                    fetched_at = now
+                new_start = min(new_start, gap_start)
+                new_end = max(new_end, gap_end)
+
+            # Freshly fetched rows replace provisional cached ones on the same bar.
+            frames = [p for p in [cached] + [f[2] for f in fills] if not p.empty]
+            merged = pd.concat(frames) if frames else cached
+            merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+            self.cache.store(
+                self.name, ticker, interval, merged, new_start, new_end, fetched_at
+            )
+        result = self._slice(merged, start, end)
+        if result.empty:
+            raise DataSourceError(f"No data returned for ticker {ticker}")
+        return result
+
+    def fetch_data(
+        self, ticker: str, start_date: str, end_date: str, interval: str
+    ) -> pd.DataFrame:
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        cached, meta, gaps = self._plan(ticker, start, end, interval)
+        if not gaps:
+            logger.info("Cache hit for %s %s", ticker, interval)
+
+        fills = []
+        for gap_start, gap_end in gaps:
+            try:
+                data = self._fetch_range(ticker, gap_start, gap_end, interval)
+            except NoDataError:
+                if cached is None:
+                    raise
+                # No bars there (before the first trade, holidays): an
+                # empty fill records the gap as covered.
+                data = cached.iloc[:0]
+            except DataSourceError as e:
+                if cached is None:
+                    raise
+                logger.warning(
+                    "Could not fill %s %s..%s: %s", ticker, gap_start, gap_end, e
+                )
+                continue
+            fills.append((gap_start, gap_end, data))
+        return self._merge(ticker, interval, start, end, cached, meta, fills)
+
+    def fetch_many(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Serve cached ranges locally and fetch the missing ones in batches,
+        grouping tickers that miss the same range into one fetch_many call.
+        """
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        plans = {t: self._plan(t, start, end, interval) for t in tickers}
+
+        by_gap: dict[tuple, list[str]] = {}
+        for ticker, (_, _, gaps) in plans.items():
+            for gap in gaps:
+                by_gap.setdefault(gap, []).append(ticker)
+
+        fills: dict[str, list] = {ticker: [] for ticker in tickers}
+        for (gap_start, gap_end), gap_tickers in by_gap.items():
+            fetched = self.source.fetch_many(
+                gap_tickers,
+                gap_start.strftime("%Y-%m-%d"),
+                gap_end.strftime("%Y-%m-%d"),
+                interval,
+            )
+            for ticker in gap_tickers:
+                data = fetched.get(ticker)
+                # Failed tickers come back as a bare DataFrame(); an answer
+                # with no bars in the range keeps its columns.
+                if data is None or data.columns.empty:
+                    if plans[ticker][0] is not None:
+                        logger.warning(
+                            "Could not fill %s %s..%s", ticker, gap_start, gap_end
+                        )
+                    continue
+                fills[ticker].append((gap_start, gap_end, data))
+
+        results = {}
+        for ticker, (cached, meta, _) in plans.items():
+            try:
+                results[ticker] = self._merge(
+                    ticker, interval, start, end, cached, meta, fills[ticker]
+                )
+            except DataSourceError as e:
+                logger.warning("Fetching %s failed: %s", ticker, e)
+                results[ticker] = pd.DataFrame()
+        return results
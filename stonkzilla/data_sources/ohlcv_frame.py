@@ -0,0 +1,108 @@
+"""Compact columnar container for OHLCV data."""
+
+from typing import Iterator, Mapping, Optional
+import numpy as np
+import pandas as pd
+
+
+class OHLCVFrame:
+    """
+    One contiguous float64 array per column plus an int64 (nanosecond)
+    datetime index. Duck-types the parts of a DataFrame indicators use:
+    `columns`, `index`, `in`, `len`, `empty` and `frame[column]`, which
+    returns a read-only Series view over the column array without copying.
+    Convert with to_pandas() only where a real DataFrame is needed.
+    """
+
+    __slots__ = ("_index", "_columns", "_tz", "_index_name", "_pd_index")
+
+    def __init__(
+        self,
+        index: np.ndarray,
+        columns: Mapping[str, np.ndarray],
+        tz: Optional[str] = None,
+        index_name: Optional[str] = None,
+    ) -> None:
+        self._index = np.ascontiguousarray(index, dtype=np.int64)
+        self._columns: dict[str, np.ndarray] = {}
+        for name, values in columns.items():
+            array = np.ascontiguousarray(values, dtype=np.float64)
+            if array.shape != self._index.shape:
+                raise ValueError(
+                    f"Column {name!r} has {len(array)} values for {len(self._index)} rows"
+                )
+            array.flags.writeable = False
+            self._columns[name] = array
+        self._tz = tz
+        self._index_name = index_name
+        self._pd_index: Optional[pd.DatetimeIndex] = None
+
+    @classmethod
+    def from_pandas(
+        cls, data: pd.DataFrame, columns: Optional[list[str]] = None
+    ) -> "OHLCVFrame":
+        """
+        Build from a DataFrame with a datetime index. Float64 columns are
+        shared with the DataFrame's blocks, other numeric columns are cast.
+        By default all numeric columns are kept.
+        """
+        if columns is None:
+            columns = [
+                c for c in data.columns if pd.api.types.is_numeric_dtype(data[c])
+            ]
+        index = pd.DatetimeIndex(data.index)
+        frame = cls(
+            index.asi8,
+            {c: data[c].to_numpy(dtype=np.float64, copy=False) for c in columns},
+            tz=str(index.tz) if index.tz is not None else None,
+            index_name=data.index.name,
+        )
+        # Reuse the existing index (keeps its freq) instead of rebuilding it.
+        frame._pd_index = index
+        return frame
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        if self._pd_index is None:
+            index = pd.DatetimeIndex(
+                self._index.view("datetime64[ns]"), name=self._index_name
+            )
+            if self._tz is not None:
+                index = index.tz_localize("UTC").tz_convert(self._tz)
+            self._pd_index = index
+        return self._pd_index
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def empty(self) -> bool:
+        return len(self._index) == 0 or not self._columns
+
+    @property
+    def nbytes(self) -> int:
+        return self._index.nbytes + sum(a.nbytes for a in self._columns.values())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __getitem__(self, name: str) -> pd.Series:
+        try:
+            values = self._columns[name]
+        except KeyError:
+            raise KeyError(name) from None
+        return pd.Series(values, index=self.index, name=name, copy=False)
+
+    def array(self, name: str) -> np.ndarray:
+        """The raw read-only column array."""
+        return self._columns[name]
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.DataFrame(dict(self._columns), index=self.index)
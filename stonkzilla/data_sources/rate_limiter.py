@@ -0,0 +1,173 @@
+"""
+Rate limiting shared by the data sources.
+
+Each source (and API key) gets a token bucket: `calls` tokens refill per
+`period` seconds and up to `burst` can be spent at once. Buckets live in
+the process by default; with use_shared_state() they are kept in a SQLite
+file instead, so several stonkzilla processes on one host share a quota.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Optional
+
+logger = logging.getLogger("market-indicator-cli")
+
+_limiters: dict[str, "RateLimiter"] = {}
+_limiters_lock = threading.Lock()
+_shared_path: Optional[str] = None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Full-jitter exponential backoff for the given 1-based attempt: a random
+    delay up to base * 2**(attempt - 1), capped. Concurrent retries spread
+    out instead of hitting the API again in lockstep.
+    """
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+def key_id(api_key: Optional[str]) -> str:
+    """Short stable id of an API key, for limiter names that must not leak it."""
+    if not api_key:
+        return "anonymous"
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `calls` acquisitions per `period`
+    seconds on average, with bursts of up to `burst` calls.
+
+    Implemented as a virtual schedule (GCRA): `_next_slot` is when the
+    next call would go out if calls were evenly spaced; each reservation
+    pushes it by one interval and may start up to burst - 1 intervals early.
+    """
+
+    def __init__(self, calls: int, period: float = 1.0, burst: int = 1) -> None:
+        """Initialize the limiter with the allowed calls per period."""
+        if calls <= 0 or period <= 0 or burst <= 0:
+            raise ValueError("Rate limit calls, period and burst must be positive.")
+        self.interval = period / calls
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _claim(self, now: float, next_slot: float) -> tuple[float, float]:
+        """Return (new next_slot, seconds to wait) for one reservation."""
+        slot = max(now, next_slot)
+        start = max(now, slot - (self.burst - 1) * self.interval)
+        return slot + self.interval, start - now
+
+    def reserve(self) -> float:
+        """Claim the next call slot and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._next_slot, wait = self._claim(now, self._next_slot)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Hold back every caller for seconds, e.g. after the API throttled us."""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+    def acquire(self) -> None:
+        """Block until the next call slot is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait for the next call slot without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket whose state is a row in a SQLite database, updated in an
+    immediate transaction, so every process using the same file draws from
+    one bucket. Uses wall-clock time, which processes on a host share.
+    """
+
+    def __init__(
+        self, path: str, name: str, calls: int, period: float = 1.0, burst: int = 1
+    ) -> None:
+        super().__init__(calls, period, burst)
+        self.path = path
+        self.name = name
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, next_slot REAL NOT NULL)"
+        )
+        return conn
+
+    def _update(self, change) -> float:
+        """Apply change(now, next_slot) -> (next_slot, result) atomically."""
+        with self._lock, closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT next_slot FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                next_slot, result = change(time.time(), row[0] if row else 0.0)
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (name, next_slot) VALUES (?, ?)",
+                    (self.name, next_slot),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def reserve(self) -> float:
+        try:
+            return self._update(self._claim)
+        except sqlite3.Error as e:
+            logger.warning("Shared rate limit state unavailable, using local: %s", e)
+            return super().reserve()
+
+    def penalize(self, seconds: float) -> None:
+        try:
+            self._update(lambda now, slot: (max(slot, now + seconds), 0.0))
+        except sqlite3.Error as e:
+            logger.warning("Shared rate limit state unavailable: %s", e)
+            super().penalize(seconds)
+
+
+def use_shared_state(path: Optional[str]) -> None:
+    """
+    Keep buckets in the SQLite file at path (None: back to per-process).
+    Limiters created before the switch are dropped.
+    """
+    global _shared_path
+    with _limiters_lock:
+        _shared_path = path
+        _limiters.clear()
+
+
+def get_rate_limiter(
+    name: str, calls: int, period: float = 1.0, burst: int = 1
+) -> RateLimiter:
+    """Return the limiter for a source, creating it on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            if _shared_path:
+                limiter = SharedRateLimiter(_shared_path, name, calls, period, burst)
+            else:
+                limiter = RateLimiter(calls, period, burst)
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,214 @@
+"""
+Resampling of OHLCV bars to coarser intervals.
+
+Coarser bars are aggregated from finer ones (first open, max high, min low,
+last close, summed volume). Intraday bins are anchored at the session
+open and never span two sessions; daily and longer bins are built from
+trading days, so no empty overnight or weekend bars appear.
+
+ResamplingSource puts this between the OHLCV cache and the fetch: a
+request is answered from a finer interval that is already cached for the
+whole range before anything is downloaded.
+"""
+
+import logging
+from datetime import date, timedelta
+from typing import Iterable, Optional
+import numpy as np
+import pandas as pd
+from stonkzilla.data_sources.base_source import BaseSource
+from stonkzilla.data_sources.cache import BAR_DURATIONS, CachedSource
+
+logger = logging.getLogger("market-indicator-cli")
+
+AGGREGATIONS = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Adj Close": "last",
+    "Volume": "sum",
+}
+INTRADAY = ("1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h")
+# Coarser intervals each daily-or-longer interval can be aggregated into.
+CALENDAR_TARGETS = {
+    "1d": ("5d", "1wk", "1mo", "3mo"),
+    "1mo": ("3mo",),
+}
+# How far back yfinance serves each intraday interval.
+INTRADAY_HISTORY = {
+    "1m": timedelta(days=30),
+    "60m": timedelta(days=730),
+    "1h": timedelta(days=730),
+}
+DEFAULT_INTRADAY_HISTORY = timedelta(days=60)
+
+
+def can_resample(source: str, target: str) -> bool:
+    """Whether bars of the target interval can be built from source bars."""
+    if source == target:
+        return False
+    if source in INTRADAY:
+        if target not in INTRADAY:
+            return True
+        step, span = BAR_DURATIONS[source], BAR_DURATIONS[target]
+        return span >= step and span % step == timedelta(0)
+    return target in CALENDAR_TARGETS.get(source, ())
+
+
+def history_start(interval: str, today: Optional[date] = None) -> Optional[date]:
+    """Earliest date the interval can be fetched for; None when unlimited."""
+    if interval not in INTRADAY:
+        return None
+    today = today or date.today()
+    return today - INTRADAY_HISTORY.get(interval, DEFAULT_INTRADAY_HISTORY)
+
+
+def base_interval(
+    target: str, candidates: Iterable[str], start: date | str
+) -> str:
+    """
+    The interval to fetch so the target can be derived from it: the
+    finest candidate that can be resampled into the target and whose
+    history reaches back to start, or the target itself.
+    """
+    start = pd.Timestamp(start).date()
+    usable = [
+        c
+        for c in candidates
+        if can_resample(c, target)
+        and (history_start(c) is None or history_start(c) <= start)
+    ]
+    if not usable:
+        return target
+    return min(usable, key=lambda c: BAR_DURATIONS[c])
+
+
+def _session_bins(index: pd.DatetimeIndex, step: timedelta) -> np.ndarray:
+    """Start of each bar's bin, counted in steps from its session's open."""
+    stamps = index.asi8
+    days = index.normalize().asi8
+    # The session opens at the time of day most sessions start with.
+    day_starts, first = np.unique(days, return_index=True)
+    opens = stamps[first] - day_starts
+    values, counts = np.unique(opens, return_counts=True)
+    session_open = values[np.argmax(counts)]
+    step_ns = pd.Timedelta(step).value
+    offset = stamps - days - session_open
+    return days + session_open + (offset // step_ns) * step_ns
+
+
+def _calendar_bins(index: pd.DatetimeIndex, interval: str) -> np.ndarray:
+    days = index.normalize()
+    if interval == "1d":
+        return days.asi8
+    if interval == "1wk":
+        return (days - pd.to_timedelta(days.dayofweek, unit="D")).asi8
+    if interval == "1mo":
+        return days.to_period("M").to_timestamp().asi8
+    if interval == "3mo":
+        return days.to_period("Q").to_timestamp().asi8
+    if interval == "5d":
+        # Runs of five trading days, starting from the first one.
+        sessions, number = np.unique(days.asi8, return_inverse=True)
+        return sessions[(number // 5) * 5]
+    raise ValueError(f"Cannot resample to interval {interval}")
+
+
+def resample_ohlcv(data: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Aggregate bars into the given coarser interval, labelled by bin start."""
+    columns = [c for c in data.columns if c in AGGREGATIONS]
+    if data.empty:
+        return data[columns]
+    unit = data.index.unit
+    # The bin arithmetic below works on nanosecond integers.
+    data = data.sort_index()
+    data = data.set_axis(data.index.as_unit("ns"))
+    if interval in INTRADAY:
+        bins = _session_bins(data.index, BAR_DURATIONS[interval])
+    else:
+        bins = _calendar_bins(data.index, interval)
+    keys = pd.DatetimeIndex(bins.astype("datetime64[ns]"), name=data.index.name)
+    keys = keys.as_unit(unit)
+    result = data[columns].groupby(keys, sort=True).agg(
+        {c: AGGREGATIONS[c] for c in columns}
+    )
+    result.index.name = data.index.name
+    return result
+
+
+class ResamplingSource(BaseSource):
+    """
+    Wraps a CachedSource: a ticker whose requested range is fully and
+    freshly cached at a finer interval is resampled from it locally, the
+    rest are fetched (and cached) as usual.
+    """
+
+    def __init__(self, source: CachedSource) -> None:
+        self.source = source
+        self.cache = source.cache
+        self.END_INCLUSIVE = source.END_INCLUSIVE
+        self.BATCH_SIZE = source.BATCH_SIZE
+
+    @property
+    def name(self) -> str:
+        return self.source.name
+
+    def _fresh(
+        self, ticker: str, start: pd.Timestamp, end: pd.Timestamp, interval: str
+    ) -> bool:
+        """Whether the cache holds the whole range at interval, up to date."""
+        meta = self.cache.load_meta(self.name, ticker, interval)
+        return meta is not None and not self.source._gaps(meta, start, end, interval)
+
+    def _derive(
+        self, ticker: str, start: pd.Timestamp, end: pd.Timestamp, interval: str
+    ) -> Optional[pd.DataFrame]:
+        """Resample from the coarsest finer interval cached for the range, if any."""
+        if self._fresh(ticker, start, end, interval):
+            # The interval itself is cached; the wrapped source serves it.
+            return None
+        finer = sorted(
+            (c for c in BAR_DURATIONS if can_resample(c, interval)),
+            key=lambda c: BAR_DURATIONS[c],
+            reverse=True,
+        )
+        for candidate in finer:
+            if not self._fresh(ticker, start, end, candidate):
+                continue
+            cached, _ = self.cache.load(self.name, ticker, candidate)
+            if cached is None:
+                continue
+            data = self.source._slice(cached, start, end)
+            if data.empty:
+                continue
+            logger.info("Resampling %s %s from cached %s", ticker, interval, candidate)
+            return resample_ohlcv(data, interval)
+        return None
+
+    def fetch_data(
+        self, ticker: str, start_date: str, end_date: str, interval: str
+    ) -> pd.DataFrame:
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        derived = self._derive(ticker, start, end, interval)
+        if derived is not None:
+            return derived
+        return self.source.fetch_data(ticker, start_date, end_date, interval)
+
+    def fetch_many(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        results = {}
+        for ticker in tickers:
+            derived = self._derive(ticker, start, end, interval)
+            if derived is not None:
+                results[ticker] = derived
+        missing = [ticker for ticker in tickers if ticker not in results]
+        if missing:
+            results.update(
+                self.source.fetch_many(missing, start_date, end_date, interval)
+            )
+        return {ticker: results[ticker] for ticker in tickers}
@@ -0,0 +1,124 @@
+"""Local registry of validated ticker symbols."""
+
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import timedelta
+from typing import Optional
+
+logger = logging.getLogger("market-indicator-cli")
+
+_NETWORK_ERRORS = ("rate", "limited", "resolve", "connect", "timed out", "timeout")
+
+
+def check_ticker(ticker: str) -> Optional[bool]:
+    """
+    Ask yfinance whether a ticker exists.
+    Returns True/False, or None when the answer could not be obtained
+    (rate limiting or network problems).
+    """
+    import yfinance as yf
+    from stonkzilla.data_sources.yfinance import YfinanceSource
+
+    # Validation draws from the same quota as yfinance downloads.
+    YfinanceSource().throttle()
+    try:
+        info = yf.Ticker(ticker).info
+    except Exception as e:
+        error_msg = str(e).lower()
+        if "404" in error_msg or "not found" in error_msg:
+            return False
+        if any(marker in error_msg for marker in _NETWORK_ERRORS):
+            logger.warning("Could not validate %s: %s", ticker, e)
+            return None
+        logger.debug("Unexpected error validating %s: %s", ticker, e)
+        return False
+    return info.get("regularMarketPrice") is not None
+
+
+class SymbolRegistry:
+    """
+    SQLite index of tickers with their last validation result and time.
+    Entries younger than their TTL are trusted without touching the network.
+    """
+
+    VALID_TTL = timedelta(days=7)
+    INVALID_TTL = timedelta(days=1)
+    MAX_WORKERS = 8
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is None:
+            from stonkzilla.data_sources.cache import default_cache_dir
+
+            path = os.path.join(default_cache_dir(), "symbols.sqlite3")
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS symbols ("
+            "ticker TEXT PRIMARY KEY, valid INTEGER NOT NULL, validated_at REAL NOT NULL)"
+        )
+        return conn
+
+    def lookup(self, tickers: list[str]) -> dict[str, tuple[bool, float]]:
+        """Return {ticker: (valid, validated_at)} for the known tickers."""
+        placeholders = ",".join("?" * len(tickers))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT ticker, valid, validated_at FROM symbols WHERE ticker IN ({placeholders})",
+                tickers,
+            ).fetchall()
+        return {ticker: (bool(valid), ts) for ticker, valid, ts in rows}
+
+    def record(self, verdicts: dict[str, bool]) -> None:
+        """Store validation results stamped with the current time."""
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO symbols (ticker, valid, validated_at) VALUES (?, ?, ?)",
+                [(ticker, int(valid), now) for ticker, valid in verdicts.items()],
+            )
+
+    def _is_fresh(self, valid: bool, validated_at: float) -> bool:
+        ttl = self.VALID_TTL if valid else self.INVALID_TTL
+        return time.time() - validated_at < ttl.total_seconds()
+
+    def validate(self, tickers: list[str]) -> dict[str, Optional[bool]]:
+        """
+        Validate tickers, revalidating only unknown or stale entries concurrently.
+        Stale entries keep their last verdict when the network is unavailable;
+        unknown tickers that cannot be checked map to None.
+        """
+        try:
+            known = self.lookup(tickers)
+        except sqlite3.Error as e:
+            logger.warning("Symbol registry unavailable: %s", e)
+            known = {}
+        verdicts = {
+            ticker: known[ticker][0]
+            for ticker in tickers
+            if ticker in known and self._is_fresh(*known[ticker])
+        }
+        pending = [ticker for ticker in tickers if ticker not in verdicts]
+        if not pending:
+            return verdicts
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            checked = dict(zip(pending, pool.map(check_ticker, pending)))
+
+        fresh = {ticker: valid for ticker, valid in checked.items() if valid is not None}
+        if fresh:
+            try:
+                self.record(fresh)
+            except sqlite3.Error as e:
+                logger.warning("Could not update symbol registry: %s", e)
+        for ticker, valid in checked.items():
+            if valid is None and ticker in known:
+                valid = known[ticker][0]
+            verdicts[ticker] = valid
+        return verdicts
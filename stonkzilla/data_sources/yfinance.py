@@ -1,7 +1,17 @@
+import logging
+import threading
 import yfinance as yf
 import pandas as pd
+from yfinance.exceptions import YFPricesMissingError
 from stonkzilla.data_sources.base_source import BaseSource
-from stonkzilla.cli.exceptions import DataSourceError
+from stonkzilla.cli.exceptions import DataSourceError, NoDataError
+from stonkzilla.cli.profiling import profiler
+
+logger = logging.getLogger("market-indicator-cli")
+
+# yf.download resets module-level globals on every call, so batch downloads
+# must not overlap.
+_download_lock = threading.Lock()
 
 
 class YfinanceSource(BaseSource):
@@ -9,6 +19,11 @@ class YfinanceSource(BaseSource):
     Data source implementation using yfinance.
     """
 
+    RATE_LIMIT_CALLS = 2
+    RATE_LIMIT_PERIOD = 1.0
+    RATE_LIMIT_BURST = 2
+    BATCH_SIZE = 50
+
     def fetch_data(
         self, ticker: str, start_date: str, end_date: str, interval: str = "1d"
     ) -> pd.DataFrame:
@@ -16,18 +31,86 @@ class YfinanceSource(BaseSource):
             print(
                 f"Fetching data for {ticker} from {start_date} to {end_date} using yfinance"
             )
-            data = yf.download(
-                tickers=ticker,
-                start=start_date,
-                end=end_date,
-                interval=interval,
-                multi_level_index=False,
-            )
+            self.throttle()
+            # Ticker.history keeps its state per instance, unlike yf.download
+            # which resets module-level globals and is unsafe to call from threads.
+            with profiler.span("http", symbol=ticker):
+                data = yf.Ticker(ticker).history(
+                    start=start_date,
+                    end=end_date,
+                    interval=interval,
+                    actions=False,
+                    raise_errors=True,
+                )
             if data is None or data.empty:
-                raise DataSourceError(f"No data returned for ticker {ticker}")
+                raise NoDataError(f"No data returned for ticker {ticker}")
+            data.index = data.index.tz_localize(None)
             data = data.dropna()
             return data
+        except NoDataError:
+            raise
+        except YFPricesMissingError as e:
+            raise NoDataError(f"No data returned for ticker {ticker}: {e}") from e
         except Exception as e:
             raise DataSourceError(
                 f"Failed to fetch data for {ticker} from yfinance: {e}"
             ) from e
+
+    def _download_chunk(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str
+    ) -> dict[str, pd.DataFrame]:
+        """Download one chunk of tickers in a single request and split it per ticker."""
+        print(
+            f"Fetching data for {', '.join(tickers)} from {start_date} to {end_date} using yfinance"
+        )
+        self.throttle()
+        try:
+            with _download_lock, profiler.span("http", symbol=",".join(tickers)):
+                data = yf.download(
+                    tickers=tickers,
+                    start=start_date,
+                    end=end_date,
+                    interval=interval,
+                    group_by="ticker",
+                    ignore_tz=True,
+                    progress=False,
+                )
+        except Exception as e:
+            logger.warning("Batch download failed for %s: %s", tickers, e)
+            return {}
+        if data is None or data.empty:
+            return {}
+
+        frames = {}
+        downloaded = set(data.columns.get_level_values(0))
+        for ticker in tickers:
+            key = ticker.upper()
+            if key not in downloaded:
+                continue
+            frame = data[key].dropna()
+            if frame.empty:
+                continue
+            frame.columns.name = None
+            frames[ticker] = frame
+        return frames
+
+    def fetch_many(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch several tickers with chunked batch downloads.
+        Tickers missing from a batch response are retried one at a time.
+        """
+        if len(tickers) == 1:
+            return super().fetch_many(tickers, start_date, end_date, interval)
+
+        results = {}
+        for i in range(0, len(tickers), self.BATCH_SIZE):
+            chunk = tickers[i : i + self.BATCH_SIZE]
+            results.update(self._download_chunk(chunk, start_date, end_date, interval))
+
+        missing = [ticker for ticker in tickers if ticker not in results]
+        if missing:
+            logger.info("Falling back to single downloads for %s", missing)
+            results.update(super().fetch_many(missing, start_date, end_date, interval))
+        return {ticker: results[ticker] for ticker in tickers}
@@ -1,6 +1,11 @@
+import math
+from typing import Any, Mapping
 import pandas as pd
 import numpy as np
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import ema_step
 
 
 class ADX(BaseIndicator):
@@ -26,7 +31,6 @@ class ADX(BaseIndicator):
 
     def calculate(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate the ADX, +DI, and -DI values."""
-        data = data.copy()
         required_columns: list[str] = ["High", "Low", "Close"]
         if not all(col in data.columns for col in required_columns):
             raise ValueError("DataFrame is missing columns for adx calculation.")
@@ -35,8 +39,8 @@ class ADX(BaseIndicator):
         low: pd.Series = data["Low"]
         close: pd.Series = data["Close"]
 
-        high_vals: np.ndarray = high.values.ravel()
-        low_vals: np.ndarray = low.values.ravel()
+        high_vals: np.ndarray = high.to_numpy()
+        low_vals: np.ndarray = low.to_numpy()
 
         # Calculate Directional Movement
         move_up_vals: np.ndarray = np.concatenate(([np.nan], np.diff(high_vals)))
@@ -92,3 +96,91 @@ class ADX(BaseIndicator):
         result_df = pd.DataFrame({"plus_di": plus_di, "minus_di": minus_di, "adx": adx})
 
         return result_df
+
+    def plan(self) -> dict[str, Node]:
+        high = engine.column("High")
+        low = engine.column("Low")
+        alpha = 1 / self.window
+        atr = engine.ewm_mean(
+            engine.true_range(high, low, engine.column("Close")),
+            alpha=alpha,
+            min_periods=self.window,
+        )
+        plus_di = engine.percent_of(
+            engine.ewm_mean(
+                engine.plus_dm(high, low), alpha=alpha, min_periods=self.window
+            ),
+            atr,
+        )
+        minus_di = engine.percent_of(
+            engine.ewm_mean(
+                engine.minus_dm(high, low), alpha=alpha, min_periods=self.window
+            ),
+            atr,
+        )
+        dx = engine.spread_ratio(plus_di, minus_di)
+        return {
+            "plus_di": plus_di,
+            "minus_di": minus_di,
+            "adx": engine.ewm_mean(dx, alpha=alpha, min_periods=self.window),
+        }
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.DataFrame:
+        return pd.concat(
+            {
+                "plus_di": outputs["plus_di"],
+                "minus_di": outputs["minus_di"],
+                "adx": outputs["adx"],
+            },
+            axis=1,
+        )
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {
+            "prev_high": None,
+            "prev_low": None,
+            "prev_close": None,
+            "count": 0,
+            "plus_dm": None,
+            "minus_dm": None,
+            "tr": None,
+            "dx": None,
+        }
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, float]:
+        """Advance the Wilder accumulators by one bar and return +DI, -DI and ADX."""
+        state = self.state
+        high, low, close = float(bar["High"]), float(bar["Low"]), float(bar["Close"])
+        if state["prev_high"] is None:
+            plus_dm = minus_dm = 0.0
+            tr = high - low
+        else:
+            move_up = high - state["prev_high"]
+            move_down = low - state["prev_low"]
+            plus_dm = move_up if move_up > move_down and move_up > 0 else 0.0
+            minus_dm = move_down if move_down > move_up and move_down > 0 else 0.0
+            prev_close = state["prev_close"]
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        state["prev_high"], state["prev_low"], state["prev_close"] = high, low, close
+
+        alpha = 1 / self.window
+        state["count"] += 1
+        state["plus_dm"] = ema_step(state["plus_dm"], plus_dm, alpha)
+        state["minus_dm"] = ema_step(state["minus_dm"], minus_dm, alpha)
+        state["tr"] = ema_step(state["tr"], tr, alpha)
+
+        # Before the window fills the smoothed values are NaN, which calculate()
+        # turns into zero DIs.
+        ready = state["count"] >= self.window
+        plus_di = minus_di = 0.0
+        if ready and state["tr"] != 0:
+            plus_di = 100 * (state["plus_dm"] / state["tr"])
+            minus_di = 100 * (state["minus_dm"] / state["tr"])
+        di_sum = plus_di + minus_di
+        dx = 100 * (abs(plus_di - minus_di) / di_sum) if di_sum != 0 else 0.0
+        state["dx"] = ema_step(state["dx"], dx, alpha)
+        return {
+            "plus_di": plus_di,
+            "minus_di": minus_di,
+            "adx": state["dx"] if ready else math.nan,
+        }
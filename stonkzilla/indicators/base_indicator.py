@@ -1,7 +1,11 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 import pandas as pd
 
+if TYPE_CHECKING:
+    from stonkzilla.indicators.engine import Node
+
 
 class BaseIndicator(ABC):
     """
@@ -11,11 +15,69 @@ class BaseIndicator(ABC):
     def __init__(self, column: Optional[str]) -> None:
         """Initialize the base indicator."""
         self.column = column
+        self._state: Optional[dict[str, Any]] = None
 
     @abstractmethod
     def calculate(self, data: pd.DataFrame) -> pd.Series:
         """Calculate the indicator values."""
 
+    def plan(self) -> Optional[dict[str, "Node"]]:
+        """
+        Describe the calculation as named primitive nodes for the fused engine.
+        Returns None when the indicator only supports calculate().
+        """
+        return None
+
+    def assemble(
+        self, outputs: dict[str, pd.Series | pd.DataFrame]
+    ) -> pd.Series | pd.DataFrame:
+        """Build the indicator result from the evaluated plan outputs."""
+        raise NotImplementedError
+
+    def _initial_state(self) -> dict[str, Any]:
+        """Fresh incremental state; indicators supporting update() override it."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental updates."
+        )
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Live incremental state, created on first use."""
+        if self._state is None:
+            self._state = self._initial_state()
+        return self._state
+
+    def get_state(self) -> dict[str, Any]:
+        """Return a JSON-serializable copy of the incremental state."""
+        return copy.deepcopy(self.state)
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore state previously returned by get_state()."""
+        self._state = copy.deepcopy(state)
+
+    def reset(self) -> None:
+        """Discard the incremental state."""
+        self._state = None
+
+    def update(self, bar: Mapping[str, float]) -> float | dict[str, float]:
+        """
+        Feed one new bar (a mapping of column name to value) in O(1) and return
+        the indicator value for it, matching the last row of calculate().
+        Multi-output indicators return a dict keyed like their DataFrame columns.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support incremental updates."
+        )
+
+    def warm_up(self, data: pd.DataFrame) -> float | dict[str, float] | None:
+        """Feed historical bars in order and return the value for the last one."""
+        columns = list(data.columns)
+        arrays = [data[column].to_numpy() for column in columns]
+        result = None
+        for row in zip(*arrays):
+            result = self.update(dict(zip(columns, row)))
+        return result
+
     def _check_required_columns(self, data: pd.DataFrame, required: list[str]) -> None:
         missing = [col for col in required if col not in data.columns]
         if missing:
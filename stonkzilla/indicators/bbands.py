@@ -1,5 +1,14 @@
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import (
+    new_window,
+    window_mean,
+    window_push,
+    window_std,
+)
 
 
 class BBANDS(BaseIndicator):
@@ -31,3 +40,39 @@ class BBANDS(BaseIndicator):
         result["lower_band"] = lower_band
 
         return result
+
+    def plan(self) -> dict[str, Node]:
+        price = engine.column(self.column)
+        return {
+            "middle_band": engine.rolling_mean(price, self.window),
+            "std_deviation": engine.rolling_std(price, self.window),
+        }
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.DataFrame:
+        middle_band = outputs["middle_band"]
+        std_deviation = outputs["std_deviation"]
+        # Outputs are DataFrames when evaluated for several tickers at once,
+        # giving (field, ticker) columns.
+        return pd.concat(
+            {
+                "middle_band": middle_band,
+                "upper_band": middle_band + (self.standard_dev_num * std_deviation),
+                "lower_band": middle_band - (self.standard_dev_num * std_deviation),
+            },
+            axis=1,
+        )
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {"window": new_window(self.window)}
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, float]:
+        """Push one bar into the ring buffer and return the three bands."""
+        window = self.state["window"]
+        window_push(window, float(bar[self.column]))
+        middle_band = window_mean(window)
+        std_deviation = window_std(window)
+        return {
+            "middle_band": middle_band,
+            "upper_band": middle_band + (self.standard_dev_num * std_deviation),
+            "lower_band": middle_band - (self.standard_dev_num * std_deviation),
+        }
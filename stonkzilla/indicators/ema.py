@@ -1,5 +1,9 @@
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import ema_step, span_to_alpha
 
 
 class EMA(BaseIndicator):
@@ -19,3 +23,20 @@ class EMA(BaseIndicator):
         result = data[self.column].ewm(span=self.window, adjust=False).mean()
         result.index = data.index
         return result
+
+    def plan(self) -> dict[str, Node]:
+        return {"ema": engine.ewm_mean(engine.column(self.column), span=self.window)}
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.Series:
+        return outputs["ema"]
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {"ema": None}
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        """Advance the running EMA by one bar."""
+        state = self.state
+        state["ema"] = ema_step(
+            state["ema"], float(bar[self.column]), span_to_alpha(self.window)
+        )
+        return state["ema"]
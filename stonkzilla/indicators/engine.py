@@ -0,0 +1,319 @@
+"""
+Fused indicator engine.
+
+Indicators that implement plan() describe their calculation as a DAG of
+primitive operations (diff, rolling mean/std, ewm, cumsum, ...). The engine
+deduplicates identical nodes across all requested indicators and evaluates
+each primitive once per dataset, so MACD reuses the EMAs of EMA:12/EMA:26 and
+BBANDS shares its rolling mean with an SMA of the same window.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+import numpy as np
+import pandas as pd
+from stonkzilla.cli.profiling import profiler
+from stonkzilla.indicators.base_indicator import BaseIndicator
+
+logger = logging.getLogger("market-indicator-cli")
+
+Values = pd.Series | pd.DataFrame
+
+# Primitives with array kernels (see kernels.py).
+KERNEL_OPS = frozenset({"ewm_mean", "true_range", "plus_dm", "minus_dm", "obv"})
+
+
+@dataclass(frozen=True)
+class Node:
+    """A primitive operation applied to the outputs of its input nodes."""
+
+    op: str
+    inputs: tuple["Node", ...] = ()
+    params: tuple[Any, ...] = ()
+
+
+def column(name: str) -> Node:
+    return Node("column", params=(name,))
+
+
+def diff(node: Node) -> Node:
+    return Node("diff", (node,))
+
+
+def rolling_mean(node: Node, window: int) -> Node:
+    return Node("rolling_mean", (node,), (window,))
+
+
+def rolling_std(node: Node, window: int) -> Node:
+    return Node("rolling_std", (node,), (window,))
+
+
+def ewm_mean(
+    node: Node,
+    span: Optional[float] = None,
+    alpha: Optional[float] = None,
+    min_periods: int = 0,
+) -> Node:
+    """Exponentially weighted mean with adjust=False, by span or alpha."""
+    if (span is None) == (alpha is None):
+        raise ValueError("Exactly one of span or alpha must be given.")
+    return Node("ewm_mean", (node,), (span, alpha, min_periods))
+
+
+def cumsum(node: Node) -> Node:
+    return Node("cumsum", (node,))
+
+
+def sub(left: Node, right: Node) -> Node:
+    return Node("sub", (left, right))
+
+
+def mul(left: Node, right: Node) -> Node:
+    return Node("mul", (left, right))
+
+
+def positive_part(node: Node) -> Node:
+    """Values above zero, everything else (including NaN) as 0."""
+    return Node("positive_part", (node,))
+
+
+def negative_part(node: Node) -> Node:
+    """Magnitude of values below zero, everything else (including NaN) as 0."""
+    return Node("negative_part", (node,))
+
+
+def direction(node: Node) -> Node:
+    """+1/-1/0 depending on the sign, with NaN treated as 0."""
+    return Node("direction", (node,))
+
+
+def true_range(high: Node, low: Node, close: Node) -> Node:
+    return Node("true_range", (high, low, close))
+
+
+def plus_dm(high: Node, low: Node) -> Node:
+    """Upward directional movement, 0 where it does not dominate."""
+    return Node("plus_dm", (high, low))
+
+
+def minus_dm(high: Node, low: Node) -> Node:
+    """Downward directional movement, 0 where it does not dominate."""
+    return Node("minus_dm", (high, low))
+
+
+def obv(close: Node, volume: Node) -> Node:
+    """Cumulative volume signed by the direction of each close."""
+    return Node("obv", (close, volume))
+
+
+def percent_of(part: Node, whole: Node) -> Node:
+    """100 * part / whole, with 0 where whole is 0 or undefined."""
+    return Node("percent_of", (part, whole))
+
+
+def spread_ratio(left: Node, right: Node) -> Node:
+    """100 * |left - right| / (left + right), with 0 where the sum is 0."""
+    return Node("spread_ratio", (left, right))
+
+
+def _apply(op: str, args: list[Values], params: tuple[Any, ...]) -> Values:
+    if op == "diff":
+        return args[0].diff()
+    if op == "rolling_mean":
+        return args[0].rolling(window=params[0]).mean()
+    if op == "rolling_std":
+        return args[0].rolling(window=params[0]).std()
+    if op == "ewm_mean":
+        span, alpha, min_periods = params
+        return (
+            args[0]
+            .ewm(span=span, alpha=alpha, adjust=False, min_periods=min_periods)
+            .mean()
+        )
+    if op == "cumsum":
+        return args[0].cumsum()
+    if op == "sub":
+        return args[0] - args[1]
+    if op == "mul":
+        return args[0] * args[1]
+    if op == "positive_part":
+        return args[0].where(args[0] > 0, 0)
+    if op == "negative_part":
+        return -args[0].where(args[0] < 0, 0)
+    if op == "direction":
+        filled = args[0].fillna(0)
+        return (filled > 0).astype(int) - (filled < 0).astype(int)
+    if op == "true_range":
+        high, low, close = args
+        prev_close = close.shift(1)
+        tr = np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+        if len(tr) > 0:
+            tr.iloc[0] = high.iloc[0] - low.iloc[0]
+        return tr.fillna(0.0)
+    if op in ("plus_dm", "minus_dm"):
+        move_up, move_down = args[0].diff(), args[1].diff()
+        if op == "minus_dm":
+            move_up, move_down = move_down, move_up
+        return move_up.where((move_up > move_down) & (move_up > 0), 0.0)
+    if op == "obv":
+        filled = args[0].diff().fillna(0)
+        direction = (filled > 0).astype(int) - (filled < 0).astype(int)
+        return (direction * args[1]).cumsum()
+    if op == "percent_of":
+        return (100 * (args[0] / args[1].replace(0, np.nan))).fillna(0)
+    if op == "spread_ratio":
+        total = (args[0] + args[1]).replace(0, np.nan)
+        return (100 * ((args[0] - args[1]).abs() / total)).fillna(0)
+    raise ValueError(f"Unknown primitive operation: {op}")
+
+
+def _apply_kernel(
+    backend: str, op: str, args: list[Values], params: tuple[Any, ...]
+) -> Optional[Values]:
+    """
+    Run a primitive through the array kernels of the given backend, one
+    column at a time for DataFrames. Returns None when the inputs contain
+    NaN, which the kernels do not handle; the pandas primitive is used then.
+    """
+    from stonkzilla.indicators import kernels
+
+    arrays = [np.asarray(arg, dtype=np.float64) for arg in args]
+    if any(np.isnan(array).any() for array in arrays):
+        return None
+    if op == "ewm_mean":
+        span, alpha, min_periods = params
+        if alpha is None:
+            alpha = 2.0 / (1.0 + span)
+
+        def kernel(*cols: np.ndarray) -> np.ndarray:
+            return kernels.ewm_mean(backend, cols[0], alpha, min_periods)
+
+    else:
+
+        def kernel(*cols: np.ndarray) -> np.ndarray:
+            return kernels.run_kernel(backend, op, *cols)
+
+    first = args[0]
+    if first.ndim == 1:
+        name = first.name if op == "ewm_mean" else None
+        return pd.Series(kernel(*arrays), index=first.index, name=name)
+    columns = [
+        kernel(*(np.ascontiguousarray(array[:, i]) for array in arrays))
+        for i in range(first.shape[1])
+    ]
+    return pd.DataFrame(
+        np.column_stack(columns) if columns else np.empty(first.shape),
+        index=first.index,
+        columns=first.columns,
+    )
+
+
+class IndicatorEngine:
+    """
+    Evaluates planned indicators over one dataset, computing every unique
+    primitive node once. data maps column names to Series, or to
+    DataFrames with one column per ticker for batched evaluation.
+    backend selects the implementation of the recursive primitives:
+    "pandas", or the "numpy"/"numba" array kernels.
+    """
+
+    def __init__(
+        self, data: pd.DataFrame | Mapping[str, Values], backend: str = "pandas"
+    ) -> None:
+        if backend != "pandas":
+            from stonkzilla.indicators.kernels import resolve_backend
+
+            backend = resolve_backend(backend)
+        self.data = data
+        self.backend = backend
+        self._values: dict[Node, Values] = {}
+        # Pending uses per node during run(); None outside run().
+        self._refs: Optional[dict[Node, int]] = None
+        self._computed = 0
+        self.requested = 0
+
+    def evaluate(self, node: Node) -> Values:
+        """Evaluate a node, reusing the value of an identical node if computed."""
+        self.requested += 1
+        if node in self._values:
+            return self._values[node]
+        if node.op == "column":
+            name = node.params[0]
+            if name not in self.data:
+                raise ValueError(f"DataFrame must contain a '{name}' column")
+            value = self.data[name]
+        else:
+            args = [self.evaluate(child) for child in node.inputs]
+            value = None
+            if self.backend != "pandas" and node.op in KERNEL_OPS:
+                value = _apply_kernel(self.backend, node.op, args, node.params)
+            if value is None:
+                value = _apply(node.op, args, node.params)
+            self._computed += 1
+            for child in node.inputs:
+                self._release(child)
+        self._values[node] = value
+        return value
+
+    def _release(self, node: Node) -> None:
+        """Drop a node's value once nothing planned still needs it."""
+        if self._refs is None or node not in self._refs:
+            return
+        self._refs[node] -= 1
+        if self._refs[node] == 0:
+            self._values.pop(node, None)
+
+    def _count_refs(self, plans: list[Optional[dict[str, Node]]]) -> dict[Node, int]:
+        refs: dict[Node, int] = {}
+        seen: set[Node] = set()
+        stack = []
+        for plan in plans or []:
+            for node in (plan or {}).values():
+                refs[node] = refs.get(node, 0) + 1
+                stack.append(node)
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            for child in node.inputs:
+                refs[child] = refs.get(child, 0) + 1
+                stack.append(child)
+        return refs
+
+    @property
+    def evaluated(self) -> int:
+        """Number of distinct non-column nodes computed so far."""
+        return self._computed
+
+    def run(self, indicators: list[BaseIndicator]) -> list[Values]:
+        """
+        Calculate indicators, fusing those that support plan().
+        Indicators without a plan fall back to their own calculate().
+        Intermediate values are dropped as soon as no remaining
+        indicator needs them, so peak memory stays close to the results.
+        """
+        plans = [indicator.plan() for indicator in indicators]
+        self._refs = self._count_refs(plans)
+        results = []
+        try:
+            for indicator, plan in zip(indicators, plans):
+                with profiler.span("indicator", indicator=type(indicator).__name__):
+                    if plan is None:
+                        results.append(indicator.calculate(self.data))
+                        continue
+                    outputs = {}
+                    for name, node in plan.items():
+                        outputs[name] = self.evaluate(node)
+                    for node in plan.values():
+                        self._release(node)
+                    results.append(indicator.assemble(outputs))
+        finally:
+            self._refs = None
+        logger.debug(
+            "Indicator engine evaluated %d unique nodes for %d requests",
+            self.evaluated,
+            self.requested,
+        )
+        return results
@@ -0,0 +1,93 @@
+"""
+Building blocks for incremental indicator updates.
+
+State is kept in plain dicts and lists so indicators can serialize it
+(e.g. with json) and resume later. Rolling windows keep running sums that
+are updated in O(1); to stop rounding errors from accumulating over long
+watch sessions they are recomputed from the stored values every time the
+ring buffer wraps around, i.e. once per window length.
+"""
+
+import math
+from typing import Any, Optional
+
+
+def ema_step(previous: Optional[float], value: float, alpha: float) -> float:
+    """One step of an adjust=False exponential mean, seeded with the first value."""
+    if previous is None:
+        return value
+    return (1 - alpha) * previous + alpha * value
+
+
+def span_to_alpha(span: float) -> float:
+    """Smoothing factor used by pandas for ewm(span=...)."""
+    return 2.0 / (1.0 + span)
+
+
+def new_window(size: int) -> dict[str, Any]:
+    """Create an empty fixed-size ring buffer with running sum and variance."""
+    return {"size": size, "values": [], "pos": 0, "total": 0.0, "mean": 0.0, "m2": 0.0}
+
+
+def _window_add(window: dict[str, Any], value: float, count: int) -> None:
+    # Welford update for a window that now holds count values.
+    delta = value - window["mean"]
+    window["mean"] += delta / count
+    window["m2"] += delta * (value - window["mean"])
+    window["total"] += value
+
+
+def _window_remove(window: dict[str, Any], value: float, count: int) -> None:
+    # Reverse Welford update for a window that now holds count values.
+    window["total"] -= value
+    if count == 0:
+        window["mean"] = window["m2"] = window["total"] = 0.0
+        return
+    delta = value - window["mean"]
+    window["mean"] -= delta / count
+    window["m2"] = max(window["m2"] - delta * (value - window["mean"]), 0.0)
+
+
+def _window_reseed(window: dict[str, Any]) -> None:
+    # Exact sums of the stored values, discarding accumulated rounding error.
+    values = window["values"]
+    total = math.fsum(values)
+    mean = total / len(values)
+    window["total"] = total
+    window["mean"] = mean
+    window["m2"] = math.fsum((v - mean) ** 2 for v in values)
+
+
+def window_push(window: dict[str, Any], value: float) -> None:
+    """Append a value, evicting the oldest one once the window is full."""
+    values = window["values"]
+    size = window["size"]
+    if len(values) < size:
+        values.append(value)
+        _window_add(window, value, len(values))
+        return
+    evicted = values[window["pos"]]
+    values[window["pos"]] = value
+    window["pos"] = (window["pos"] + 1) % size
+    _window_remove(window, evicted, size - 1)
+    _window_add(window, value, size)
+    if window["pos"] == 0:
+        _window_reseed(window)
+
+
+def window_full(window: dict[str, Any]) -> bool:
+    return len(window["values"]) == window["size"]
+
+
+def window_mean(window: dict[str, Any]) -> float:
+    """Mean of a full window, NaN before it fills up (like rolling().mean())."""
+    if not window_full(window):
+        return math.nan
+    return window["total"] / window["size"]
+
+
+def window_std(window: dict[str, Any]) -> float:
+    """Sample standard deviation of a full window (like rolling().std())."""
+    if not window_full(window) or window["size"] < 2:
+        return math.nan
+    return math.sqrt(window["m2"] / (window["size"] - 1))
@@ -0,0 +1,201 @@
+"""
+Array kernels for recursive indicators: exponential and Wilder smoothing,
+true range, directional movement and OBV.
+
+Two implementations follow the pandas semantics used by the indicators:
+compiled loops when numba is installed and pure NumPy otherwise. Inputs
+are 1-D float64 arrays without NaN; callers fall back to pandas otherwise.
+"""
+
+import logging
+import math
+from typing import Callable
+import numpy as np
+
+logger = logging.getLogger("market-indicator-cli")
+
+BACKENDS = ("pandas", "numpy", "numba")
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Blocks of the NumPy EMA are sized so the decay across a block stays above
+# this, bounding the scaling (and rounding error) inside the block.
+_BLOCK_DECAY = 1e-4
+_MAX_BLOCK = 4096
+
+
+def resolve_backend(name: str) -> str:
+    """Return the backend to use, falling back from numba to numpy if missing."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown engine {name!r}; expected one of {BACKENDS}")
+    if name == "numba" and numba is None:
+        logger.warning("numba is not installed, using the NumPy kernels instead")
+        return "numpy"
+    return name
+
+
+def _ewm_numpy(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    adjust=False EMA seeded with the first value, without a Python loop
+    over the samples. Within each block the recursion is solved in closed
+    form with a scaled cumulative sum; block carries are then combined with
+    a short truncated sum, since the decay across a block is tiny.
+    """
+    n = len(values)
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        return values.copy()
+    block = int(min(max(math.log(_BLOCK_DECAY) / math.log(decay), 1), _MAX_BLOCK, n))
+    blocks = -(-n // block)
+    padded = np.zeros(blocks * block)
+    padded[:n] = values
+    steps = np.arange(block)
+    powers = decay**steps
+    # Block-local EMA starting from zero: alpha * sum_k decay^(j-k) * x_k
+    local = alpha * powers * np.cumsum(padded.reshape(blocks, block) / powers, axis=1)
+
+    # Value carried into each block: C_b = D * C_(b-1) + last_b, C_-1 = x_0
+    block_decay = decay**block
+    last = local[:, -1]
+    carry = np.zeros(blocks)
+    # Older blocks contribute less than 1e-18 of their value after this many.
+    terms = (
+        int(math.ceil(math.log(1e-18) / math.log(block_decay)))
+        if block_decay > 0.0
+        else 1
+    )
+    for m in range(min(terms, blocks)):
+        carry[m:] += block_decay**m * last[: blocks - m]
+    carry += block_decay ** np.arange(1, blocks + 1) * values[0]
+    carry_in = np.concatenate(([values[0]], carry[:-1]))
+
+    out = local + (decay * powers)[None, :] * carry_in[:, None]
+    return out.ravel()[:n]
+
+
+def _true_range_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    tr[0] = high[0] - low[0]
+    return np.nan_to_num(tr, nan=0.0)
+
+
+def _moves(high: np.ndarray, low: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    move_up = np.empty_like(high)
+    move_down = np.empty_like(low)
+    move_up[0] = move_down[0] = np.nan
+    move_up[1:] = np.diff(high)
+    move_down[1:] = np.diff(low)
+    return move_up, move_down
+
+
+def _plus_dm_numpy(high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    move_up, move_down = _moves(high, low)
+    return np.where((move_up > move_down) & (move_up > 0), move_up, 0.0)
+
+
+def _minus_dm_numpy(high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    move_up, move_down = _moves(high, low)
+    return np.where((move_down > move_up) & (move_down > 0), move_down, 0.0)
+
+
+def _obv_numpy(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    direction = np.zeros_like(close)
+    direction[1:] = np.sign(np.diff(close))
+    return np.cumsum(direction * volume)
+
+
+def _ewm_loop(values: np.ndarray, alpha: float) -> np.ndarray:
+    out = np.empty_like(values)
+    weighted = values[0]
+    out[0] = weighted
+    for i in range(1, len(values)):
+        weighted = (1.0 - alpha) * weighted + alpha * values[i]
+        out[i] = weighted
+    return out
+
+
+def _true_range_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    out = np.empty_like(high)
+    out[0] = high[0] - low[0]
+    for i in range(1, len(high)):
+        out[i] = max(
+            high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])
+        )
+    return out
+
+
+def _plus_dm_loop(high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(high)
+    for i in range(1, len(high)):
+        up = high[i] - high[i - 1]
+        down = low[i] - low[i - 1]
+        if up > down and up > 0:
+            out[i] = up
+    return out
+
+
+def _minus_dm_loop(high: np.ndarray, low: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(high)
+    for i in range(1, len(high)):
+        up = high[i] - high[i - 1]
+        down = low[i] - low[i - 1]
+        if down > up and down > 0:
+            out[i] = down
+    return out
+
+
+def _obv_loop(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    out = np.empty_like(close)
+    total = 0.0
+    out[0] = total
+    for i in range(1, len(close)):
+        if close[i] > close[i - 1]:
+            total += volume[i]
+        elif close[i] < close[i - 1]:
+            total -= volume[i]
+        out[i] = total
+    return out
+
+
+_KERNELS: dict[str, dict[str, Callable[..., np.ndarray]]] = {
+    "numpy": {
+        "ewm_mean": _ewm_numpy,
+        "true_range": _true_range_numpy,
+        "plus_dm": _plus_dm_numpy,
+        "minus_dm": _minus_dm_numpy,
+        "obv": _obv_numpy,
+    },
+}
+if numba is not None:
+    _KERNELS["numba"] = {
+        "ewm_mean": numba.njit(cache=True)(_ewm_loop),
+        "true_range": numba.njit(cache=True)(_true_range_loop),
+        "plus_dm": numba.njit(cache=True)(_plus_dm_loop),
+        "minus_dm": numba.njit(cache=True)(_minus_dm_loop),
+        "obv": numba.njit(cache=True)(_obv_loop),
+    }
+
+KERNEL_OPS = frozenset(_KERNELS["numpy"])
+
+
+def run_kernel(backend: str, op: str, *arrays: np.ndarray, **params) -> np.ndarray:
+    """Apply a kernel to 1-D float64 arrays of equal length."""
+    if len(arrays[0]) == 0:
+        return np.empty(0)
+    return _KERNELS[backend][op](*arrays, **params)
+
+
+def ewm_mean(
+    backend: str, values: np.ndarray, alpha: float, min_periods: int = 0
+) -> np.ndarray:
+    """adjust=False exponentially weighted mean with pandas' min_periods masking."""
+    out = run_kernel(backend, "ewm_mean", values, alpha)
+    if min_periods > 1:
+        out[: min_periods - 1] = np.nan
+    return out
@@ -1,5 +1,9 @@
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import ema_step, span_to_alpha
 
 
 class MACD(BaseIndicator):
@@ -35,3 +39,40 @@ class MACD(BaseIndicator):
         result["Signal"] = signal_line
 
         return result
+
+    def plan(self) -> dict[str, Node]:
+        price = engine.column(self.column)
+        macd_line = engine.sub(
+            engine.ewm_mean(price, span=self.short_window),
+            engine.ewm_mean(price, span=self.long_window),
+        )
+        return {
+            "MACD": macd_line,
+            "Signal": engine.ewm_mean(macd_line, span=self.signal_window),
+        }
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.DataFrame:
+        # Outputs are DataFrames when evaluated for several tickers at once,
+        # giving (field, ticker) columns.
+        return pd.concat(
+            {"MACD": outputs["MACD"], "Signal": outputs["Signal"]}, axis=1
+        )
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {"short_ema": None, "long_ema": None, "signal": None}
+
+    def update(self, bar: Mapping[str, float]) -> dict[str, float]:
+        """Advance the short, long and signal EMAs by one bar."""
+        state = self.state
+        price = float(bar[self.column])
+        state["short_ema"] = ema_step(
+            state["short_ema"], price, span_to_alpha(self.short_window)
+        )
+        state["long_ema"] = ema_step(
+            state["long_ema"], price, span_to_alpha(self.long_window)
+        )
+        macd_line = state["short_ema"] - state["long_ema"]
+        state["signal"] = ema_step(
+            state["signal"], macd_line, span_to_alpha(self.signal_window)
+        )
+        return {"MACD": macd_line, "Signal": state["signal"]}
@@ -1,5 +1,8 @@
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
 
 
 class OBV(BaseIndicator):
@@ -24,3 +27,24 @@ class OBV(BaseIndicator):
         obv = volume_flow.cumsum()
         obv.name = "OBV"
         return obv
+
+    def plan(self) -> dict[str, Node]:
+        return {"obv": engine.obv(engine.column("Close"), engine.column("Volume"))}
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.Series:
+        return outputs["obv"].rename("OBV")
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {"prev_close": None, "obv": 0.0}
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        """Add or subtract the bar's volume from the running total."""
+        state = self.state
+        close = float(bar["Close"])
+        if state["prev_close"] is not None:
+            if close > state["prev_close"]:
+                state["obv"] += float(bar["Volume"])
+            elif close < state["prev_close"]:
+                state["obv"] -= float(bar["Volume"])
+        state["prev_close"] = close
+        return state["obv"]
@@ -0,0 +1,158 @@
+"""
+Memoization of indicator results.
+
+Results are keyed by where the data came from (ticker, source, interval),
+a hash of the data itself and the indicator name, params and column, so a
+re-run that adds one indicator or re-plots the same range only computes
+what is new. An in-memory LRU tier is bounded by the size of the stored
+results; an optional on-disk tier keeps them between runs.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Mapping, Optional
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("market-indicator-cli")
+
+Result = pd.Series | pd.DataFrame
+
+
+def fingerprint(data: pd.DataFrame | Mapping[str, Result]) -> str:
+    """Hash the index, column names and values of a frame or column mapping."""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        columns = [c for c in data.columns if pd.api.types.is_numeric_dtype(data[c])]
+    else:
+        columns = list(data)
+    for name in columns:
+        values = data[name]
+        digest.update(str(name).encode())
+        if isinstance(values, pd.DataFrame):
+            digest.update(",".join(map(str, values.columns)).encode())
+        digest.update(np.ascontiguousarray(values.to_numpy(dtype=np.float64)).data)
+    if columns:
+        index = data[columns[0]].index
+        digest.update(str(index.dtype).encode())
+        digest.update(pd.util.hash_array(index.to_numpy()).data)
+    return digest.hexdigest()
+
+
+def result_key(
+    ticker: str,
+    source: str,
+    interval: str,
+    data_hash: str,
+    name: str,
+    params: list[int | float],
+    column: str,
+) -> str:
+    """Stable key for one indicator result."""
+    parts = (ticker, source, interval, data_hash, name, ",".join(map(str, params)), column)
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def result_nbytes(result: Result) -> int:
+    """Approximate memory held by a result (values plus index)."""
+    usage = result.memory_usage(index=True, deep=False)
+    return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+
+
+class ResultCache:
+    """
+    LRU cache of indicator results capped at max_bytes, backed by pickle
+    files in cache_dir when one is given. Thread-safe; hits and misses are
+    counted for the run summary.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, cache_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[str, tuple[Result, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".pkl")
+
+    def _remember(self, key: str, result: Result) -> None:
+        size = result_nbytes(result)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (result, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+
+    def get(self, key: str) -> Optional[Result]:
+        """Return the cached result for key, or None (counted as a miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        result = self._load(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: Result) -> None:
+        """Store a result in memory and, if enabled, on disk."""
+        with self._lock:
+            self._remember(key, result)
+        if self.cache_dir:
+            self._store(key, result)
+
+    def _load(self, key: str) -> Optional[Result]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            return pd.read_pickle(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable indicator cache entry %s: %s", path, e)
+            return None
+
+    def _store(self, key: str, result: Result) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            result.to_pickle(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write indicator cache entry %s: %s", path, e)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+
+    def summary(self) -> str:
+        lookups = self.hits + self.misses
+        rate = 100 * self.hits / lookups if lookups else 0.0
+        return (
+            f"Indicator cache: {self.hits} hits ({self.disk_hits} from disk), "
+            f"{self.misses} misses ({rate:.0f}% hit rate), "
+            f"{self.nbytes / 2**20:.1f} MiB in memory"
+        )
@@ -1,5 +1,10 @@
+import math
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import new_window, window_mean, window_push
 
 
 class RSI(BaseIndicator):
@@ -25,3 +30,38 @@ class RSI(BaseIndicator):
         rsi = 100 - (100 / (1 + rs))
 
         return rsi
+
+    def plan(self) -> dict[str, Node]:
+        delta = engine.diff(engine.column(self.column))
+        return {
+            "gain": engine.rolling_mean(engine.positive_part(delta), self.window),
+            "loss": engine.rolling_mean(engine.negative_part(delta), self.window),
+        }
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.Series:
+        rs = outputs["gain"] / outputs["loss"]
+        return 100 - (100 / (1 + rs))
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {
+            "prev": None,
+            "gains": new_window(self.window),
+            "losses": new_window(self.window),
+        }
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        """Push the bar's gain and loss into their windows and return the RSI."""
+        state = self.state
+        price = float(bar[self.column])
+        delta = 0.0 if state["prev"] is None else price - state["prev"]
+        state["prev"] = price
+        window_push(state["gains"], delta if delta > 0 else 0.0)
+        window_push(state["losses"], -delta if delta < 0 else 0.0)
+
+        gain = window_mean(state["gains"])
+        loss = window_mean(state["losses"])
+        if math.isnan(gain) or math.isnan(loss):
+            return math.nan
+        if loss == 0:
+            return 100.0 if gain > 0 else math.nan
+        return 100 - (100 / (1 + gain / loss))
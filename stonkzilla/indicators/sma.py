@@ -1,5 +1,9 @@
+from typing import Any, Mapping
 import pandas as pd
 from stonkzilla.indicators.base_indicator import BaseIndicator
+from stonkzilla.indicators import engine
+from stonkzilla.indicators.engine import Node
+from stonkzilla.indicators.incremental import new_window, window_mean, window_push
 
 
 class SMA(BaseIndicator):
@@ -19,3 +23,18 @@ class SMA(BaseIndicator):
         result = data[self.column].rolling(window=self.window).mean()
         result.index = data.index
         return result
+
+    def plan(self) -> dict[str, Node]:
+        return {"sma": engine.rolling_mean(engine.column(self.column), self.window)}
+
+    def assemble(self, outputs: dict[str, pd.Series]) -> pd.Series:
+        return outputs["sma"]
+
+    def _initial_state(self) -> dict[str, Any]:
+        return {"window": new_window(self.window)}
+
+    def update(self, bar: Mapping[str, float]) -> float:
+        """Push one bar into the ring buffer and return the window mean."""
+        window = self.state["window"]
+        window_push(window, float(bar[self.column]))
+        return window_mean(window)
@@ -1,7 +1,8 @@
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.artist import setp
 from matplotlib.axes import Axes
 from stonkzilla.plots.plot_methods import (
     apply_color_scheme,
@@ -16,7 +17,10 @@ from stonkzilla.plots.plot_methods import (
     analyze_indicators,
     assign_axes,
     save_plot,
+    show_figure,
 )
+from stonkzilla.cli.profiling import profiler
+from stonkzilla.plots.figure_pool import figure_pool
 
 
 class CandlestickPlotter:
@@ -31,79 +35,76 @@ class CandlestickPlotter:
         self.scheme = resolve_color_scheme(color_scheme, up_color, down_color)
 
     def _plot_candlesticks(self, ax: Axes, data: pd.DataFrame) -> None:
-        """Draw candlesticks on the given axis"""
+        """
+        Draw candlesticks on the given axis.
+        All bodies go into one PolyCollection and all wicks into one
+        LineCollection, so the artist count does not grow with the bar count.
+        """
         data = data.sort_index()
-        date_nums = [mdates.date2num(d) for d in data.index]
-        if len(data) > 1:
-            diffs = [b - a for a, b in zip(date_nums[:-1], date_nums[1:])]
-            import numpy as np
+        x = mdates.date2num(data.index)
+        opens = np.asarray(data["Open"], dtype=float).ravel()
+        highs = np.asarray(data["High"], dtype=float).ravel()
+        lows = np.asarray(data["Low"], dtype=float).ravel()
+        closes = np.asarray(data["Close"], dtype=float).ravel()
 
-            median_diff = np.median(diffs)
-            width = median_diff * 0.7
+        if len(data) > 1:
+            width = np.median(np.diff(x)) * 0.7
         else:
             width = 0.6
 
-        for date, row in data.iterrows():
-            x = mdates.date2num(date)
-            close_value = (
-                row["Close"].item() if hasattr(row["Close"], "item") else row["Close"]
-            )
-            open_value = (
-                row["Open"].item() if hasattr(row["Open"], "item") else row["Open"]
-            )
-            high_value = (
-                row["High"].item() if hasattr(row["High"], "item") else row["High"]
-            )
-            low_value = row["Low"].item() if hasattr(row["Low"], "item") else row["Low"]
-
-            if close_value >= open_value:
-                color = self.scheme["up"]
-                body_bottom = open_value
-                body_height = close_value - open_value
-            else:
-                color = self.scheme["down"]
-                body_bottom = close_value
-                body_height = open_value - close_value
-
-            rect = Rectangle(
-                xy=(x - width / 2, body_bottom),
-                width=width,
-                height=body_height,
-                facecolor=color,
-                edgecolor="black",
-                linewidth=0.5,
+        is_up = closes >= opens
+        body_bottom = np.minimum(opens, closes)
+        body_top = np.maximum(opens, closes)
+        left = x - width / 2
+        right = x + width / 2
+
+        # (n, 4, 2) rectangle vertices: bottom-left, top-left, top-right, bottom-right
+        bodies = np.stack(
+            [
+                np.column_stack([left, body_bottom]),
+                np.column_stack([left, body_top]),
+                np.column_stack([right, body_top]),
+                np.column_stack([right, body_bottom]),
+            ],
+            axis=1,
+        )
+        face_colors = np.where(is_up, self.scheme["up"], self.scheme["down"])
+        ax.add_collection(
+            PolyCollection(
+                bodies,
+                facecolors=face_colors,
+                edgecolors="black",
+                linewidths=0.5,
                 alpha=0.8,
             )
-            ax.add_patch(rect)
-
-            # Plot the upper wick
-            ax.plot(
-                [x, x],
-                [max(open_value, close_value), high_value],
-                color="black",
-                linewidth=0.8,
-            )
+        )
+
+        # Upper wicks followed by lower wicks, one segment each per candle.
+        wicks = np.concatenate(
+            [
+                np.stack(
+                    [np.column_stack([x, body_top]), np.column_stack([x, highs])],
+                    axis=1,
+                ),
+                np.stack(
+                    [np.column_stack([x, body_bottom]), np.column_stack([x, lows])],
+                    axis=1,
+                ),
+            ]
+        )
+        ax.add_collection(LineCollection(wicks, colors="black", linewidths=0.8))
 
-            # Plot the lower wick
-            ax.plot(
-                [x, x],
-                [min(open_value, close_value), low_value],
-                color="black",
-                linewidth=0.8,
-            )
         ax.set_xlim(
             mdates.date2num(data.index.min()) - 1, mdates.date2num(data.index.max()) + 1
         )
         ax.xaxis_date()
         ax.xaxis.set_major_locator(mdates.AutoDateLocator())
         ax.xaxis.set_major_formatter(mdates.AutoDateFormatter("%Y-%m-%d"))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
+        setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
 
-        price_range = data["High"].max().item() - data["Low"].min().item()
+        price_range = highs.max() - lows.min()
         margin = price_range * 0.05
-        ax.set_ylim(
-            data["Low"].min().item() - margin, data["High"].max().item() + margin
-        )
+        ax.set_ylim(lows.min() - margin, highs.max() + margin)
 
     def plot(
         self,
@@ -128,79 +129,88 @@ class CandlestickPlotter:
         indicators_info = analyze_indicators(indicators)
         subplot_count = indicators_info["subplot_count"]
 
-        fig, axes = create_indicator_subplots(subplot_count)
-
-        apply_color_scheme(fig, axes, self.scheme, self.title)
-        fig.suptitle(f"{self.title} - {ticker}", color=self.scheme["text"])
-
-        ax_map = assign_axes(axes, indicators_info)
-        ax_price: Axes = ax_map["price"]
-        ax_obv: Axes = ax_map["obv"]
-        ax_macd: Axes = ax_map["macd"]
-        ax_rsi: Axes = ax_map["rsi"]
-        ax_adx: Axes = ax_map["adx"]
-
-        self._plot_candlesticks(ax_price, data)
-
-        for name, (series, _) in indicators.items():
-            if (
-                name.startswith("MACD")
-                or name.startswith("BBANDS")
-                or name.startswith("RSI")
-                or name.startswith("OBV")
-                or name.startswith("FIBO")
-                or name.startswith("ADX")
-            ):
-                continue
-            ax_price.plot(series.index, series, label=f"{name}", linewidth=1.5)
-        if indicators_info["has_bbands"]:
-            bbands_key = next(name for name in indicators if "BBANDS" in name)
-            bbands_data, _ = indicators[bbands_key]
-            plot_bbands(ax_price, bbands_data, self.scheme)
-        if indicators_info["has_fibo"]:
-            fibo_key = next(name for name in indicators if name.startswith("FIBO"))
-            fibo_data, _ = indicators[fibo_key]
-            plot_fibo(ax_price, fibo_data, self.scheme)
-        ax_price.set_ylabel("Price")
-        ax_price.legend()
-        ax_price.grid(color=self.scheme.get("grid", None))
-
-        if len(data) > 50:
-            ax_price.xaxis.set_major_locator(mdates.AutoDateLocator())
-
-        if indicators_info["has_obv"]:
-            obv_key = next(name for name in indicators if name.startswith("OBV"))
-            obv_data, _ = indicators[obv_key]
-            plot_obv(ax_obv, obv_data, self.scheme)
-
-        if indicators_info["has_macd"]:
-            macd_key = next(name for name in indicators if "MACD" in name)
-            macd_data, _ = indicators[macd_key]
-            plot_macd(ax_macd, macd_data, self.scheme)
-
-        if indicators_info["has_rsi"]:
-            rsi_key = next(name for name in indicators if name.startswith("RSI"))
-            rsi_data, params = indicators[rsi_key]
-            plot_rsi(ax_rsi, rsi_data, params, self.scheme)
-
-        if indicators_info["has_adx"]:
-            adx_key = next(name for name in indicators if name.startswith("ADX"))
-            adx_data, params = indicators[adx_key]
-            plot_adx(ax_adx, adx_data, self.scheme)
-
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
+        with profiler.span("figure"):
+            if save:
+                fig, axes = figure_pool.acquire(subplot_count)
+            else:
+                fig, axes = create_indicator_subplots(subplot_count)
+
+            apply_color_scheme(fig, axes, self.scheme, self.title)
+            fig.suptitle(f"{self.title} - {ticker}", color=self.scheme["text"])
+
+            ax_map = assign_axes(axes, indicators_info)
+            ax_price: Axes = ax_map["price"]
+            ax_obv: Axes = ax_map["obv"]
+            ax_macd: Axes = ax_map["macd"]
+            ax_rsi: Axes = ax_map["rsi"]
+            ax_adx: Axes = ax_map["adx"]
+
+            self._plot_candlesticks(ax_price, data)
+
+            for name, (series, _) in indicators.items():
+                if (
+                    name.startswith("MACD")
+                    or name.startswith("BBANDS")
+                    or name.startswith("RSI")
+                    or name.startswith("OBV")
+                    or name.startswith("FIBO")
+                    or name.startswith("ADX")
+                ):
+                    continue
+                ax_price.plot(series.index, series, label=f"{name}", linewidth=1.5)
+            if indicators_info["has_bbands"]:
+                bbands_key = next(name for name in indicators if "BBANDS" in name)
+                bbands_data, params = indicators[bbands_key]
+                plot_bbands(ax_price, bbands_data, params, self.scheme)
+            if indicators_info["has_fibo"]:
+                fibo_key = next(name for name in indicators if name.startswith("FIBO"))
+                fibo_data, _ = indicators[fibo_key]
+                plot_fibo(ax_price, fibo_data, self.scheme)
+            ax_price.set_ylabel("Price")
+            # A fixed location avoids scanning every candle for the "best" spot.
+            ax_price.legend(loc="upper left")
+            ax_price.grid(color=self.scheme.get("grid", None))
+
+            if len(data) > 50:
+                ax_price.xaxis.set_major_locator(mdates.AutoDateLocator())
+
+            if indicators_info["has_obv"]:
+                obv_key = next(name for name in indicators if name.startswith("OBV"))
+                obv_data, _ = indicators[obv_key]
+                plot_obv(ax_obv, obv_data, self.scheme)
+
+            if indicators_info["has_macd"]:
+                macd_key = next(name for name in indicators if "MACD" in name)
+                macd_data, _ = indicators[macd_key]
+                plot_macd(ax_macd, macd_data, self.scheme)
+
+            if indicators_info["has_rsi"]:
+                rsi_key = next(name for name in indicators if name.startswith("RSI"))
+                rsi_data, params = indicators[rsi_key]
+                plot_rsi(ax_rsi, rsi_data, params, self.scheme)
+
+            if indicators_info["has_adx"]:
+                adx_key = next(name for name in indicators if name.startswith("ADX"))
+                adx_data, params = indicators[adx_key]
+                plot_adx(ax_adx, adx_data, self.scheme)
+
+        with profiler.span("tight_layout"):
+            fig.tight_layout(rect=[0, 0, 1, 0.96])
 
         # Save plots to file
         if save:
-            save_plot(
-                fig,
-                save_dir,
-                save_format,
-                save_dpi,
-                ticker,
-                interval,
-                start_date,
-                end_date,
-            )
+            try:
+                save_plot(
+                    fig,
+                    save_dir,
+                    save_format,
+                    save_dpi,
+                    ticker,
+                    interval,
+                    start_date,
+                    end_date,
+                )
+            finally:
+                figure_pool.release(fig, axes)
         else:
-            plt.show()
+            show_figure(fig)
@@ -0,0 +1,90 @@
+"""
+Level-of-detail decimation of long series before plotting.
+
+A line drawn through more points than the figure has pixel columns looks
+the same when each column keeps only its lowest and highest point. Series
+are cut into consecutive buckets, by default one per pixel column of the
+saved or shown figure, and only each bucket's minimum and maximum (in
+their original order) plus the first and last point are drawn, so spikes
+and gaps stay visible while rendering and vector output stay small.
+"""
+
+from typing import Optional
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+Indicators = dict[str, tuple[pd.DataFrame | pd.Series, list[int]]]
+
+
+def point_budget(
+    fig: Figure, dpi: float, enabled: bool = True, max_points: Optional[int] = None
+) -> Optional[int]:
+    """
+    Points worth drawing per line: max_points if given, else two (a min
+    and a max) per pixel column of the figure at dpi. None when disabled.
+    """
+    if not enabled:
+        return None
+    if max_points:
+        return max_points
+    return 2 * int(fig.get_figwidth() * dpi)
+
+
+def minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Sorted positions of the minimum and maximum of each bucket, plus the
+    first and last position, for about max_points buckets' worth of points.
+    NaNs are skipped; an all-NaN bucket keeps one NaN so the gap is drawn.
+    """
+    count = len(values)
+    if count <= max_points:
+        return np.arange(count)
+    buckets = max(max_points // 2, 1)
+    size = -(-count // buckets)
+    rows = -(-count // size)
+    padded = np.full(rows * size, np.nan)
+    padded[:count] = values
+    padded = padded.reshape(rows, size)
+    missing = np.isnan(padded)
+    offsets = np.arange(rows) * size
+    lows = offsets + np.where(missing, np.inf, padded).argmin(axis=1)
+    highs = offsets + np.where(missing, -np.inf, padded).argmax(axis=1)
+    return np.unique(np.concatenate([lows, highs, [0, count - 1]]))
+
+
+def decimate(
+    values: pd.Series | pd.DataFrame, max_points: Optional[int]
+) -> pd.Series | pd.DataFrame:
+    """
+    Keep the rows of a time series that survive min/max decimation. All
+    columns of a frame keep the same rows (the union of each column's), so
+    bands and histograms stay aligned. A MACD frame also keeps the extremes
+    of its histogram (MACD - Signal), which is drawn but not stored.
+    Returned unchanged when max_points is None or the series is already
+    short enough.
+    """
+    if max_points is None or len(values) <= max_points:
+        return values
+    array = values.to_numpy(dtype=float, na_value=np.nan)
+    if array.ndim == 1:
+        return values.iloc[minmax_indices(array, max_points)]
+    if {"MACD", "Signal"} <= set(values.columns):
+        histogram = (values["MACD"] - values["Signal"]).to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        array = np.column_stack([array, histogram])
+    keep = np.unique(
+        np.concatenate([minmax_indices(column, max_points) for column in array.T])
+    )
+    return values.iloc[keep]
+
+
+def decimate_indicators(indicators: Indicators, max_points: Optional[int]) -> Indicators:
+    """Decimate every indicator's values, keeping its params."""
+    if max_points is None:
+        return indicators
+    return {
+        name: (decimate(values, max_points), params)
+        for name, (values, params) in indicators.items()
+    }
@@ -0,0 +1,52 @@
+"""
+Recycling of figures used for saved plots.
+
+Saved figures are built through the object-oriented Figure API, so pyplot's
+global figure manager never holds on to them. After saving, a figure goes
+back to the pool keyed by its subplot layout and is cleared and reused by
+the next ticker with the same indicator set, which keeps memory flat over
+long batch runs.
+"""
+
+from collections import OrderedDict
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from stonkzilla.plots.plot_methods import create_indicator_subplots
+
+
+class FigurePool:
+    """Keeps at most max_idle unused figures, one per subplot layout."""
+
+    def __init__(self, max_idle: int = 4) -> None:
+        self.max_idle = max_idle
+        self._idle: OrderedDict[int, tuple[Figure, list[Axes]]] = OrderedDict()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, subplot_count: int) -> tuple[Figure, list[Axes]]:
+        """Return a blank unmanaged figure with subplot_count stacked axes."""
+        entry = self._idle.pop(subplot_count, None)
+        if entry is None:
+            self.created += 1
+            return create_indicator_subplots(subplot_count, managed=False)
+        self.reused += 1
+        fig, axes = entry
+        for ax in axes:
+            ax.clear()
+            ax.set_visible(True)
+        return fig, axes
+
+    def release(self, fig: Figure, axes: list[Axes]) -> None:
+        """Hand a saved figure back for reuse, dropping the oldest idle one if full."""
+        subplot_count = len(axes)
+        if subplot_count in self._idle:
+            fig.clear()
+            return
+        self._idle[subplot_count] = (fig, axes)
+        while len(self._idle) > self.max_idle:
+            _, (old_fig, _) = self._idle.popitem(last=False)
+            old_fig.clear()
+
+
+# Shared by all plotters in the process, so consecutive tickers reuse figures.
+figure_pool = FigurePool()
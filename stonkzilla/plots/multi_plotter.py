@@ -1,8 +1,9 @@
 from typing import Dict, Tuple, Optional
 from functools import reduce
 import pandas as pd
-import matplotlib.pyplot as plt
-from stonkzilla.plots.plot_methods import save_plot
+from stonkzilla.cli.profiling import profiler
+from stonkzilla.plots.decimate import decimate, point_budget
+from stonkzilla.plots.plot_methods import new_figure, save_plot, show_figure
 
 
 class MultiTickerPlotter:
@@ -16,10 +17,14 @@ class MultiTickerPlotter:
         normalize: bool = False,
         log_scale: bool = False,
         title: str = "Multi-Ticker Comparison",
+        decimate: bool = True,
+        max_points: Optional[int] = None,
     ) -> None:
         self.normalize = normalize
         self.log_scale = log_scale
         self.title = title
+        self.decimate = decimate
+        self.max_points = max_points
 
     @staticmethod
     def align_dataframes(
@@ -117,6 +122,7 @@ class MultiTickerPlotter:
         save_format: str = None,
         save_dpi: int = 300,
         figsize: Tuple[int, int] = (12, 6),
+        interval: str = "",
     ) -> None:
         """
         Plot normalized prices, FIBO overlays, and moving averages for multiple tickers.
@@ -140,79 +146,87 @@ class MultiTickerPlotter:
         }
 
         # --- Figure setup ---
-        fig, (ax_price, ax_ma) = plt.subplots(
-            2, 1, figsize=figsize, sharex=True, gridspec_kw={"height_ratios": [2, 1]}
-        )
+        with profiler.span("figure"):
+            fig = new_figure(figsize, managed=not save)
+            ax_price, ax_ma = fig.subplots(
+                2, 1, sharex=True, gridspec_kw={"height_ratios": [2, 1]}
+            )
 
-        # --- Price subplot ---
-        for ticker, series in norm_prices.items():
-            ax_price.plot(series.index, series, label=ticker, linewidth=1.5)
-        ax_price.set_title(self.title)
-        ax_price.set_ylabel(column + (" (normalized)" if self.normalize else ""))
-        if self.log_scale:
-            ax_price.set_yscale("log")
-        ax_price.grid(True)
-        ax_price.legend(loc="upper left")
+            dpi = save_dpi if save and save_dpi else fig.dpi
+            budget = point_budget(fig, dpi, self.decimate, self.max_points)
 
-        # --- FIBO overlay ---
-        if indicators:
-            for ind_name, (ind_data, _) in indicators.items():
-                if ind_name.startswith("FIBO") and self.normalize:
-                    if isinstance(ind_data, pd.DataFrame):
-                        fibo_avg = self.normalize_and_average_fibo(
-                            ind_data, base_values
-                        )
-                        for level, value in fibo_avg.items():
-                            ax_price.axhline(
-                                y=value,
-                                linestyle="--",
-                                alpha=0.7,
-                                label=f"FIBO {level}",
-                            )
-                    elif isinstance(ind_data, pd.Series):
-                        mean_base = sum(base_values.values()) / len(base_values)
-                        for level, value in ind_data.items():
-                            ax_price.axhline(
-                                y=value / mean_base,
-                                linestyle="--",
-                                alpha=0.7,
-                                label=f"FIBO {level}",
+            # --- Price subplot ---
+            for ticker, series in norm_prices.items():
+                series = decimate(series, budget)
+                ax_price.plot(series.index, series, label=ticker, linewidth=1.5)
+            ax_price.set_title(self.title)
+            ax_price.set_ylabel(column + (" (normalized)" if self.normalize else ""))
+            if self.log_scale:
+                ax_price.set_yscale("log")
+            ax_price.grid(True)
+            ax_price.legend(loc="upper left")
+
+            # --- FIBO overlay ---
+            if indicators:
+                for ind_name, (ind_data, _) in indicators.items():
+                    if ind_name.startswith("FIBO") and self.normalize:
+                        if isinstance(ind_data, pd.DataFrame):
+                            fibo_avg = self.normalize_and_average_fibo(
+                                ind_data, base_values
                             )
-            # Deduplicate legend
-            handles, labels = ax_price.get_legend_handles_labels()
-            unique = dict(zip(labels, handles))
-            ax_price.legend(unique.values(), unique.keys(), loc="upper left")
+                            for level, value in fibo_avg.items():
+                                ax_price.axhline(
+                                    y=value,
+                                    linestyle="--",
+                                    alpha=0.7,
+                                    label=f"FIBO {level}",
+                                )
+                        elif isinstance(ind_data, pd.Series):
+                            mean_base = sum(base_values.values()) / len(base_values)
+                            for level, value in ind_data.items():
+                                ax_price.axhline(
+                                    y=value / mean_base,
+                                    linestyle="--",
+                                    alpha=0.7,
+                                    label=f"FIBO {level}",
+                                )
+                # Deduplicate legend
+                handles, labels = ax_price.get_legend_handles_labels()
+                unique = dict(zip(labels, handles))
+                ax_price.legend(unique.values(), unique.keys(), loc="upper left")
 
-        # --- Moving Averages subplot ---
-        ma_plotted = False
-        if indicators:
-            for ind_name, (ind_data, _) in indicators.items():
-                if ind_name.startswith("EMA") or ind_name.startswith("SMA"):
-                    if isinstance(ind_data, pd.DataFrame):
-                        for ticker, series in price_series.items():
-                            if ticker in ind_data.columns:
-                                ma_series = ind_data[ticker].reindex(series.index)
-                                if self.normalize:
-                                    ma_series = self.normalize_series(
-                                        ma_series, base_values[ticker]
+            # --- Moving Averages subplot ---
+            ma_plotted = False
+            if indicators:
+                for ind_name, (ind_data, _) in indicators.items():
+                    if ind_name.startswith("EMA") or ind_name.startswith("SMA"):
+                        if isinstance(ind_data, pd.DataFrame):
+                            for ticker, series in price_series.items():
+                                if ticker in ind_data.columns:
+                                    ma_series = ind_data[ticker].reindex(series.index)
+                                    if self.normalize:
+                                        ma_series = self.normalize_series(
+                                            ma_series, base_values[ticker]
+                                        )
+                                    ma_series = decimate(ma_series, budget)
+                                    ax_ma.plot(
+                                        ma_series.index,
+                                        ma_series,
+                                        label=f"{ticker} {ind_name}",
+                                        linewidth=1,
                                     )
-                                ax_ma.plot(
-                                    ma_series.index,
-                                    ma_series,
-                                    label=f"{ticker} {ind_name}",
-                                    linewidth=1,
-                                )
-                                ma_plotted = True
-        if ma_plotted:
-            ax_ma.set_title("Moving Averages")
-            ax_ma.set_ylabel("MA Value" + (" (normalized)" if self.normalize else ""))
-            ax_ma.grid(True)
-            ax_ma.legend(loc="upper left")
-        else:
-            ax_ma.set_visible(False)
+                                    ma_plotted = True
+            if ma_plotted:
+                ax_ma.set_title("Moving Averages")
+                ax_ma.set_ylabel("MA Value" + (" (normalized)" if self.normalize else ""))
+                ax_ma.grid(True)
+                ax_ma.legend(loc="upper left")
+            else:
+                ax_ma.set_visible(False)
 
-        plt.tight_layout()
+        with profiler.span("tight_layout"):
+            fig.tight_layout()
         if save:
-            save_plot(fig, save_dir, save_format, save_dpi)
+            save_plot(fig, save_dir, save_format, save_dpi, interval=interval)
         else:
-            plt.show()
+            show_figure(fig)
@@ -5,8 +5,8 @@ from datetime import datetime, date
 from typing import Any, Dict, Optional, Sequence, Tuple, List
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-import matplotlib.pyplot as plt
 import pandas as pd
+from stonkzilla.cli.profiling import profiler
 
 COLOR_SCHEMES = {
     "default": {
@@ -74,19 +74,41 @@ def resolve_color_scheme(
     return scheme
 
 
+def new_figure(figsize: tuple, managed: bool = True) -> Figure:
+    """
+    Create a figure. Only managed figures are registered with pyplot (needed
+    for plt.show); unmanaged ones are freed as soon as they are dropped.
+    """
+    if managed:
+        import matplotlib.pyplot as plt
+
+        return plt.figure(figsize=figsize)
+    return Figure(figsize=figsize)
+
+
+def show_figure(fig: Figure) -> None:
+    """Show a managed figure and release it from pyplot once the window closes."""
+    import matplotlib.pyplot as plt
+
+    plt.show()
+    plt.close(fig)
+
+
 def create_indicator_subplots(
-    subplot_count: int, figsize: tuple = (12, 6), height_ratio: int = 3
+    subplot_count: int,
+    figsize: tuple = (12, 6),
+    height_ratio: int = 3,
+    managed: bool = True,
 ) -> Tuple[Figure, List[Axes]]:
     """Create number of subplots for applied indicators."""
-    fig, axes = plt.subplots(
+    fig = new_figure((figsize[0], figsize[1] + 2 * subplot_count), managed)
+    axes = fig.subplots(
         subplot_count,
         1,
-        figsize=(figsize[0], figsize[1] + 2 * subplot_count),
+        squeeze=False,
         gridspec_kw={"height_ratios": [height_ratio] + [1] * (subplot_count - 1)},
     )
-    if subplot_count == 1:
-        axes = [axes]
-    return fig, axes
+    return fig, list(axes[:, 0])
 
 
 def _plot_one_line(
@@ -436,9 +458,10 @@ def save_plot(
         components.append(start_str)
     if end_str:
         components.append(end_str)
-    if not components:
+    if not ticker:
+        # Multi-ticker plots are named by time, followed by whatever is known.
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        components.append(f"plot_{timestamp}")
+        components.insert(0, f"plot_{timestamp}")
     filename = "_".join(components) + f".{format}"
     if save_dir:
         if not os.path.exists(save_dir):
@@ -446,6 +469,7 @@ def save_plot(
         filepath = os.path.join(save_dir, filename)
     else:
         filepath = filename
-    fig.savefig(filepath, format=format, dpi=save_dpi, bbox_inches="tight")
+    with profiler.span("savefig"):
+        fig.savefig(filepath, format=format, dpi=save_dpi, bbox_inches="tight")
     print(f"Plot saved to: {os.path.abspath(filepath)}")
     return filepath
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
 import pandas as pd
 from stonkzilla.plots.plot_methods import (
@@ -14,7 +13,11 @@ from stonkzilla.plots.plot_methods import (
     analyze_indicators,
     assign_axes,
     save_plot,
+    show_figure,
 )
+from stonkzilla.cli.profiling import profiler
+from stonkzilla.plots.decimate import decimate, decimate_indicators, point_budget
+from stonkzilla.plots.figure_pool import figure_pool
 
 
 class Plotter:
@@ -28,12 +31,17 @@ class Plotter:
         color_scheme: str = "default",
         up_color: str = None,
         down_color: str = None,
+        decimate: bool = True,
+        max_points: int = None,
     ) -> None:
         """
-        Initialize the Plotter with title and color scheme.
+        Initialize the Plotter with title and color scheme. Long series are
+        decimated to max_points per line, or to the figure's pixel width.
         """
         self.title = title
         self.scheme = resolve_color_scheme(color_scheme, up_color, down_color)
+        self.decimate = decimate
+        self.max_points = max_points
 
     def plot(
         self,
@@ -58,81 +66,93 @@ class Plotter:
         indicators_info = analyze_indicators(indicators)
         subplot_count = indicators_info["subplot_count"]
 
-        fig, axes = create_indicator_subplots(subplot_count)
+        with profiler.span("figure"):
+            if save:
+                fig, axes = figure_pool.acquire(subplot_count)
+            else:
+                fig, axes = create_indicator_subplots(subplot_count)
 
-        apply_color_scheme(fig, axes, self.scheme, self.title)
-        fig.suptitle(f"{self.title} - {ticker}", color=self.scheme["text"])
+            apply_color_scheme(fig, axes, self.scheme, self.title)
+            fig.suptitle(f"{self.title} - {ticker}", color=self.scheme["text"])
 
-        ax_map = assign_axes(axes, indicators_info)
-        ax_price: Axes = ax_map["price"]
-        ax_obv: Axes = ax_map["obv"]
-        ax_macd: Axes = ax_map["macd"]
-        ax_rsi: Axes = ax_map["rsi"]
-        ax_adx: Axes = ax_map["adx"]
+            ax_map = assign_axes(axes, indicators_info)
+            ax_price: Axes = ax_map["price"]
+            ax_obv: Axes = ax_map["obv"]
+            ax_macd: Axes = ax_map["macd"]
+            ax_rsi: Axes = ax_map["rsi"]
+            ax_adx: Axes = ax_map["adx"]
 
-        ax_price.plot(
-            data.index,
-            data[column],
-            label=column,
-            color=self.scheme["up"],
-            linewidth=1.5,
-        )
-        for name, (series, _) in indicators.items():
-            if (
-                name.startswith("MACD")
-                or name.startswith("RSI")
-                or name.startswith("OBV")
-                or name.startswith("BBANDS")
-                or name.startswith("ADX")
-                or name.startswith("FIBO")
-            ):
-                continue
-            ax_price.plot(series.index, series, label=f"{name}", linewidth=1)
-        if indicators_info["has_bbands"]:
-            bbands_key = next(name for name in indicators if "BBANDS" in name)
-            bbands_data, params = indicators[bbands_key]
-            plot_bbands(ax_price, bbands_data, params, self.scheme)
-        if indicators_info["has_fibo"]:
-            fibo_key = next(name for name in indicators if name.startswith("FIBO"))
-            fibo_data, _ = indicators[fibo_key]
-            plot_fibo(ax_price, fibo_data, self.scheme)
-        ax_price.set_label("Price")
-        ax_price.legend()
-        ax_price.grid(color=self.scheme.get("grid", None))
+            dpi = save_dpi if save and save_dpi else fig.dpi
+            budget = point_budget(fig, dpi, self.decimate, self.max_points)
+            price = decimate(data[column], budget)
+            indicators = decimate_indicators(indicators, budget)
+            ax_price.plot(
+                price.index,
+                price,
+                label=column,
+                color=self.scheme["up"],
+                linewidth=1.5,
+            )
+            for name, (series, _) in indicators.items():
+                if (
+                    name.startswith("MACD")
+                    or name.startswith("RSI")
+                    or name.startswith("OBV")
+                    or name.startswith("BBANDS")
+                    or name.startswith("ADX")
+                    or name.startswith("FIBO")
+                ):
+                    continue
+                ax_price.plot(series.index, series, label=f"{name}", linewidth=1)
+            if indicators_info["has_bbands"]:
+                bbands_key = next(name for name in indicators if "BBANDS" in name)
+                bbands_data, params = indicators[bbands_key]
+                plot_bbands(ax_price, bbands_data, params, self.scheme)
+            if indicators_info["has_fibo"]:
+                fibo_key = next(name for name in indicators if name.startswith("FIBO"))
+                fibo_data, _ = indicators[fibo_key]
+                plot_fibo(ax_price, fibo_data, self.scheme)
+            ax_price.set_label("Price")
+            ax_price.legend()
+            ax_price.grid(color=self.scheme.get("grid", None))
 
-        if indicators_info["has_obv"]:
-            obv_key = next(name for name in indicators if name.startswith("OBV"))
-            obv_data, _ = indicators[obv_key]
-            plot_obv(ax_obv, obv_data, self.scheme)
+            if indicators_info["has_obv"]:
+                obv_key = next(name for name in indicators if name.startswith("OBV"))
+                obv_data, _ = indicators[obv_key]
+                plot_obv(ax_obv, obv_data, self.scheme)
 
-        if indicators_info["has_macd"]:
-            macd_key = next(name for name in indicators if "MACD" in name)
-            macd_data, _ = indicators[macd_key]
-            plot_macd(ax_macd, macd_data, self.scheme)
+            if indicators_info["has_macd"]:
+                macd_key = next(name for name in indicators if "MACD" in name)
+                macd_data, _ = indicators[macd_key]
+                plot_macd(ax_macd, macd_data, self.scheme)
 
-        if indicators_info["has_rsi"]:
-            rsi_key = next(name for name in indicators if name.startswith("RSI"))
-            rsi_data, params = indicators[rsi_key]
-            plot_rsi(ax_rsi, rsi_data, params, self.scheme)
+            if indicators_info["has_rsi"]:
+                rsi_key = next(name for name in indicators if name.startswith("RSI"))
+                rsi_data, params = indicators[rsi_key]
+                plot_rsi(ax_rsi, rsi_data, params, self.scheme)
 
-        if indicators_info["has_adx"]:
-            adx_key = next(name for name in indicators if name.startswith("ADX"))
-            adx_data, _ = indicators[adx_key]
-            plot_adx(ax_adx, adx_data, self.scheme)
+            if indicators_info["has_adx"]:
+                adx_key = next(name for name in indicators if name.startswith("ADX"))
+                adx_data, _ = indicators[adx_key]
+                plot_adx(ax_adx, adx_data, self.scheme)
 
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
+        with profiler.span("tight_layout"):
+            fig.tight_layout(rect=[0, 0, 1, 0.96])
 
         # Save plots to file
         if save:
-            save_plot(
-                fig,
-                save_dir,
-                save_format,
-                save_dpi,
-                ticker,
-                interval,
-                start_date,
-                end_date,
-            )
+            try:
+                save_plot(
+                    fig,
+                    save_dir,
+                    save_format,
+                    save_dpi,
+                    ticker,
+                    interval,
+                    start_date,
+                    end_date,
+                )
+            finally:
+                figure_pool.release(fig, axes)
         else:
-            plt.show()
+            show_figure(fig)
@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pytest
+from stonkzilla.data_sources.alphavantage import AlphavantageSource
+
+SERIES = {
+    "2024-01-03": {
+        "1. open": "2",
+        "2. high": "3",
+        "3. low": "1",
+        "4. close": "2.5",
+        "5. volume": "200",
+    },
+    "2024-01-02": {
+        "1. open": "1",
+        "2. high": "2",
+        "3. low": "0.5",
+        "4. close": "1.5",
+        "5. volume": "100",
+    },
+}
+
+
+class StubSource(AlphavantageSource):
+    """Own rate limit key and a quota that never makes the tests wait."""
+
+    RATE_LIMIT_CALLS = 1000
+    RATE_LIMIT_PERIOD = 1.0
+    RATE_LIMIT_BURST = 100
+    MAX_VALIDATORS = 3
+
+
+class Stub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}/query"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        symbol = parse_qs(urlparse(self.path).query)["symbol"][0]
+        etag = f'"{symbol}-v1"'
+        with server.lock:
+            server.requests.append((symbol, self.headers.get("If-None-Match")))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = json.dumps(
+                {"Meta Data": {"2. Symbol": symbol}, "Time Series (Daily)": SERIES}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+@pytest.fixture
+def stub():
+    server = Stub()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def source(stub):
+    src = StubSource("test-key", base_url=stub.url)
+    yield src
+    src.close()
+
+
+def test_connection_is_reused(stub, source):
+    for symbol in ("AAA", "BBB", "CCC"):
+        data = source.fetch_data(symbol, "2024-01-01", "2024-01-05", "1d")
+        assert list(data["Close"]) == [1.5, 2.5]
+    assert len(stub.requests) == 3
+    assert stub.connections == 1
+
+
+def test_not_modified_reuses_cached_body(stub, source):
+    first = source.fetch_data("AAA", "2024-01-01", "2024-01-05", "1d")
+    second = source.fetch_data("AAA", "2024-01-01", "2024-01-05", "1d")
+    assert stub.requests == [("AAA", None), ("AAA", '"AAA-v1"')]
+    assert second.equals(first)
+
+
+def test_validators_are_bounded(source):
+    for symbol in ("AAA", "BBB", "CCC", "DDD", "EEE"):
+        source.fetch_data(symbol, "2024-01-01", "2024-01-05", "1d")
+    assert len(source._validators) == StubSource.MAX_VALIDATORS
+    symbols = [dict(key)["symbol"] for key in source._validators]
+    assert symbols == ["CCC", "DDD", "EEE"]
+
+
+def test_fetch_many_fans_out(stub, source):
+    stub.delay = 0.2
+    tickers = [f"T{i}" for i in range(8)]
+    results = source.fetch_many(tickers, "2024-01-01", "2024-01-05", "1d")
+    assert list(results) == tickers
+    assert all(list(data["Close"]) == [1.5, 2.5] for data in results.values())
+    assert 1 < stub.max_in_flight <= StubSource.MAX_IN_FLIGHT
+    assert stub.connections <= StubSource.MAX_IN_FLIGHT
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+from yfinance.exceptions import YFPricesMissingError
+from stonkzilla.cli.exceptions import DataSourceError, NoDataError
+from stonkzilla.data_sources import yfinance as yfinance_source
+from stonkzilla.data_sources.base_source import BaseSource
+from stonkzilla.data_sources.cache import CachedSource, OHLCVCache
+
+FIRST_TRADE = "2020-01-06"
+
+
+class FakeSource(BaseSource):
+    """Business-day bars from FIRST_TRADE on; raises NoDataError like yfinance."""
+
+    RATE_LIMIT_CALLS = 1000
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def fetch_data(self, ticker, start_date, end_date, interval):
+        self.calls.append((ticker, start_date, end_date))
+        index = pd.date_range(FIRST_TRADE, "2020-03-31", freq="B")
+        data = pd.DataFrame(
+            {"Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 1.0},
+            index=index,
+        )
+        data = data[(data.index >= start_date) & (data.index < end_date)]
+        if data.empty:
+            raise NoDataError(f"No data returned for ticker {ticker}")
+        return data
+
+
+@pytest.fixture
+def cached(tmp_path):
+    source = FakeSource()
+    return source, CachedSource(source, OHLCVCache(str(tmp_path)))
+
+
+def test_empty_first_fetch_is_not_cached(cached):
+    source, cache = cached
+    for _ in range(2):
+        with pytest.raises(DataSourceError):
+            cache.fetch_data("IBM", "2019-01-01", "2019-02-01", "1d")
+    assert len(source.calls) == 2
+
+
+@pytest.mark.parametrize("method", ["fetch_data", "fetch_many"])
+def test_empty_leading_gap_is_remembered(cached, method):
+    source, cache = cached
+
+    def fetch(start, end):
+        if method == "fetch_data":
+            return cache.fetch_data("IBM", start, end, "1d")
+        return cache.fetch_many(["IBM"], start, end, "1d")["IBM"]
+
+    fetch(FIRST_TRADE, "2020-03-02")
+    calls = len(source.calls)
+    # The start date lies before the first trade: the leading gap has no bars.
+    for _ in range(2):
+        data = fetch("2019-12-01", "2020-03-02")
+    assert len(source.calls) == calls + 1
+    assert data.index[0] == pd.Timestamp(FIRST_TRADE)
+
+
+def test_yfinance_missing_prices_raise_no_data(monkeypatch):
+    class Ticker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def history(self, **kwargs):
+            raise YFPricesMissingError(self.symbol, "no price data found")
+
+    monkeypatch.setattr(yfinance_source.yf, "Ticker", Ticker)
+    source = yfinance_source.YfinanceSource()
+    with pytest.raises(NoDataError):
+        source.fetch_data("IBM", "2019-01-01", "2019-02-01", "1d")
+    empty = source.fetch_many(["IBM"], "2019-01-01", "2019-02-01", "1d")["IBM"]
+    assert empty.empty and not empty.columns.empty
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from stonkzilla.plots.decimate import decimate, decimate_indicators
+
+BARS = 10_000
+MAX_POINTS = 1_000
+
+
+def test_series_keeps_spikes_and_ends():
+    index = pd.date_range("2020", periods=BARS, freq="min")
+    values = pd.Series(np.zeros(BARS), index=index)
+    values.iloc[1234] = 5.0
+    values.iloc[4321] = -5.0
+    result = decimate(values, MAX_POINTS)
+    assert len(result) <= MAX_POINTS + 2
+    assert result.max() == 5.0 and result.min() == -5.0
+    assert result.index[0] == values.index[0] and result.index[-1] == values.index[-1]
+
+
+def test_macd_histogram_peak_survives():
+    index = pd.date_range("2020", periods=BARS, freq="min")
+    macd = np.linspace(0, 1000, BARS)
+    histogram = np.zeros(BARS)
+    # Mid-bucket, where neither line has an extreme of its own.
+    peak = 5010
+    histogram[peak] = 0.5
+    frame = pd.DataFrame({"MACD": macd, "Signal": macd - histogram}, index=index)
+    indicators = {"MACD_12_26_9": (frame, [12, 26, 9])}
+    (result, params), = decimate_indicators(indicators, MAX_POINTS).values()
+    assert params == [12, 26, 9]
+    assert list(result.columns) == ["MACD", "Signal"]
+    assert index[peak] in result.index
+    assert (result["MACD"] - result["Signal"]).max() == 0.5
@@ -0,0 +1,117 @@
+import json
+import math
+import numpy as np
+import pandas as pd
+import pytest
+from stonkzilla.indicators.adx import ADX
+from stonkzilla.indicators.bbands import BBANDS
+from stonkzilla.indicators.ema import EMA
+from stonkzilla.indicators.incremental import new_window, window_push, window_std
+from stonkzilla.indicators.macd import MACD
+from stonkzilla.indicators.obv import OBV
+from stonkzilla.indicators.rsi import RSI
+from stonkzilla.indicators.sma import SMA
+
+INDICATORS = {
+    "EMA": lambda: EMA(10),
+    "SMA": lambda: SMA(10),
+    "RSI": lambda: RSI(14),
+    "MACD": lambda: MACD(12, 26, 9),
+    "BBANDS": lambda: BBANDS(20, 2),
+    "OBV": lambda: OBV(),
+    "ADX": lambda: ADX(14),
+}
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    count = 400
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = rng.random(count)
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + spread,
+            "Low": np.minimum(open_, close) - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000, 100_000, count).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=count, freq="h"),
+    )
+
+
+def _columns(result: pd.Series | pd.DataFrame) -> dict[str, np.ndarray]:
+    if isinstance(result, pd.Series):
+        return {None: result.to_numpy()}
+    return {column: result[column].to_numpy() for column in result.columns}
+
+
+def _assert_value(expected: dict[str, np.ndarray], row: int, value) -> None:
+    if not isinstance(value, dict):
+        value = {None: value}
+    assert value.keys() == expected.keys()
+    for key, column in expected.items():
+        np.testing.assert_allclose(value[key], column[row], rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("name", INDICATORS)
+def test_update_matches_calculate(name, bars):
+    expected = _columns(INDICATORS[name]().calculate(bars))
+    indicator = INDICATORS[name]()
+    for row, bar in enumerate(bars.to_dict("records")):
+        _assert_value(expected, row, indicator.update(bar))
+
+
+@pytest.mark.parametrize("name", INDICATORS)
+def test_warm_up_then_update(name, bars):
+    expected = _columns(INDICATORS[name]().calculate(bars))
+    indicator = INDICATORS[name]()
+    split = 250
+    _assert_value(expected, split - 1, indicator.warm_up(bars.iloc[:split]))
+    for row, bar in enumerate(bars.iloc[split:].to_dict("records"), start=split):
+        _assert_value(expected, row, indicator.update(bar))
+
+
+@pytest.mark.parametrize("name", INDICATORS)
+def test_state_round_trip(name, bars):
+    split = 200
+    indicator = INDICATORS[name]()
+    indicator.warm_up(bars.iloc[:split])
+    # The state must survive serialization, as a watch session checkpoint does.
+    state = json.loads(json.dumps(indicator.get_state()))
+
+    resumed = INDICATORS[name]()
+    resumed.set_state(state)
+    for bar in bars.iloc[split:].to_dict("records"):
+        a, b = indicator.update(bar), resumed.update(bar)
+        np.testing.assert_equal(a, b)
+
+
+@pytest.mark.parametrize("name", INDICATORS)
+def test_replay_revised_last_bar(name, bars):
+    """A revised last bar replayed from the checkpoint, as Watcher._apply does."""
+    revised = bars.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] += 3.0
+    revised.iloc[-1, revised.columns.get_loc("High")] += 3.0
+    revised.iloc[-1, revised.columns.get_loc("Volume")] *= 2
+    expected = _columns(INDICATORS[name]().calculate(revised))
+
+    indicator = INDICATORS[name]()
+    indicator.warm_up(bars.iloc[:-1])
+    checkpoint = indicator.get_state()
+    indicator.update(bars.iloc[-1].to_dict())
+    indicator.set_state(checkpoint)
+    _assert_value(expected, len(bars) - 1, indicator.update(revised.iloc[-1].to_dict()))
+
+
+def test_window_sums_do_not_drift():
+    rng = np.random.default_rng(3)
+    values = 1e6 + rng.normal(0, 1e-3, 50_000)
+    window = new_window(20)
+    for value in values:
+        window_push(window, float(value))
+    tail = values[-20:]
+    assert window["total"] == pytest.approx(math.fsum(tail), rel=1e-15)
+    assert window_std(window) == pytest.approx(np.std(tail, ddof=1), rel=1e-6)
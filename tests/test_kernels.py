@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+from stonkzilla.cli.services import build_indicators
+from stonkzilla.data_sources.ohlcv_frame import OHLCVFrame
+from stonkzilla.indicators import kernels
+from stonkzilla.indicators.engine import IndicatorEngine
+
+RTOL = 1e-9
+ATOL = 1e-9
+
+
+def random_walk(bars: int = 300, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, bars))
+    spread = rng.random(bars)
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100, 10_000, bars).astype(np.float64),
+        },
+        index=pd.date_range("2024-01-02", periods=bars, freq="h"),
+    )
+
+
+def with_gaps(data: pd.DataFrame) -> pd.DataFrame:
+    """Missing bars at the start, in the middle and a missing volume."""
+    data = data.copy()
+    data.iloc[:3] = np.nan
+    data.iloc[150:153] = np.nan
+    data.iloc[200, data.columns.get_loc("Volume")] = np.nan
+    return data
+
+
+def pandas_reference(data: pd.DataFrame) -> dict[str, np.ndarray]:
+    high, low, close, volume = (data[c] for c in ("High", "Low", "Close", "Volume"))
+    prev_close = close.shift(1)
+    tr = np.fmax(high - low, np.fmax((high - prev_close).abs(), (low - prev_close).abs()))
+    tr.iloc[0] = high.iloc[0] - low.iloc[0]
+    up, down = high.diff(), low.diff()
+    return {
+        "ema": close.ewm(span=26, adjust=False).mean().to_numpy(),
+        "ema_min_periods": close.ewm(span=26, adjust=False, min_periods=26)
+        .mean()
+        .to_numpy(),
+        "wilder": close.ewm(alpha=1 / 14, adjust=False).mean().to_numpy(),
+        "true_range": tr.to_numpy(),
+        "plus_dm": np.where((up > down) & (up > 0), up, 0.0),
+        "minus_dm": np.where((down > up) & (down > 0), down, 0.0),
+        "obv": (np.sign(close.diff()).fillna(0) * volume).cumsum().to_numpy(),
+    }
+
+
+def kernel_results(data: pd.DataFrame, backend: str) -> dict[str, np.ndarray]:
+    high, low, close, volume = (
+        data[c].to_numpy(dtype=np.float64) for c in ("High", "Low", "Close", "Volume")
+    )
+    return {
+        "ema": kernels.ewm_mean(backend, close, 2 / 27),
+        "ema_min_periods": kernels.ewm_mean(backend, close, 2 / 27, 26),
+        "wilder": kernels.ewm_mean(backend, close, 1 / 14),
+        "true_range": kernels.run_kernel(backend, "true_range", high, low, close),
+        "plus_dm": kernels.run_kernel(backend, "plus_dm", high, low),
+        "minus_dm": kernels.run_kernel(backend, "minus_dm", high, low),
+        "obv": kernels.run_kernel(backend, "obv", close, volume),
+    }
+
+
+def engine_results(data: pd.DataFrame, backend: str, specs: list) -> list:
+    indicators = [indicator for _, _, indicator in build_indicators(specs, "Close")]
+    frame = OHLCVFrame.from_pandas(data)
+    return IndicatorEngine(frame, backend).run(indicators)
+
+
+SPECS = [
+    ("EMA", [10]),
+    ("SMA", [20]),
+    ("RSI", [14]),
+    ("MACD", [12, 26, 9]),
+    ("BBANDS", [20, 2]),
+    ("ADX", [14]),
+    ("OBV", []),
+]
+
+
+@pytest.mark.parametrize("backend", [b for b in kernels.BACKENDS if b != "pandas"])
+def test_kernels_match_pandas(backend):
+    backend = kernels.resolve_backend(backend)
+    data = random_walk()
+    expected = pandas_reference(data)
+    for name, result in kernel_results(data, backend).items():
+        np.testing.assert_allclose(
+            result, expected[name], rtol=RTOL, atol=ATOL, err_msg=name
+        )
+
+
+@pytest.mark.parametrize("backend", kernels.BACKENDS)
+@pytest.mark.parametrize("gaps", [False, True], ids=["clean", "nan"])
+def test_engine_matches_pandas_backend(backend, gaps):
+    data = random_walk()
+    if gaps:
+        data = with_gaps(data)
+    backend = kernels.resolve_backend(backend)
+    expected = engine_results(data, "pandas", SPECS)
+    results = engine_results(data, backend, SPECS)
+    for (name, _), result, reference in zip(SPECS, results, expected):
+        np.testing.assert_allclose(
+            np.asarray(result, float),
+            np.asarray(reference, float),
+            rtol=RTOL,
+            atol=ATOL,
+            err_msg=name,
+        )
+
+
+@pytest.mark.parametrize("gaps", [False, True], ids=["clean", "nan"])
+def test_engine_matches_calculate(gaps):
+    data = random_walk()
+    if gaps:
+        data = with_gaps(data)
+    indicators = [indicator for _, _, indicator in build_indicators(SPECS, "Close")]
+    results = engine_results(data, "pandas", SPECS)
+    for (name, _), indicator, result in zip(SPECS, indicators, results):
+        np.testing.assert_allclose(
+            np.asarray(result, float),
+            np.asarray(indicator.calculate(data), float),
+            rtol=RTOL,
+            atol=ATOL,
+            err_msg=name,
+        )
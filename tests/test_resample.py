@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from stonkzilla.data_sources.resample import AGGREGATIONS, resample_ohlcv
+
+
+def five_minute_bars(unit: str) -> pd.DataFrame:
+    """Three sessions of 5m bars from 09:30 to 16:00."""
+    sessions = pd.date_range("2024-01-02", periods=3, freq="B")
+    index = pd.DatetimeIndex(
+        [
+            day + pd.Timedelta(hours=9, minutes=30) + pd.Timedelta(minutes=5 * i)
+            for day in sessions
+            for i in range(78)
+        ],
+        name="Datetime",
+    ).as_unit(unit)
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=len(index)))
+    return pd.DataFrame(
+        {
+            "Open": close - 0.1,
+            "High": close + 0.5,
+            "Low": close - 0.5,
+            "Close": close,
+            "Volume": rng.integers(1, 1000, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("unit", ["ns", "us", "ms"])
+def test_hourly_bins_follow_the_session_open(unit):
+    data = five_minute_bars(unit)
+    result = resample_ohlcv(data, "1h")
+    expected = (
+        five_minute_bars("ns")
+        .resample("60min", offset="30min")
+        .agg({column: AGGREGATIONS[column] for column in data.columns})
+        .dropna()
+    )
+    assert result.index.unit == unit
+    assert len(result) == 3 * 7
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+    assert (result.index.as_unit("ns") == expected.index).all()
+
+
+@pytest.mark.parametrize("unit", ["ns", "us"])
+def test_daily_bins(unit):
+    data = five_minute_bars(unit)
+    result = resample_ohlcv(data, "1d")
+    assert list(result.index.as_unit("ns")) == list(
+        pd.date_range("2024-01-02", periods=3, freq="B")
+    )
+    daily = data.groupby(data.index.normalize())
+    np.testing.assert_allclose(result["Volume"], daily["Volume"].sum())
+    np.testing.assert_allclose(result["High"], daily["High"].max())
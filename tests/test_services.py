@@ -0,0 +1,41 @@
+import pandas as pd
+from stonkzilla.cli import services
+
+
+class FlakySource:
+    """One ticker per batch; BROKEN fails with a non-DataSourceError."""
+
+    BATCH_SIZE = 1
+
+    def fetch_many(self, tickers, start_date, end_date, interval):
+        if tickers == ["BROKEN"]:
+            raise OSError("disk full while writing the cache")
+        index = pd.date_range(start_date, end_date, freq="D")
+        return {t: pd.DataFrame({"Close": 1.0}, index=index) for t in tickers}
+
+
+def test_failing_batch_does_not_cancel_the_others(monkeypatch):
+    monkeypatch.setattr(services, "get_source", lambda *args: FlakySource())
+    results = dict(
+        services.iter_fetch_data(
+            ["AAA", "BROKEN", "BBB"], "2024-01-01", "2024-01-05", "1d", "yfinance"
+        )
+    )
+    assert results["BROKEN"].empty
+    assert len(results["AAA"]) == len(results["BBB"]) == 5
+
+
+def test_multi_ticker_indicators_only_compute_what_is_drawn():
+    index = pd.date_range("2024-01-01", periods=60, freq="D")
+    ticker_data = {
+        ticker: pd.DataFrame({"Close": range(start, start + 60)}, index=index)
+        for ticker, start in (("AAA", 10), ("BBB", 50))
+    }
+    indicators = [("EMA", [5]), ("RSI", [14]), ("MACD", [12, 26, 9]), ("BBANDS", [20, 2])]
+    result = services.run_multi_ticker_indicators(ticker_data, indicators)
+    assert list(result) == ["EMA_5"]
+    ema, params = result["EMA_5"]
+    assert params == [5]
+    for ticker, data in ticker_data.items():
+        expected = data["Close"].astype(float).ewm(span=5, adjust=False).mean()
+        pd.testing.assert_series_equal(ema[ticker], expected, check_names=False)